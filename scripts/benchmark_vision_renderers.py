@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.shaded_render import render_shaded_views
+
+
+def _benchmark_hlr(step_path: Path, workspace: Path) -> dict:
+    try:
+        from server.cad_service_occ import CADServiceOCC
+    except Exception as exc:  # pythonocc-core is optional
+        return {"error": f"OCC unavailable: {exc.__class__.__name__}: {exc}"}
+
+    service = CADServiceOCC(workspace / "occ")
+    # Bypass the segment cache so the numbers reflect a cold HLR run.
+    service._hlr_cache.root = workspace / "occ" / f"hlr_cache_{time.time_ns()}"
+    started = time.perf_counter()
+    _, timings = service.generate_occ_views_with_timings(step_path, workspace / "hlr", upgrade_exact=False)
+    return {"total_sec": round(time.perf_counter() - started, 4), "views": timings}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time shaded (NumPy z-buffer) against HLR vision view rendering for stored models."
+    )
+    parser.add_argument("model_dirs", nargs="+", type=Path, help="server/data/models/<model_id> directories")
+    parser.add_argument("--skip-hlr", action="store_true", help="Only time the shaded renderer.")
+    args = parser.parse_args()
+
+    for model_dir in args.model_dirs:
+        entry: dict = {"model_dir": str(model_dir)}
+        with tempfile.TemporaryDirectory() as tmp:
+            workspace = Path(tmp)
+            _, entry["shaded"] = render_shaded_views(model_dir / "preview.glb", workspace / "shaded")
+            if not args.skip_hlr:
+                entry["hlr"] = _benchmark_hlr(model_dir / "source.step", workspace)
+        print(json.dumps(entry), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.wall_thickness import min_opposed_plane_gap
+
+
+def _pairwise(planes):
+    best = None
+    for idx, (n1, d1) in enumerate(planes):
+        for n2, d2 in planes[idx + 1 :]:
+            dot = n1[0] * n2[0] + n1[1] * n2[1] + n1[2] * n2[2]
+            if dot > -0.97:
+                continue
+            candidate = abs(d1 - d2)
+            if not math.isfinite(candidate) or candidate <= 1e-4:
+                continue
+            if best is None or candidate < best:
+                best = candidate
+    return best
+
+
+def prismatic_planes(face_count: int, *, seed: int = 0, tilted_fraction: float = 0.02):
+    """Plane equations of a pocketed block: mostly axis-aligned faces, a few drafted walls."""
+    rng = np.random.default_rng(seed)
+    axes = [(1.0, 0.0, 0.0), (-1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, -1.0, 0.0), (0.0, 0.0, 1.0), (0.0, 0.0, -1.0)]
+    planes = []
+    for _ in range(face_count):
+        if rng.random() < tilted_fraction:
+            normal = rng.normal(size=3)
+            normal = tuple(float(v) for v in normal / np.linalg.norm(normal))
+        else:
+            normal = axes[int(rng.integers(len(axes)))]
+        planes.append((normal, float(np.round(rng.uniform(-200.0, 200.0), 3))))
+    return planes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time grouped vs pairwise minimum wall thickness estimation.")
+    parser.add_argument("--faces", type=int, nargs="+", default=[500, 2000, 8000, 32000])
+    parser.add_argument(
+        "--pairwise-max", type=int, default=8000, help="Skip the quadratic reference above this many faces."
+    )
+    args = parser.parse_args()
+
+    for face_count in args.faces:
+        planes = prismatic_planes(face_count)
+        started = time.perf_counter()
+        result = min_opposed_plane_gap(planes)
+        entry = {"faces": face_count, "grouped_sec": round(time.perf_counter() - started, 4), "min_gap_mm": result}
+        if face_count <= args.pairwise_max:
+            started = time.perf_counter()
+            reference = _pairwise(planes)
+            entry["pairwise_sec"] = round(time.perf_counter() - started, 4)
+            entry["identical"] = reference == result
+        print(json.dumps(entry), flush=True)
+
+
+if __name__ == "__main__":
+    main()
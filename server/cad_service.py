@@ -17,19 +17,19 @@ import re
 import numpy as np
 import trimesh
 
-import matplotlib
-
-# Force a headless friendly backend before pyplot is imported.
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection
-
 from .freecad_setup import ensure_freecad_in_path
+from .line_raster import normalize_segments, polylines_to_segments, render_segments_png
+from .line_svg import render_segments_svg, svg_path_for
+from .view_metadata import write_view_metadata
 
 ensure_freecad_in_path()
 
 logger = logging.getLogger(__name__)
 
+# Stroke per view family; also recorded in view metadata so tiles match the PNG.
+PROJECTION_STYLE = {"color": "#102542", "linewidth_pt": 0.6}
+SHAPE2D_STYLE = {"color": "#0f223a", "linewidth_pt": 0.7}
+
 
 class CADProcessingError(RuntimeError):
     """Raised when the FreeCAD pipeline fails."""
@@ -214,74 +214,59 @@ class CADService:
         normalized = (projected - min_vals) / span
         return normalized, min_vals, max_vals
 
-    def _render_projection(self, projected: np.ndarray, triangles: np.ndarray, out_path: Path) -> None:
-        """Create a blueprint style PNG from projected wireframe data."""
-        fig, ax = plt.subplots(figsize=(5, 5), dpi=300)
-        lines = []
-        for tri in triangles:
-            tri_pts = projected[tri]
-            lines.append([tri_pts[0], tri_pts[1]])
-            lines.append([tri_pts[1], tri_pts[2]])
-            lines.append([tri_pts[2], tri_pts[0]])
-
-        collection = LineCollection(lines, colors="#102542", linewidths=0.6)
-        ax.add_collection(collection)
-        ax.set_aspect("equal", "box")
-        ax.axis("off")
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        fig.tight_layout(pad=0)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(out_path, transparent=True, bbox_inches="tight", pad_inches=0)
-        plt.close(fig)
-
-    def _collect_edges(self, triangles: np.ndarray) -> List[Tuple[int, int]]:
-        edges = set()
-        for a, b, c in triangles:
-            edges.add(tuple(sorted((int(a), int(b)))))
-            edges.add(tuple(sorted((int(b), int(c)))))
-            edges.add(tuple(sorted((int(c), int(a)))))
-        return sorted(edges)
-
-    def _render_shape2d(self, shape, out_path: Path) -> None:
-        """
-        Render a 2D Draft/Shape2DView result to PNG by discretizing all edges.
+    def _render_projection(self, projected: np.ndarray, edges: np.ndarray, out_path: Path) -> None:
+        """Create a blueprint style PNG (and SVG twin) from projected wireframe data."""
+        segments = projected[edges] if len(edges) else np.zeros((0, 2, 2), dtype=np.float64)
+        render_segments_png(segments, out_path, **PROJECTION_STYLE)
+        render_segments_svg(segments, svg_path_for(out_path), **PROJECTION_STYLE)
+
+    def _collect_edges(self, triangles: np.ndarray) -> np.ndarray:
         """
-        segments: List[List[List[float]]] = []
-        all_points: List[List[float]] = []
-
-        for edge in getattr(shape, "Edges", []):
-            pts = edge.discretize(50)
-            for a, b in zip(pts, pts[1:]):
-                pair = [[a.x, a.y], [b.x, b.y]]
-                segments.append(pair)
-                all_points.extend(pair)
-
-        if not all_points:  # nothing to draw
-            return
-
-        coords = np.array(all_points, dtype=np.float64)
-        min_vals = coords.min(axis=0)
-        max_vals = coords.max(axis=0)
-        span = np.clip(max_vals - min_vals, 1e-5, None)
+        Return the unique undirected mesh edges as a sorted ``(E, 2)`` index array.
 
-        norm_segments = []
-        for a, b in segments:
-            a_norm = (np.array(a) - min_vals) / span
-            b_norm = (np.array(b) - min_vals) / span
-            norm_segments.append([a_norm, b_norm])
-
-        fig, ax = plt.subplots(figsize=(5, 5), dpi=300)
-        collection = LineCollection(norm_segments, colors="#0f223a", linewidths=0.7)
-        ax.add_collection(collection)
-        ax.set_aspect("equal", "box")
-        ax.axis("off")
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        fig.tight_layout(pad=0)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(out_path, transparent=True, bbox_inches="tight", pad_inches=0)
-        plt.close(fig)
+        Each edge is packed into a single int64 key so the deduplication is one 1D
+        ``np.unique`` instead of a Python set of tuples.
+        """
+        tri = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        if tri.shape[0] == 0:
+            return np.zeros((0, 2), dtype=np.int64)
+        pairs = np.concatenate([tri[:, [0, 1]], tri[:, [1, 2]], tri[:, [2, 0]]], axis=0)
+        pairs.sort(axis=1)
+        stride = int(tri.max()) + 1
+        keys = np.unique(pairs[:, 0] * stride + pairs[:, 1])
+        return np.stack([keys // stride, keys % stride], axis=1)
+
+    def _shape2d_segments(self, shape) -> np.ndarray:
+        """Discretize every edge of a 2D shape once into a contiguous ``(N, 2, 2)`` array."""
+        polylines = [
+            np.array([(point.x, point.y) for point in edge.discretize(50)], dtype=np.float64)
+            for edge in getattr(shape, "Edges", [])
+        ]
+        return polylines_to_segments(polylines)
+
+    def _render_shape2d(self, norm_segments: np.ndarray, out_path: Path) -> None:
+        """Render normalized Draft/Shape2DView segments to PNG and SVG."""
+        render_segments_png(norm_segments, out_path, **SHAPE2D_STYLE)
+        render_segments_svg(norm_segments, svg_path_for(out_path), **SHAPE2D_STYLE)
+
+    def _write_shape2d_view(self, shape, out_path: Path, meta_path: Path, meta_fields: Dict) -> Path | None:
+        """
+        Discretize a Shape2DView once and feed the same normalized segments to
+        the renderer and the metadata writer. Returns ``None`` for empty views.
+        """
+        segments = self._shape2d_segments(shape)
+        if segments.shape[0] == 0:  # nothing to draw
+            return None
+        norm_segments, min_vals, max_vals = normalize_segments(segments)
+        self._render_shape2d(norm_segments, out_path)
+        meta_payload = {
+            **meta_fields,
+            "bounds": {"min": min_vals.tolist(), "max": max_vals.tolist()},
+            "style": SHAPE2D_STYLE,
+            "segments": norm_segments,
+        }
+        write_view_metadata(meta_path, meta_payload)
+        return meta_path
 
     # ------------------------------------------------------------------ public API
     def import_model(self, step_path: Path, gltf_path: Path, model_name_hint: str | None = None) -> ImportResult:
@@ -383,25 +368,28 @@ class CADService:
             except Exception:  # pragma: no cover
                 pass
 
+        # Edges only depend on the mesh topology, so every projection shares them.
+        edges = self._collect_edges(triangles)
+
         results: Dict[str, Path] = {}
         meta: Dict[str, Path] = {}
         for key, config in self._projection_table.items():
             projected, min_vals, max_vals = self._project_points(points, config.axis_pair, config.invert_x, config.invert_y)
             out_path = output_dir / f"{key}.png"
-            self._render_projection(projected, triangles, out_path)
+            self._render_projection(projected, edges, out_path)
             results[key] = out_path
-            edges = self._collect_edges(triangles)
             meta_payload = {
                 "type": "orthographic",
                 "axis_pair": config.axis_pair,
                 "invert_x": config.invert_x,
                 "invert_y": config.invert_y,
                 "bounds": {"min": min_vals.tolist(), "max": max_vals.tolist()},
-                "projected_vertices": projected.tolist(),
+                "style": PROJECTION_STYLE,
+                "projected_vertices": projected,
                 "edges": edges,
             }
             meta_path = output_dir / f"{key}.json"
-            meta_path.write_text(json.dumps(meta_payload, indent=2), encoding="utf-8")
+            write_view_metadata(meta_path, meta_payload)
             meta[key] = meta_path
         return results, meta
 
@@ -436,35 +424,14 @@ class CADService:
                 view_obj = Draft.makeShape2DView(obj, direction)
                 doc.recompute()
                 out_path = output_dir / f"{name}.png"
-                self._render_shape2d(view_obj.Shape, out_path)
                 results[name] = out_path
-                # collect normalized segments by recomputing discretization similar to _render_shape2d
-                segments: List[List[List[float]]] = []
-                all_points: List[List[float]] = []
-                for edge in getattr(view_obj.Shape, "Edges", []):
-                    pts = edge.discretize(50)
-                    for a, b in zip(pts, pts[1:]):
-                        pair = [[a.x, a.y], [b.x, b.y]]
-                        segments.append(pair)
-                        all_points.extend(pair)
-                if all_points:
-                    coords = np.array(all_points, dtype=np.float64)
-                    min_vals = coords.min(axis=0)
-                    max_vals = coords.max(axis=0)
-                    span = np.clip(max_vals - min_vals, 1e-5, None)
-                    norm_segments = []
-                    for a, b in segments:
-                        a_norm = (np.array(a) - min_vals) / span
-                        b_norm = (np.array(b) - min_vals) / span
-                        norm_segments.append([a_norm.tolist(), b_norm.tolist()])
-                    meta_payload = {
-                        "type": "shape2d",
-                        "direction": [direction.x, direction.y, direction.z],
-                        "bounds": {"min": min_vals.tolist(), "max": max_vals.tolist()},
-                        "segments": norm_segments,
-                    }
-                    meta_path = output_dir / f"{name}.json"
-                    meta_path.write_text(json.dumps(meta_payload, indent=2), encoding="utf-8")
+                meta_path = self._write_shape2d_view(
+                    view_obj.Shape,
+                    out_path,
+                    output_dir / f"{name}.json",
+                    {"type": "shape2d", "direction": [direction.x, direction.y, direction.z]},
+                )
+                if meta_path is not None:
                     meta[name] = meta_path
                 doc.removeObject(view_obj.Name)
         finally:
@@ -498,34 +465,14 @@ class CADService:
             view_obj = Draft.makeShape2DView(obj, iso_direction)
             doc.recompute()
             out_path = output_dir / "isometric_shape2d.png"
-            self._render_shape2d(view_obj.Shape, out_path)
             results["isometric_shape2d"] = out_path
-            segments: List[List[List[float]]] = []
-            all_points: List[List[float]] = []
-            for edge in getattr(view_obj.Shape, "Edges", []):
-                pts = edge.discretize(50)
-                for a, b in zip(pts, pts[1:]):
-                    pair = [[a.x, a.y], [b.x, b.y]]
-                    segments.append(pair)
-                    all_points.extend(pair)
-            if all_points:
-                coords = np.array(all_points, dtype=np.float64)
-                min_vals = coords.min(axis=0)
-                max_vals = coords.max(axis=0)
-                span = np.clip(max_vals - min_vals, 1e-5, None)
-                norm_segments = []
-                for a, b in segments:
-                    a_norm = (np.array(a) - min_vals) / span
-                    b_norm = (np.array(b) - min_vals) / span
-                    norm_segments.append([a_norm.tolist(), b_norm.tolist()])
-                meta_payload = {
-                    "type": "shape2d_isometric",
-                    "direction": [iso_direction.x, iso_direction.y, iso_direction.z],
-                    "bounds": {"min": min_vals.tolist(), "max": max_vals.tolist()},
-                    "segments": norm_segments,
-                }
-                meta_path = output_dir / "isometric_shape2d.json"
-                meta_path.write_text(json.dumps(meta_payload, indent=2), encoding="utf-8")
+            meta_path = self._write_shape2d_view(
+                view_obj.Shape,
+                out_path,
+                output_dir / "isometric_shape2d.json",
+                {"type": "shape2d_isometric", "direction": [iso_direction.x, iso_direction.y, iso_direction.z]},
+            )
+            if meta_path is not None:
                 meta["isometric_shape2d"] = meta_path
             doc.removeObject(view_obj.Name)
         finally:
@@ -570,19 +517,21 @@ class CADService:
         span = np.clip(max_vals - min_vals, 1e-5, None)
         normalized = (projected - min_vals) / span
 
+        edges = self._collect_edges(triangles)
         out_path = output_dir / "isometric_matplotlib.png"
-        self._render_projection(normalized, triangles, out_path)
+        self._render_projection(normalized, edges, out_path)
         
         results: Dict[str, Path] = {}
         results["isometric_matplotlib"] = out_path
         meta_payload = {
             "type": "isometric_matplotlib",
             "bounds": {"min": min_vals.tolist(), "max": max_vals.tolist()},
-            "projected_vertices": normalized.tolist(),
-            "edges": [[int(a), int(b)] for a, b in self._collect_edges(triangles)],
+            "style": PROJECTION_STYLE,
+            "projected_vertices": normalized,
+            "edges": edges,
         }
         meta_path = output_dir / "isometric_matplotlib.json"
-        meta_path.write_text(json.dumps(meta_payload, indent=2), encoding="utf-8")
+        write_view_metadata(meta_path, meta_payload)
         meta: Dict[str, Path] = {"isometric_matplotlib": meta_path}
         return results, meta
 
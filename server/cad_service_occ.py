@@ -3,20 +3,36 @@ OCC-based view generation for plan projections using pythonocc-core.
 
 Generates X/Y/Z plane views with OCC's hidden-line removal (HLR) to avoid mesh
 artifacts. Visible edges are projected onto view planes and rasterized.
+
+The per-direction HLR passes are independent, so they run concurrently in
+worker processes. The shape is written once as a BREP file that every worker
+loads (and keeps cached) before projecting its direction.
+
+``quality="fast"`` swaps the exact ``HLRBRep_Algo`` for the polygonal
+``HLRBRep_PolyAlgo`` over the shape's triangulation for quick previews, and can
+queue the exact pass in a background thread that replaces the images in place
+once it finishes. Each output directory carries a ``views_status.json`` with
+the published quality and the state of that upgrade.
+
+Projected segments are cached per (STEP content hash, component, direction,
+quality) in ``hlr_cache``; rendering is a separate stage on top of them, so a
+repeat or restyled request never reruns HLR.
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
+from uuid import uuid4
 import logging
+import math
+import os
 import re
+import time
 
 import numpy as np
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-from matplotlib.collections import LineCollection
 
 from .freecad_setup import ensure_freecad_in_path
 
@@ -24,34 +40,103 @@ ensure_freecad_in_path()
 
 from OCC.Core.STEPControl import STEPControl_Reader
 from OCC.Core.IFSelect import IFSelect_RetDone
-from OCC.Core.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape
+from OCC.Core.HLRBRep import HLRBRep_Algo, HLRBRep_HLRToShape, HLRBRep_PolyAlgo, HLRBRep_PolyHLRToShape
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
 from OCC.Core.HLRAlgo import HLRAlgo_Projector
 from OCC.Core.gp import gp_Ax2, gp_Dir, gp_Pln, gp_Pnt
 from OCC.Core.TopExp import TopExp_Explorer
 from OCC.Core.TopAbs import TopAbs_EDGE, TopAbs_SOLID
 from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
-from OCC.Core.GCPnts import GCPnts_QuasiUniformAbscissa
+from OCC.Core.GCPnts import GCPnts_TangentialDeflection
+from OCC.Core.GeomAbs import GeomAbs_Line
 from OCC.Core.Bnd import Bnd_Box
 from OCC.Core.BRepBndLib import brepbndlib_Add
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_MakeFace
 from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Section
-from OCC.Core.TopoDS import topods
+from OCC.Core.TopoDS import TopoDS_Shape, topods
+from OCC.Core.TopTools import TopTools_ListOfShape
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.BRepTools import breptools_Read, breptools_Write
 
 from .cad_service import CADProcessingError
+from .line_raster import normalize_segments, polylines_to_segments, render_segments_png
+from .line_svg import render_segments_svg, svg_path_for
+from .image_variants import schedule_variants
+from .hlr_cache import HlrSegmentCache, component_key, direction_key
+from .json_store import json_transaction, read_json
+from .parallel_jobs import ParallelJobRunner
+from .section_stack import AXIS_INDEX, SectionStackError, assign_to_slices, slice_positions, write_section_stack
 
 logger = logging.getLogger(__name__)
 
+DirectionConfig = Dict[str, Tuple[float, float, float] | str]
+
+HLR_QUALITIES = ("exact", "fast")
+# Edge sampling: chord deflection as a fraction of the view's bbox diagonal
+# (5e-4 is under one pixel on the 1500 px canvas) plus a tangent angle limit.
+DEFAULT_RELATIVE_DEFLECTION = 5e-4
+DEFAULT_ANGULAR_DEFLECTION = 0.2
+VIEWS_STATUS_FILENAME = "views_status.json"
+
+
+@dataclass(frozen=True)
+class LineStyle:
+    """Stroke used when rendering projected segments."""
+
+    color: str = "#0e1e2f"
+    linewidth_pt: float = 0.7
+
+
+DEFAULT_LINE_STYLE = LineStyle()
+
+# Worker-process state: the service used for projection and the last BREP loaded.
+_WORKER_SERVICE: "CADServiceOCC | None" = None
+_WORKER_SHAPE: Tuple[str, object] | None = None
+
+
+def _hlr_direction_job(
+    workspace: str,
+    brep_path: str,
+    config: DirectionConfig,
+    quality: str = "exact",
+    relative_deflection: float = DEFAULT_RELATIVE_DEFLECTION,
+) -> Tuple[np.ndarray, Dict[str, float]]:
+    """Process-pool entry point: HLR + projection of one view direction."""
+    global _WORKER_SERVICE, _WORKER_SHAPE
+    if _WORKER_SERVICE is None:
+        _WORKER_SERVICE = CADServiceOCC(Path(workspace))
+    _WORKER_SERVICE.relative_deflection = relative_deflection
+    if _WORKER_SHAPE is None or _WORKER_SHAPE[0] != brep_path:
+        _WORKER_SHAPE = (brep_path, _WORKER_SERVICE._read_brep(Path(brep_path)))
+    return _WORKER_SERVICE._hlr_segments(_WORKER_SHAPE[1], config, quality=quality)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
 
 class CADServiceOCC:
     """
     Builds simple orthographic wireframe renderings using pythonocc-core.
     """
 
-    def __init__(self, workspace: Path, linear_deflection: float = 0.5) -> None:
+    def __init__(
+        self,
+        workspace: Path,
+        linear_deflection: float = 0.5,
+        hlr_workers: int | None = None,
+        relative_deflection: float = DEFAULT_RELATIVE_DEFLECTION,
+    ) -> None:
         self.workspace = workspace
         self.workspace.mkdir(parents=True, exist_ok=True)
+        self.linear_deflection = linear_deflection
+        self.relative_deflection = relative_deflection
+        self._hlr_runner = ParallelJobRunner(max_workers=hlr_workers)
+        self._hlr_cache = HlrSegmentCache(self.workspace / "hlr_cache")
+        # Exact HLR upgrades for fast previews run one at a time off the request path.
+        self._upgrade_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="occ-exact-hlr")
         # View direction, and basis vectors used to project 3D points to 2D.
-        self._projection_table: Dict[str, Dict[str, Tuple[float, float, float] | str]] = {
+        self._projection_table: Dict[str, DirectionConfig] = {
             "x": {"axis": "x", "dir": (1.0, 0.0, 0.0), "basis_x": (0.0, 1.0, 0.0), "basis_y": (0.0, 0.0, 1.0)},  # YZ
             "y": {"axis": "y", "dir": (0.0, 1.0, 0.0), "basis_x": (1.0, 0.0, 0.0), "basis_y": (0.0, 0.0, 1.0)},  # XZ
             "z": {"axis": "z", "dir": (0.0, 0.0, 1.0), "basis_x": (1.0, 0.0, 0.0), "basis_y": (0.0, 1.0, 0.0)},  # XY
@@ -68,6 +153,18 @@ class CADServiceOCC:
         shape = reader.Shape()
         return shape
 
+    def _write_brep(self, shape) -> Path:
+        brep_path = self.workspace / f"hlr_{uuid4().hex}.brep"
+        if not breptools_Write(shape, str(brep_path)):
+            raise CADProcessingError("Failed to serialize shape to BREP for HLR workers")
+        return brep_path
+
+    def _read_brep(self, brep_path: Path):
+        shape = TopoDS_Shape()
+        if not breptools_Read(shape, str(brep_path), BRep_Builder()) or shape.IsNull():
+            raise CADProcessingError(f"Failed to read BREP shape {brep_path.name}")
+        return shape
+
     def _bounding_box(self, shape) -> Tuple[float, float, float, float, float, float]:
         box = Bnd_Box()
         brepbndlib_Add(shape, box)
@@ -87,22 +184,50 @@ class CADServiceOCC:
             raise CADProcessingError("OCC HLR produced no visible edges")
         return visible
 
-    def _discretize_edge(self, edge) -> List[Tuple[float, float, float]]:
-        # Sample curve with a reasonable number of points; fallback to endpoints.
+    def _run_poly_hlr(self, shape, direction: Tuple[float, float, float]):
+        """Polygonal HLR over the shape's triangulation (see ``_ensure_triangulation``)."""
+        projector = HLRAlgo_Projector(gp_Ax2(gp_Pnt(0, 0, 0), gp_Dir(*direction)))
+        algo = HLRBRep_PolyAlgo()
+        algo.Load(shape)
+        algo.Projector(projector)
+        algo.Update()
+
+        hlr_shapes = HLRBRep_PolyHLRToShape()
+        hlr_shapes.Update(algo)
+        visible = hlr_shapes.VCompound()
+        if visible.IsNull():
+            raise CADProcessingError("OCC polygonal HLR produced no visible edges")
+        return visible
+
+    def _ensure_triangulation(self, shape) -> None:
+        # Reuses an existing triangulation when it already meets the deflection.
+        mesher = BRepMesh_IncrementalMesh(shape, self.linear_deflection, False, 0.5, True)
+        mesher.Perform()
+        if not mesher.IsDone():
+            raise CADProcessingError("Failed to triangulate shape for polygonal HLR")
+
+    def _chord_deflection(self, shape) -> float:
+        """Sampling tolerance for a view: ``relative_deflection`` of its bbox diagonal."""
+        xmin, ymin, zmin, xmax, ymax, zmax = self._bounding_box(shape)
+        diagonal = math.sqrt((xmax - xmin) ** 2 + (ymax - ymin) ** 2 + (zmax - zmin) ** 2)
+        return max(diagonal * self.relative_deflection, 1e-6)
+
+    def _discretize_edge(self, edge, deflection: float) -> List[Tuple[float, float, float]]:
+        # Lines need only their endpoints; curves are refined until the chord
+        # stays within ``deflection``. Falls back to endpoints on OCC errors.
         curve = BRepAdaptor_Curve(edge)
         samples: List[Tuple[float, float, float]] = []
         try:
-            discretizer = GCPnts_QuasiUniformAbscissa(curve, 80)
-            if discretizer.IsDone():
+            if curve.GetType() != GeomAbs_Line:
+                discretizer = GCPnts_TangentialDeflection(curve, DEFAULT_ANGULAR_DEFLECTION, deflection, 2)
                 for i in range(1, discretizer.NbPoints() + 1):
-                    param = discretizer.Parameter(i)
-                    pnt = curve.Value(param)
+                    pnt = discretizer.Value(i)
                     samples.append((pnt.X(), pnt.Y(), pnt.Z()))
         except Exception:
             # If OCC errors on curve sampling, ignore and fallback below.
-            pass
+            samples = []
 
-        if not samples:
+        if len(samples) < 2:
             try:
                 first, last = curve.FirstParameter(), curve.LastParameter()
                 p1, p2 = curve.Value(first), curve.Value(last)
@@ -112,11 +237,13 @@ class CADServiceOCC:
                 return []
         return samples
 
-    def _iter_edge_points(self, shape) -> Iterable[List[Tuple[float, float, float]]]:
+    def _iter_edge_points(self, shape, deflection: float | None = None) -> Iterable[List[Tuple[float, float, float]]]:
+        if deflection is None:
+            deflection = self._chord_deflection(shape)
         explorer = TopExp_Explorer(shape, TopAbs_EDGE)
         while explorer.More():
             edge = explorer.Current()
-            pts = self._discretize_edge(edge)
+            pts = self._discretize_edge(edge, deflection)
             if len(pts) >= 2:
                 yield pts
             explorer.Next()
@@ -130,28 +257,78 @@ class CADServiceOCC:
         proj = np.stack([pts @ bx, pts @ by], axis=1)
         return proj
 
-    def _render_segments(self, segments: List[np.ndarray], out_path: Path) -> None:
-        if not segments:
+    def _hlr_segments(
+        self, shape, config: DirectionConfig, *, quality: str = "exact"
+    ) -> Tuple[np.ndarray, Dict[str, float]]:
+        """Run HLR for one direction; returns projected ``(N, 2, 2)`` segments and timings."""
+        started = time.perf_counter()
+        if quality == "fast":
+            visible_edges = self._run_poly_hlr(shape, config["dir"])
+        else:
+            visible_edges = self._run_hlr(shape, config["dir"])
+        hlr_done = time.perf_counter()
+
+        polylines: List[np.ndarray] = []
+        for edge_pts in self._iter_edge_points(visible_edges):
+            polylines.append(self._project_points(edge_pts, config["basis_x"], config["basis_y"]))
+        segments = polylines_to_segments(polylines)
+        finished = time.perf_counter()
+
+        timings = {
+            "quality": quality,
+            "hlr_sec": round(hlr_done - started, 4),
+            "discretize_sec": round(finished - hlr_done, 4),
+            "edge_count": len(polylines),
+            "point_count": sum(len(polyline) for polyline in polylines),
+            "segment_count": int(segments.shape[0]),
+        }
+        return segments, timings
+
+    def _run_hlr_directions(
+        self, shape, quality: str = "exact", names: List[str] | None = None
+    ) -> Dict[str, Tuple[np.ndarray, Dict[str, float]]]:
+        """HLR the given (default: all) directions, in worker processes when more than one is available."""
+        table = {
+            name: config
+            for name, config in self._projection_table.items()
+            if names is None or name in names
+        }
+        if quality == "fast":
+            # Mesh once here so the BREP handed to the workers carries the triangulation.
+            self._ensure_triangulation(shape)
+        if self._hlr_runner.worker_count(len(table)) <= 1:
+            return {name: self._hlr_segments(shape, config, quality=quality) for name, config in table.items()}
+
+        brep_path = self._write_brep(shape)
+        try:
+            jobs = [
+                (name, (str(self.workspace), str(brep_path), config, quality, self.relative_deflection))
+                for name, config in table.items()
+            ]
+            return self._hlr_runner.run(_hlr_direction_job, jobs)
+        except CADProcessingError:
+            raise
+        except Exception as exc:
+            raise CADProcessingError(f"OCC HLR failed: {exc}") from exc
+        finally:
+            brep_path.unlink(missing_ok=True)
+
+    def _render_segments(
+        self,
+        flat_segments: np.ndarray,
+        out_path: Path,
+        style: LineStyle = DEFAULT_LINE_STYLE,
+        *,
+        variants: bool = True,
+    ) -> None:
+        if flat_segments.shape[0] == 0:
             raise CADProcessingError("No segments to render from OCC HLR output")
 
-        all_points = np.concatenate(segments, axis=0)
-        min_vals = all_points.min(axis=0)
-        max_vals = all_points.max(axis=0)
-        span = np.clip(max_vals - min_vals, 1e-5, None)
-
-        norm_segments = [((seg - min_vals) / span) for seg in segments]
-
-        fig, ax = plt.subplots(figsize=(5, 5), dpi=300)
-        collection = LineCollection(norm_segments, colors="#0e1e2f", linewidths=0.7)
-        ax.add_collection(collection)
-        ax.set_aspect("equal", "box")
-        ax.axis("off")
-        ax.set_xlim(0, 1)
-        ax.set_ylim(0, 1)
-        fig.tight_layout(pad=0)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        fig.savefig(out_path, transparent=True, bbox_inches="tight", pad_inches=0)
-        plt.close(fig)
+        norm_segments, _, _ = normalize_segments(flat_segments)
+        render_segments_png(
+            norm_segments, out_path, color=style.color, linewidth_pt=style.linewidth_pt, variants=variants
+        )
+        render_segments_svg(norm_segments, svg_path_for(out_path), color=style.color, linewidth_pt=style.linewidth_pt)
 
     def _midplane_section_shape(
         self,
@@ -190,6 +367,12 @@ class CADServiceOCC:
             explorer.Next()
         return solids
 
+    def _component_index(self, component_node_name: str | None, component_solid_index: int | None) -> int | None:
+        index = component_solid_index if isinstance(component_solid_index, int) and component_solid_index >= 1 else None
+        if index is None:
+            index = self._parse_component_index(component_node_name)
+        return index
+
     def _resolve_component_shape(
         self,
         shape,
@@ -197,9 +380,7 @@ class CADServiceOCC:
         component_node_name: str | None = None,
         component_solid_index: int | None = None,
     ):
-        index = component_solid_index if isinstance(component_solid_index, int) and component_solid_index >= 1 else None
-        if index is None:
-            index = self._parse_component_index(component_node_name)
+        index = self._component_index(component_node_name, component_solid_index)
         if index is None:
             return shape
 
@@ -212,6 +393,179 @@ class CADServiceOCC:
             )
         return solids[index - 1]
 
+    def _load_view_shape(
+        self,
+        step_path: Path,
+        *,
+        component_node_name: str | None = None,
+        component_solid_index: int | None = None,
+    ):
+        return self._resolve_component_shape(
+            self._load_shape(step_path),
+            component_node_name=component_node_name,
+            component_solid_index=component_solid_index,
+        )
+
+    def _collect_segments(
+        self,
+        step_path: Path,
+        *,
+        quality: str,
+        component_node_name: str | None = None,
+        component_solid_index: int | None = None,
+        cache_only: bool = False,
+    ) -> Dict[str, Tuple[np.ndarray, Dict[str, float]]] | None:
+        """
+        Projected segments for every direction, from the HLR cache where
+        possible; only the missing directions load the STEP file and run HLR.
+        With ``cache_only`` returns ``None`` unless every direction is cached.
+        """
+        shape_hash = self._hlr_cache.shape_hash(step_path)
+        component = component_key(self._component_index(component_node_name, component_solid_index))
+        keys = {name: direction_key(name, config) for name, config in self._projection_table.items()}
+        # Sampling tolerance changes the arrays, so it is part of the mode key.
+        mode = f"{quality}_d{self.relative_deflection:g}"
+        hits = self._hlr_cache.load_many(shape_hash, component, mode, keys.values())
+
+        missing = [name for name, key in keys.items() if key not in hits]
+        if missing and cache_only:
+            return None
+        computed: Dict[str, Tuple[np.ndarray, Dict[str, float]]] = {}
+        if missing:
+            view_shape = self._load_view_shape(
+                step_path,
+                component_node_name=component_node_name,
+                component_solid_index=component_solid_index,
+            )
+            computed = self._run_hlr_directions(view_shape, quality, names=missing)
+            for name, (segments, _) in computed.items():
+                self._hlr_cache.store(shape_hash, component, mode, keys[name], segments)
+
+        results: Dict[str, Tuple[np.ndarray, Dict[str, float]]] = {}
+        for name, key in keys.items():
+            if name in computed:
+                segments, direction_timings = computed[name]
+                results[name] = (segments, {**direction_timings, "cached": False})
+            else:
+                segments = hits[key]
+                results[name] = (
+                    segments,
+                    {"quality": quality, "cached": True, "segment_count": int(segments.shape[0])},
+                )
+        return results
+
+    def _publish_views(
+        self,
+        output_dir: Path,
+        hlr_results: Dict[str, Tuple[np.ndarray, Dict[str, float]]],
+        *,
+        generation: str,
+        quality: str,
+        exact_status: str | None,
+        style: LineStyle = DEFAULT_LINE_STYLE,
+        require_generation: bool = False,
+    ) -> Tuple[Dict[str, Path], Dict[str, Dict[str, float]]] | None:
+        """
+        Render HLR results into ``output_dir`` and record them in the status file.
+        With ``require_generation`` nothing is written if a newer request has
+        published since ``generation`` started; returns ``None`` in that case.
+
+        Views are rendered to staging files first, outside the status lock, so a
+        slow exact render does not hold up requests publishing to the same
+        directory; the lock only covers the generation check and the swap.
+        """
+        status_path = output_dir / VIEWS_STATUS_FILENAME
+        if require_generation:
+            current = read_json(status_path)
+            if not isinstance(current, dict) or current.get("generation") != generation:
+                return None
+
+        staged: Dict[str, Path] = {}
+        timings: Dict[str, Dict[str, float]] = {}
+        try:
+            for name, (segments, direction_timings) in hlr_results.items():
+                staged[name] = output_dir / f".{name}.{generation}.png"
+                started = time.perf_counter()
+                # Variants are queued for the published name, not the staging file.
+                self._render_segments(segments, staged[name], style, variants=False)
+                direction_timings["render_sec"] = round(time.perf_counter() - started, 4)
+                timings[name] = direction_timings
+
+            with json_transaction(status_path, dict) as status:
+                if require_generation and status.get("generation") != generation:
+                    return None
+                results: Dict[str, Path] = {}
+                for name, staged_path in staged.items():
+                    out_path = output_dir / f"{name}.png"
+                    os.replace(staged_path, out_path)
+                    os.replace(svg_path_for(staged_path), svg_path_for(out_path))
+                    schedule_variants(out_path)
+                    results[name] = out_path
+                status.clear()
+                status.update(
+                    {
+                        "generation": generation,
+                        "quality": quality,
+                        "exact_status": exact_status,
+                        "style": asdict(style),
+                        "updated_at": _now_iso(),
+                        "views": sorted(results),
+                    }
+                )
+                return results, timings
+        finally:
+            # Left behind only when superseded or when rendering failed part-way.
+            for staged_path in staged.values():
+                staged_path.unlink(missing_ok=True)
+                svg_path_for(staged_path).unlink(missing_ok=True)
+
+    def _set_exact_status(self, output_dir: Path, generation: str, exact_status: str, error: str | None = None) -> bool:
+        with json_transaction(output_dir / VIEWS_STATUS_FILENAME, dict) as status:
+            if status.get("generation") != generation:
+                return False
+            status["exact_status"] = exact_status
+            status["updated_at"] = _now_iso()
+            if error:
+                status["error"] = error
+            return True
+
+    def _upgrade_to_exact(
+        self,
+        step_path: Path,
+        output_dir: Path,
+        generation: str,
+        component_node_name: str | None,
+        component_solid_index: int | None,
+        style: LineStyle,
+    ) -> None:
+        if not self._set_exact_status(output_dir, generation, "running"):
+            return
+        try:
+            hlr_results = self._collect_segments(
+                step_path,
+                quality="exact",
+                component_node_name=component_node_name,
+                component_solid_index=component_solid_index,
+            )
+            published = self._publish_views(
+                output_dir,
+                hlr_results,
+                generation=generation,
+                quality="exact",
+                exact_status="done",
+                style=style,
+                require_generation=True,
+            )
+        except Exception as exc:
+            logger.exception("Exact HLR upgrade failed for %s", output_dir)
+            self._set_exact_status(output_dir, generation, "failed", error=f"{exc.__class__.__name__}: {exc}")
+            return
+
+        if published is None:
+            logger.info("Exact HLR upgrade for %s superseded by a newer request", output_dir)
+            return
+        logger.info("Exact HLR upgrade for %s: %s", output_dir, published[1])
+
     # ------------------------------------------------------------------ public API
     def generate_occ_views(
         self,
@@ -220,27 +574,81 @@ class CADServiceOCC:
         *,
         component_node_name: str | None = None,
         component_solid_index: int | None = None,
+        quality: str = "exact",
+        upgrade_exact: bool = False,
+        style: LineStyle = DEFAULT_LINE_STYLE,
     ) -> Dict[str, Path]:
-        shape = self._load_shape(step_path)
-        view_shape = self._resolve_component_shape(
-            shape,
+        results, _ = self.generate_occ_views_with_timings(
+            step_path,
+            output_dir,
             component_node_name=component_node_name,
             component_solid_index=component_solid_index,
+            quality=quality,
+            upgrade_exact=upgrade_exact,
+            style=style,
         )
+        return results
 
-        results: Dict[str, Path] = {}
-        for name, config in self._projection_table.items():
-            visible_edges = self._run_hlr(view_shape, config["dir"])
-
-            segments: List[np.ndarray] = []
-            for edge_pts in self._iter_edge_points(visible_edges):
-                projected = self._project_points(edge_pts, config["basis_x"], config["basis_y"])
-                segments.append(projected)
+    def generate_occ_views_with_timings(
+        self,
+        step_path: Path,
+        output_dir: Path,
+        *,
+        component_node_name: str | None = None,
+        component_solid_index: int | None = None,
+        quality: str = "exact",
+        upgrade_exact: bool = False,
+        style: LineStyle = DEFAULT_LINE_STYLE,
+    ) -> Tuple[Dict[str, Path], Dict[str, Dict[str, float]]]:
+        """
+        Render every projection with HLR, running the directions in parallel.
+        Returns the view paths plus per-direction timings (HLR, discretization,
+        render) in projection-table order.
+
+        With ``quality="fast"`` and ``upgrade_exact`` the exact pass is queued in
+        the background; it overwrites the same files when done and records the
+        progress in ``views_status.json`` (see ``read_views_status``). A fast
+        request whose exact segments are already cached is served exact.
+        """
+        if quality not in HLR_QUALITIES:
+            raise CADProcessingError(f"quality must be one of: {', '.join(HLR_QUALITIES)}")
+        selection = {"component_node_name": component_node_name, "component_solid_index": component_solid_index}
+
+        hlr_results = None
+        if quality == "fast":
+            hlr_results = self._collect_segments(step_path, quality="exact", cache_only=True, **selection)
+            if hlr_results is not None:
+                quality = "exact"
+        if hlr_results is None:
+            hlr_results = self._collect_segments(step_path, quality=quality, **selection)
+
+        generation = uuid4().hex
+        schedule_upgrade = quality == "fast" and upgrade_exact
+        results, timings = self._publish_views(
+            output_dir,
+            hlr_results,
+            generation=generation,
+            quality=quality,
+            exact_status="pending" if schedule_upgrade else None,
+            style=style,
+        )
+        logger.info("OCC views (%s) for %s: %s", quality, step_path.name, timings)
+
+        if schedule_upgrade:
+            self._upgrade_executor.submit(
+                self._upgrade_to_exact,
+                step_path,
+                output_dir,
+                generation,
+                component_node_name,
+                component_solid_index,
+                style,
+            )
+        return results, timings
 
-            out_path = output_dir / f"{name}.png"
-            self._render_segments(segments, out_path)
-            results[name] = out_path
-        return results
+    def read_views_status(self, output_dir: Path) -> Dict[str, object] | None:
+        """Published quality and exact-upgrade state for an OCC view directory."""
+        return read_json(output_dir / VIEWS_STATUS_FILENAME)
 
     def generate_mid_views(self, step_path: Path, output_dir: Path) -> Dict[str, Path]:
         """
@@ -273,6 +681,112 @@ class CADServiceOCC:
                 segments.append(projected)
 
             out_path = output_dir / f"mid_{name}.png"
-            self._render_segments(segments, out_path)
+            self._render_segments(polylines_to_segments(segments), out_path)
             results[f"mid_{name}"] = out_path
+            logger.info(
+                "Mid view %s for %s: %d edges, %d points",
+                name,
+                step_path.name,
+                len(segments),
+                sum(len(polyline) for polyline in segments),
+            )
         return results
+
+    def _section_stack_shape(self, shape, axis: str, positions: np.ndarray, bbox, span: float):
+        """Intersect ``shape`` with every slice plane in one boolean (shared arguments, parallel build)."""
+        axis_index = AXIS_INDEX[axis]
+        normal = [0.0, 0.0, 0.0]
+        normal[axis_index] = 1.0
+        center = [(bbox[i] + bbox[i + 3]) / 2.0 for i in range(3)]
+        half = max(span * 1.5, 1.0)
+
+        tools = TopTools_ListOfShape()
+        for position in positions:
+            origin = list(center)
+            origin[axis_index] = float(position)
+            plane = gp_Pln(gp_Pnt(*origin), gp_Dir(*normal))
+            tools.Append(BRepBuilderAPI_MakeFace(plane, -half, half, -half, half).Face())
+        arguments = TopTools_ListOfShape()
+        arguments.Append(shape)
+
+        section = BRepAlgoAPI_Section()
+        section.SetArguments(arguments)
+        section.SetTools(tools)
+        section.SetRunParallel(True)
+        section.Approximation(True)
+        section.Build()
+        if not section.IsDone():
+            raise CADProcessingError(f"Section stack failed for axis {axis}")
+        sec_shape = section.Shape()
+        if sec_shape.IsNull():
+            raise CADProcessingError(f"Section stack returned empty geometry for axis {axis}")
+        return sec_shape
+
+    def generate_section_stack(
+        self,
+        step_path: Path,
+        output_dir: Path,
+        *,
+        axis: str,
+        count: int,
+        component_node_name: str | None = None,
+        component_solid_index: int | None = None,
+    ) -> Dict[str, object]:
+        """
+        Cut ``count`` evenly spaced slices normal to ``axis`` and render each one.
+
+        All planes go into a single ``BRepAlgoAPI_Section`` so the part's
+        faces are indexed once for the whole stack instead of once per slice;
+        the resulting edges are then attributed back to their plane.
+        """
+        if axis not in AXIS_INDEX:
+            raise CADProcessingError(f"Unknown section axis: {axis}")
+        started = time.perf_counter()
+        shape = self._load_view_shape(
+            step_path,
+            component_node_name=component_node_name,
+            component_solid_index=component_solid_index,
+        )
+        bbox = self._bounding_box(shape)
+        axis_index = AXIS_INDEX[axis]
+        try:
+            positions = slice_positions(bbox[axis_index], bbox[axis_index + 3], count)
+        except SectionStackError as exc:
+            raise CADProcessingError(str(exc)) from exc
+        span = max(bbox[i + 3] - bbox[i] for i in range(3)) or 1.0
+        loaded = time.perf_counter()
+
+        section_shape = self._section_stack_shape(shape, axis, positions, bbox, span)
+        sectioned = time.perf_counter()
+
+        config = self._projection_table[axis]
+        per_slice: List[List[np.ndarray]] = [[] for _ in range(len(positions))]
+        for edge_pts in self._iter_edge_points(section_shape, self._chord_deflection(shape)):
+            points = np.asarray(edge_pts, dtype=np.float64)
+            index = int(assign_to_slices(points[:, axis_index].mean(), positions)[0])
+            per_slice[index].append(self._project_points(edge_pts, config["basis_x"], config["basis_y"]))
+        slice_segments = [polylines_to_segments(polylines) for polylines in per_slice]
+        discretized = time.perf_counter()
+
+        try:
+            written = write_section_stack(output_dir, axis=axis, positions=positions, slice_segments=slice_segments)
+        except SectionStackError as exc:
+            raise CADProcessingError(str(exc)) from exc
+        finished = time.perf_counter()
+
+        timings = {
+            "load_sec": round(loaded - started, 4),
+            "section_sec": round(sectioned - loaded, 4),
+            "discretize_sec": round(discretized - sectioned, 4),
+            "render_sec": round(finished - discretized, 4),
+            "total_sec": round(finished - started, 4),
+        }
+        logger.info("Section stack %s x%d for %s: %s", axis, count, step_path.name, timings)
+        return {
+            "axis": axis,
+            "positions": [float(value) for value in positions],
+            "views": written["views"],
+            "metadata": written["metadata"],
+            "slice_segment_counts": written["slice_segment_counts"],
+            "timings": timings,
+        }
@@ -6,6 +6,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from .topology_index import EdgeRecord, TopologyIndex, build_topology_index
+
 CRITICAL_EPS_MM = 0.0001
 WARNING_MAX_MM = 1.5
 CAUTION_MAX_MM = 3.0
@@ -229,9 +231,14 @@ class CncGeometryAnalyzer:
         component_display_name: str | None = None,
         include_ok_rows: bool = False,
         criteria: dict[str, Any] | None = None,
+        shape: Any = None,
+        topology: TopologyIndex | None = None,
     ) -> dict[str, Any]:
         occ = self._import_occ()
-        shape = self._load_shape(occ, step_path)
+        # Callers holding the loaded STEP root pass it (and the topology index of
+        # the component resolved from it) to skip re-reading and re-walking it.
+        if shape is None:
+            shape = self._load_shape(occ, step_path)
         criteria_cfg = parse_criteria(criteria)
 
         assumptions = [
@@ -264,18 +271,19 @@ class CncGeometryAnalyzer:
             else None
         )
 
-        records = self._edge_face_records(occ, analysis_shape)
+        if topology is None:
+            topology = build_topology_index(occ, analysis_shape)
 
         corners: list[dict[str, Any]] = []
         status_counts = {"CRITICAL": 0, "WARNING": 0, "CAUTION": 0, "OK": 0}
         uncertain_internal_count = 0
         corner_num = 1
 
-        for edge_index, record in enumerate(records, start=1):
-            faces = record["faces"]
+        for edge_index, record in enumerate(topology.edges, start=1):
+            faces = record.faces
             if len(faces) != 2:
                 continue
-            midpoint, tangent, normals = self._edge_frame(occ, record["edge"], faces)
+            midpoint, tangent, normals = self._edge_frame(occ, record.edge, faces)
             if midpoint is None or tangent is None or len(normals) != 2:
                 continue
 
@@ -283,7 +291,7 @@ class CncGeometryAnalyzer:
             if criteria_cfg.concave_internal_edges_only and signed >= 0:
                 continue
 
-            radius_mm = self._measure_radius_mm(occ, record["edge"])
+            radius_mm = self._edge_radius_mm(occ, record)
             status = classify_radius_status_with_criteria(
                 radius_mm,
                 criteria=criteria_cfg,
@@ -399,11 +407,11 @@ class CncGeometryAnalyzer:
         try:
             from OCC.Core.Bnd import Bnd_Box
             from OCC.Core.BRep import BRep_Tool
-            from OCC.Core.BRepAdaptor import BRepAdaptor_Curve
+            from OCC.Core.BRepAdaptor import BRepAdaptor_Curve, BRepAdaptor_Surface
             from OCC.Core.BRepBndLib import brepbndlib_Add
             from OCC.Core.BRepClass3d import BRepClass3d_SolidClassifier
             from OCC.Core.GeomAPI import GeomAPI_ProjectPointOnSurf
-            from OCC.Core.GeomAbs import GeomAbs_Circle, GeomAbs_Line
+            from OCC.Core.GeomAbs import GeomAbs_Circle, GeomAbs_Cylinder, GeomAbs_Line, GeomAbs_Plane
             from OCC.Core.GeomLProp import GeomLProp_CLProps, GeomLProp_SLProps
             from OCC.Core.IFSelect import IFSelect_RetDone
             from OCC.Core.STEPControl import STEPControl_Reader
@@ -415,6 +423,7 @@ class CncGeometryAnalyzer:
                 TopAbs_SOLID,
             )
             from OCC.Core.TopExp import TopExp_Explorer
+            from OCC.Core.TopTools import TopTools_IndexedMapOfShape
             from OCC.Core.TopoDS import topods
             from OCC.Core.gp import gp_Pnt
         except Exception as exc:  # pragma: no cover - environment dependent
@@ -426,11 +435,14 @@ class CncGeometryAnalyzer:
             "Bnd_Box": Bnd_Box,
             "BRep_Tool": BRep_Tool,
             "BRepAdaptor_Curve": BRepAdaptor_Curve,
+            "BRepAdaptor_Surface": BRepAdaptor_Surface,
             "brepbndlib_Add": brepbndlib_Add,
             "BRepClass3d_SolidClassifier": BRepClass3d_SolidClassifier,
             "GeomAPI_ProjectPointOnSurf": GeomAPI_ProjectPointOnSurf,
             "GeomAbs_Circle": GeomAbs_Circle,
+            "GeomAbs_Cylinder": GeomAbs_Cylinder,
             "GeomAbs_Line": GeomAbs_Line,
+            "GeomAbs_Plane": GeomAbs_Plane,
             "GeomLProp_CLProps": GeomLProp_CLProps,
             "GeomLProp_SLProps": GeomLProp_SLProps,
             "IFSelect_RetDone": IFSelect_RetDone,
@@ -441,6 +453,7 @@ class CncGeometryAnalyzer:
             "TopAbs_OUT": TopAbs_OUT,
             "TopAbs_SOLID": TopAbs_SOLID,
             "TopExp_Explorer": TopExp_Explorer,
+            "TopTools_IndexedMapOfShape": TopTools_IndexedMapOfShape,
             "topods": topods,
             "gp_Pnt": gp_Pnt,
         }
@@ -479,26 +492,6 @@ class CncGeometryAnalyzer:
         occ["brepbndlib_Add"](shape, box)
         return box.Get()
 
-    def _edge_face_records(self, occ: dict[str, Any], shape) -> list[dict[str, Any]]:
-        records: list[dict[str, Any]] = []
-        face_explorer = occ["TopExp_Explorer"](shape, occ["TopAbs_FACE"])
-        while face_explorer.More():
-            face = occ["topods"].Face(face_explorer.Current())
-            edge_explorer = occ["TopExp_Explorer"](face, occ["TopAbs_EDGE"])
-            while edge_explorer.More():
-                edge = occ["topods"].Edge(edge_explorer.Current())
-                matched = False
-                for record in records:
-                    if record["edge"].IsSame(edge):
-                        record["faces"].append(face)
-                        matched = True
-                        break
-                if not matched:
-                    records.append({"edge": edge, "faces": [face]})
-                edge_explorer.Next()
-            face_explorer.Next()
-        return records
-
     def _edge_frame(self, occ: dict[str, Any], edge, faces: list[Any]):
         try:
             curve = occ["BRepAdaptor_Curve"](edge)
@@ -541,6 +534,14 @@ class CncGeometryAnalyzer:
         except Exception:
             return None
 
+    def _edge_radius_mm(self, occ: dict[str, Any], record: EdgeRecord) -> float | None:
+        # Lines and circles were already classified while indexing.
+        if record.curve_type == "line":
+            return 0.0
+        if record.curve_type == "circle" and record.circle_radius is not None:
+            return record.circle_radius
+        return self._measure_radius_mm(occ, record.edge)
+
     def _measure_radius_mm(self, occ: dict[str, Any], edge) -> float | None:
         try:
             curve = occ["BRepAdaptor_Curve"](edge)
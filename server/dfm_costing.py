@@ -22,6 +22,29 @@ MATERIAL_KEYWORDS = {
 }
 
 
+# Review facts read by the cost model besides its ``required_metrics``.
+COST_FEATURE_FACT_KEYS = (
+    "hole_count",
+    "hole_features",
+    "threaded_holes_count",
+    "pocket_count",
+    "pocket_features",
+    "pockets_present",
+    "bend_count",
+    "bend_features",
+    "bends_present",
+    "weld_length_mm",
+    "body_count",
+    "part_volume_mm3",
+)
+
+
+def cost_fact_keys(bundle: DfmBundle) -> set[str]:
+    required_metrics = bundle.cost_model.get("required_metrics", [])
+    keys = {key for key in required_metrics if isinstance(key, str)} if isinstance(required_metrics, list) else set()
+    return keys | set(COST_FEATURE_FACT_KEYS)
+
+
 def estimate_review_costs(
     *,
     bundle: DfmBundle,
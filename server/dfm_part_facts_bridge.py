@@ -6,6 +6,27 @@ KNOWN_METRIC_STATES = {"measured", "inferred", "declared"}
 NOT_APPLICABLE_STATE = "not_applicable"
 NOT_APPLICABLE_INPUTS_KEY = "__not_applicable_inputs__"
 
+_ENCLOSED_VOID_SOURCES = ("count_radius_below_3_0_mm", "warning_corner_count")
+
+# Review facts the ``_derive_*`` helpers below compute, keyed to the part-facts
+# metrics each one is read from. Part facts maps rule inputs to extractors
+# through this, so a new derivation must be listed here as well.
+DERIVED_FACT_SOURCES: dict[str, tuple[str, ...]] = {
+    "hole_features": ("hole_count", "threaded_holes_count", "hole_depth", "hole_diameter"),
+    "min_wall_thickness": ("min_wall_thickness_mm", "min_wall_thickness"),
+    "wall_thickness_map": ("min_wall_thickness_mm", "min_wall_thickness"),
+    "cad.robot_interface.conformance_flag": ("iso9409_1_robot_interface_candidate",),
+    "robot_interface_conformance_flag": ("iso9409_1_robot_interface_candidate",),
+    "cad.threads.iso228_all_conformant": ("iso228_1_thread_standard_candidate",),
+    "iso228_all_conformant": ("iso228_1_thread_standard_candidate",),
+    "cad.hygienic_design.crevice_count": ("critical_corner_count",),
+    "crevice_count": ("critical_corner_count",),
+    "cad.hygienic_design.enclosed_voids_in_product_zone_count": _ENCLOSED_VOID_SOURCES,
+    "enclosed_voids_in_product_zone_count": _ENCLOSED_VOID_SOURCES,
+    "cad.hygienic_design.trapped_volume_count": ("long_reach_tool_risk_count",),
+    "trapped_volume_count": ("long_reach_tool_risk_count",),
+}
+
 
 def build_extracted_facts_from_part_facts(
     part_facts_payload: dict[str, Any] | None,
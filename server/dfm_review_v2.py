@@ -5,7 +5,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 from .dfm_bundle import DfmBundle
-from .dfm_costing import estimate_review_costs
+from .dfm_costing import cost_fact_keys, estimate_review_costs
 from .dfm_part_facts_bridge import NOT_APPLICABLE_INPUTS_KEY
 from .dfm_planning import DfmPlanningError, plan_dfm_execution
 
@@ -188,6 +188,42 @@ def generate_dfm_review_v2(
     }
 
 
+def review_fact_keys(
+    bundle: DfmBundle,
+    *,
+    planning_inputs: dict[str, Any] | None = None,
+    execution_plans: list[dict[str, Any]] | None = None,
+    selected_execution_plan_id: str | None = None,
+    context_payload: dict[str, Any] | None = None,
+    cost_enabled: bool = True,
+) -> set[str]:
+    """Fact keys a review with these inputs reads: rule ``inputs_required`` of its plans plus cost inputs."""
+    plans = _resolve_plan_payload(
+        bundle=bundle,
+        planning_inputs=planning_inputs,
+        execution_plans=execution_plans,
+    )["execution_plans"]
+    if selected_execution_plan_id:
+        plans = [plan for plan in plans if plan.get("plan_id") == selected_execution_plan_id]
+    analysis_mode = _resolve_analysis_mode(planning_inputs, context_payload)
+
+    keys: set[str] = set()
+    for plan in plans:
+        resolved = _normalize_execution_plan(bundle, plan)
+        for rule in _iter_rules_for_plan(
+            bundle,
+            resolved["pack_ids"],
+            resolved.get("overlay_id"),
+            analysis_mode=analysis_mode,
+        ):
+            required = rule.get("inputs_required", [])
+            if isinstance(required, list):
+                keys.update(key for key in required if isinstance(key, str) and key)
+    if cost_enabled:
+        keys |= cost_fact_keys(bundle)
+    return keys
+
+
 def _resolve_plan_payload(
     *,
     bundle: DfmBundle,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from .dfm_bundle import DfmBundle
+from .json_store import file_lock, read_json, write_json_atomic
 
 
 STANDARDS_SECTION_KEY = "standards_references_auto"
@@ -92,27 +92,6 @@ class DfmTemplateStore:
         normalized_overlay_id = self._normalize_overlay_id(overlay_id)
         normalized_role_id = self._normalize_role_id(default_role_id)
 
-        payload = self._read_store(model_id)
-        custom_templates = payload.get("custom_templates", [])
-        if len(custom_templates) >= self.max_custom_templates:
-            raise DfmTemplateStoreError(
-                f"Maximum custom templates reached ({self.max_custom_templates})."
-            )
-
-        existing_labels = {
-            str(template.get("label", "")).strip().lower()
-            for template in custom_templates
-            if isinstance(template, dict)
-        }
-        existing_labels.update(
-            {
-                str(template.get("label", "")).strip().lower()
-                for template in self._bundle_templates
-            }
-        )
-        if name.lower() in existing_labels:
-            raise DfmTemplateStoreError("template_name must be unique for this model.")
-
         enabled_keys = self._normalize_enabled_keys(enabled_section_keys)
         sections = self._resolve_sections_for_save(
             base_template=base_template,
@@ -120,28 +99,52 @@ class DfmTemplateStore:
             enabled_section_keys=enabled_keys,
         )
 
-        next_id = int(payload.get("next_custom_template_id", 1))
-        template_id = f"custom_tpl_{next_id:04d}"
-        timestamp = self._now_iso()
+        # Name uniqueness and the id counter are checked against the persisted store,
+        # so hold the store lock across the whole read-modify-write.
+        with file_lock(self._store_path(model_id)):
+            payload = self._read_store(model_id)
+            custom_templates = payload.get("custom_templates", [])
+            if len(custom_templates) >= self.max_custom_templates:
+                raise DfmTemplateStoreError(
+                    f"Maximum custom templates reached ({self.max_custom_templates})."
+                )
 
-        custom_template = {
-            "template_id": template_id,
-            "label": name,
-            "description": f"Custom template based on {base_template.get('label', base_template_id)}.",
-            "source": "custom",
-            "base_template_id": base_template_id,
-            "overlay_id": normalized_overlay_id,
-            "default_role_id": normalized_role_id,
-            "template_sections": sections["enabled"],
-            "suppressed_template_sections": sections["suppressed"],
-            "section_order": sections["order"],
-            "created_at": timestamp,
-            "updated_at": timestamp,
-        }
+            existing_labels = {
+                str(template.get("label", "")).strip().lower()
+                for template in custom_templates
+                if isinstance(template, dict)
+            }
+            existing_labels.update(
+                {
+                    str(template.get("label", "")).strip().lower()
+                    for template in self._bundle_templates
+                }
+            )
+            if name.lower() in existing_labels:
+                raise DfmTemplateStoreError("template_name must be unique for this model.")
+
+            next_id = int(payload.get("next_custom_template_id", 1))
+            template_id = f"custom_tpl_{next_id:04d}"
+            timestamp = self._now_iso()
+
+            custom_template = {
+                "template_id": template_id,
+                "label": name,
+                "description": f"Custom template based on {base_template.get('label', base_template_id)}.",
+                "source": "custom",
+                "base_template_id": base_template_id,
+                "overlay_id": normalized_overlay_id,
+                "default_role_id": normalized_role_id,
+                "template_sections": sections["enabled"],
+                "suppressed_template_sections": sections["suppressed"],
+                "section_order": sections["order"],
+                "created_at": timestamp,
+                "updated_at": timestamp,
+            }
 
-        payload["next_custom_template_id"] = next_id + 1
-        payload.setdefault("custom_templates", []).append(custom_template)
-        self._write_store(model_id, payload)
+            payload["next_custom_template_id"] = next_id + 1
+            payload.setdefault("custom_templates", []).append(custom_template)
+            self._write_store(model_id, payload)
 
         response = dict(custom_template)
         response["validation_warnings"] = sections["validation_warnings"]
@@ -198,17 +201,8 @@ class DfmTemplateStore:
             "custom_templates": [],
         }
 
-    def _ensure_store(self, model_id: str) -> Path:
-        model_dir = self._model_dir(model_id)
-        model_dir.mkdir(parents=True, exist_ok=True)
-        store_path = self._store_path(model_id)
-        if not store_path.exists():
-            self._write_json(store_path, self._default_payload())
-        return store_path
-
     def _read_store(self, model_id: str) -> dict[str, Any]:
-        store_path = self._ensure_store(model_id)
-        payload = json.loads(store_path.read_text(encoding="utf-8"))
+        payload = read_json(self._store_path(model_id), default=self._default_payload())
         if not isinstance(payload, dict):
             raise DfmTemplateStoreError(
                 f"Invalid template store for model '{model_id}': expected object."
@@ -220,13 +214,7 @@ class DfmTemplateStore:
         return payload
 
     def _write_store(self, model_id: str, payload: dict[str, Any]) -> None:
-        store_path = self._ensure_store(model_id)
-        tmp_path = store_path.with_name(f"{store_path.name}.tmp")
-        self._write_json(tmp_path, payload)
-        tmp_path.replace(store_path)
-
-    def _write_json(self, path: Path, payload: dict[str, Any]) -> None:
-        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        write_json_atomic(self._store_path(model_id), payload)
 
     def _custom_templates(self, model_id: str) -> list[dict[str, Any]]:
         payload = self._read_store(model_id)
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from .json_store import read_json, write_json_atomic
+
 
 class DraftLintDemoError(RuntimeError):
     """Base error for DraftLint demo service."""
@@ -30,7 +32,12 @@ class DraftLintStageSpec:
 
 
 class DraftLintDemoService:
-    """Deterministic DraftLint mock backend for customer demo recording."""
+    """
+    Deterministic DraftLint mock backend for customer demo recording.
+
+    Session and report state lives on disk under ``root`` rather than in process
+    memory, so any worker or replica sharing the data directory can answer polls.
+    """
 
     _ALLOWED_EXTENSIONS = {".pdf", ".png", ".jpg", ".jpeg"}
     _STAGES: tuple[DraftLintStageSpec, ...] = (
@@ -51,8 +58,6 @@ class DraftLintDemoService:
         self.root.mkdir(parents=True, exist_ok=True)
         (self.root / "sessions").mkdir(parents=True, exist_ok=True)
         (self.root / "reports").mkdir(parents=True, exist_ok=True)
-        self._sessions: dict[str, dict[str, Any]] = {}
-        self._reports: dict[str, dict[str, Any]] = {}
 
     def create_session(
         self,
@@ -72,8 +77,8 @@ class DraftLintDemoService:
         profile = (standard_profile or "ISO 1101 + ISO 5457").strip() or "ISO 1101 + ISO 5457"
         drawing_id = f"drawing_{uuid4().hex[:8]}"
 
-        session_dir = self.root / "sessions" / session_id
-        report_dir = self.root / "reports" / report_id
+        session_dir = self._session_dir(session_id)
+        report_dir = self._report_dir(report_id)
         session_dir.mkdir(parents=True, exist_ok=True)
         report_dir.mkdir(parents=True, exist_ok=True)
 
@@ -93,20 +98,19 @@ class DraftLintDemoService:
             report_payload=report_payload,
         )
 
-        self._sessions[session_id] = {
-            "session_id": session_id,
-            "report_id": report_id,
-            "drawing_id": drawing_id,
-            "standard_profile": profile,
-            "created_at": now,
-            "source_file_name": source_file_name,
-            "source_original_name": filename,
-            "source_mime_type": self._guess_mime_type(extension),
-        }
-        self._reports[report_id] = {
-            "report_id": report_id,
-            "payload": report_payload,
-        }
+        write_json_atomic(
+            session_dir / "session.json",
+            {
+                "session_id": session_id,
+                "report_id": report_id,
+                "drawing_id": drawing_id,
+                "standard_profile": profile,
+                "created_at": now.isoformat(),
+                "source_file_name": source_file_name,
+                "source_original_name": filename,
+                "source_mime_type": self._guess_mime_type(extension),
+            },
+        )
 
         status_payload = self.get_session(session_id=session_id)
         status_payload["source_url"] = f"/api/draftlint/sessions/{session_id}/source"
@@ -115,11 +119,8 @@ class DraftLintDemoService:
         return status_payload
 
     def get_session(self, *, session_id: str) -> dict[str, Any]:
-        session = self._sessions.get(session_id)
-        if not session:
-            raise DraftLintSessionNotFoundError("DraftLint session not found.")
-
-        created_at: dt.datetime = session["created_at"]
+        session = self._load_session(session_id)
+        created_at = dt.datetime.fromisoformat(session["created_at"])
         now = dt.datetime.now(dt.timezone.utc)
         elapsed = max((now - created_at).total_seconds(), 0.0)
         total_duration = sum(stage.duration_sec for stage in self._STAGES)
@@ -172,13 +173,17 @@ class DraftLintDemoService:
         }
 
     def get_report(self, *, report_id: str) -> dict[str, Any]:
-        report = self._reports.get(report_id)
-        if not report:
+        report_path = self._report_dir(report_id) / "report.json"
+        try:
+            payload = read_json(report_path)
+        except (OSError, ValueError) as exc:
+            raise DraftLintDemoError(f"Failed to read DraftLint report: {exc}") from exc
+        if not isinstance(payload, dict):
             raise DraftLintReportNotFoundError("DraftLint report not found.")
-        return report["payload"]
+        return payload
 
     def get_artifact_path(self, *, report_id: str, artifact_name: str) -> Path:
-        report_dir = self.root / "reports" / report_id
+        report_dir = self._report_dir(report_id)
         if not report_dir.exists():
             raise DraftLintReportNotFoundError("DraftLint report not found.")
 
@@ -195,20 +200,38 @@ class DraftLintDemoService:
         return target
 
     def get_session_source_path(self, *, session_id: str) -> Path:
-        session = self._sessions.get(session_id)
-        if not session:
-            raise DraftLintSessionNotFoundError("DraftLint session not found.")
-        source_path = self.root / "sessions" / session_id / session["source_file_name"]
+        session = self._load_session(session_id)
+        source_path = self._session_dir(session_id) / session["source_file_name"]
         if not source_path.exists():
             raise DraftLintSessionNotFoundError("DraftLint source file not found.")
         return source_path
 
     def get_session_source_mime_type(self, *, session_id: str) -> str:
-        session = self._sessions.get(session_id)
-        if not session:
-            raise DraftLintSessionNotFoundError("DraftLint session not found.")
+        session = self._load_session(session_id)
         return session["source_mime_type"]
 
+    def _session_dir(self, session_id: str) -> Path:
+        return self.root / "sessions" / self._safe_id(session_id)
+
+    def _report_dir(self, report_id: str) -> Path:
+        return self.root / "reports" / self._safe_id(report_id)
+
+    def _safe_id(self, value: str) -> str:
+        # Ids arrive from URL paths and are used as directory names.
+        cleaned = value.strip()
+        if not cleaned or cleaned in {".", ".."} or "/" in cleaned or "\\" in cleaned:
+            return "_invalid_"
+        return cleaned
+
+    def _load_session(self, session_id: str) -> dict[str, Any]:
+        try:
+            session = read_json(self._session_dir(session_id) / "session.json")
+        except (OSError, ValueError) as exc:
+            raise DraftLintDemoError(f"Failed to read DraftLint session: {exc}") from exc
+        if not isinstance(session, dict):
+            raise DraftLintSessionNotFoundError("DraftLint session not found.")
+        return session
+
     def _build_report_payload(
         self,
         *,
@@ -0,0 +1,106 @@
+"""
+On-disk cache of projected HLR segment arrays.
+
+Hidden-line removal is by far the most expensive part of OCC view generation,
+and its output only depends on the geometry, the selected component, the view
+direction and the HLR mode. Those projected ``(N, 2, 2)`` segment arrays are
+stored as ``.npy`` files keyed by exactly that, so repeat requests (and
+restyled renders) skip HLR entirely::
+
+    <root>/v<CACHE_VERSION>/<shape_hash>/<component>/<quality>/<direction>.npy
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Tuple
+from uuid import uuid4
+
+import numpy as np
+
+# Bump when discretization or projection changes so stale arrays are ignored.
+CACHE_VERSION = 2
+_HASH_CHUNK_BYTES = 1 << 20
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def component_key(component_index: int | None) -> str:
+    return "all" if component_index is None else f"solid_{component_index}"
+
+
+def direction_key(name: str, config: Mapping[str, Any]) -> str:
+    """View name plus a short digest of its projection so edited tables never collide."""
+    canonical = json.dumps(
+        {key: config[key] for key in ("dir", "basis_x", "basis_y") if key in config},
+        sort_keys=True,
+        default=list,
+    )
+    return f"{name}_{hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:10]}"
+
+
+class HlrSegmentCache:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self._hash_memo: Dict[Tuple[str, int, int], str] = {}
+        self._memo_lock = threading.Lock()
+
+    def shape_hash(self, step_path: Path) -> str:
+        """Content hash of a STEP file, memoized on (path, mtime, size)."""
+        stat = step_path.stat()
+        memo_key = (str(step_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._memo_lock:
+            cached = self._hash_memo.get(memo_key)
+        if cached is not None:
+            return cached
+        digest = file_sha256(step_path)
+        with self._memo_lock:
+            self._hash_memo[memo_key] = digest
+        return digest
+
+    def _entry_path(self, shape_hash: str, component: str, quality: str, direction: str) -> Path:
+        return self.root / f"v{CACHE_VERSION}" / shape_hash / component / quality / f"{direction}.npy"
+
+    def load(self, shape_hash: str, component: str, quality: str, direction: str) -> np.ndarray | None:
+        path = self._entry_path(shape_hash, component, quality, direction)
+        if not path.exists():
+            return None
+        try:
+            segments = np.load(path, allow_pickle=False)
+        except (OSError, ValueError):
+            # Corrupt or truncated entry: treat as a miss, it will be rewritten.
+            return None
+        if segments.ndim != 3 or segments.shape[1:] != (2, 2):
+            return None
+        return segments
+
+    def load_many(
+        self, shape_hash: str, component: str, quality: str, directions: Iterable[str]
+    ) -> Dict[str, np.ndarray]:
+        hits: Dict[str, np.ndarray] = {}
+        for direction in directions:
+            segments = self.load(shape_hash, component, quality, direction)
+            if segments is not None:
+                hits[direction] = segments
+        return hits
+
+    def store(self, shape_hash: str, component: str, quality: str, direction: str, segments: np.ndarray) -> Path:
+        path = self._entry_path(shape_hash, component, quality, direction)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.stem}.{uuid4().hex}.tmp.npy")
+        try:
+            np.save(tmp_path, np.ascontiguousarray(segments, dtype=np.float64), allow_pickle=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return path
@@ -0,0 +1,135 @@
+"""
+Hole recognition by grouping coaxial cylindrical faces.
+
+Counting every cylindrical face as a hole over-counts: OCC splits full
+cylinders into two half faces, and a counterbore or a stepped bore is several
+coaxial faces. Here faces are grouped by their axis line, and faces on one
+axis whose axial extents touch or overlap become a single hole.
+
+The axis line of each face is reduced to a key: the direction, sign
+normalised and quantised to ``DIRECTION_TOL``, plus the point on the line
+closest to the origin, quantised to ``POSITION_TOL_MM``. Grouping works on
+those integer keys with NumPy, so there is no Python loop over faces.
+Coaxial faces whose axes straddle a quantisation boundary still end up as
+separate holes; B-rep faces cut from one cylinder share the exact axis, so in
+practice this only affects nearly coaxial features.
+
+A hole counts as through when its axial extent spans the part's bounding box
+projected onto the axis. For holes that are not axis-aligned this projection
+overestimates the part, so such holes lean towards blind.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+HOLE_COLUMNS = ("diameter_mm", "depth_mm", "through")
+
+DIRECTION_TOL = 1e-4
+POSITION_TOL_MM = 1e-3
+MERGE_GAP_MM = 1e-3
+THROUGH_TOL_MM = 1e-2
+
+
+def _shift_per_group(group: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # Offsets that keep each group's values above every earlier group's, so a
+    # running maximum over the sorted array never leaks across groups.
+    span = float(values.max() - values.min()) + 1.0
+    return group * span - values.min()
+
+
+def recognize_holes(
+    radius: np.ndarray,
+    axis_origin: np.ndarray,
+    axis_direction: np.ndarray,
+    v_range: np.ndarray,
+    part_bounds: tuple[float, float, float, float, float, float],
+) -> np.ndarray:
+    """
+    One row per hole, columns as in ``HOLE_COLUMNS``.
+
+    Inputs are per cylindrical face. ``axis_origin`` and ``axis_direction``
+    (``(n, 3)``) and ``v_range`` (``(n, 2)``, axial parameter bounds) may hold
+    NaN where the kernel did not report them. Faces with no usable axis become
+    their own hole, with the depth taken from ``v_range`` (NaN if unknown) and
+    ``through`` set to 0.
+    """
+    radius = np.asarray(radius, dtype=np.float64).reshape(-1)
+    origin = np.asarray(axis_origin, dtype=np.float64).reshape(-1, 3)
+    direction = np.asarray(axis_direction, dtype=np.float64).reshape(-1, 3)
+    v_range = np.asarray(v_range, dtype=np.float64).reshape(-1, 2)
+    bounds = np.asarray(part_bounds, dtype=np.float64)
+    lower, upper = bounds[:3], bounds[3:]
+
+    # Same exclusions the per-face counter applied: wide cylinders are the
+    # part's outside, short ones are blends.
+    diameter = radius * 2.0
+    face_depth = np.abs(v_range[:, 1] - v_range[:, 0])
+    face_depth = np.where(np.isfinite(face_depth) & (face_depth > 0), face_depth, np.nan)
+    extents = upper - lower
+    min_extent = extents[extents > 0].min() if (extents > 0).any() else 0.0
+    keep = np.isfinite(radius) & (radius > 0)
+    if min_extent > 0:
+        keep &= diameter <= min_extent * 0.7
+    keep &= ~(face_depth < diameter * 0.15)
+    radius, origin, direction, v_range, face_depth = (
+        radius[keep],
+        origin[keep],
+        direction[keep],
+        v_range[keep],
+        face_depth[keep],
+    )
+
+    length = np.linalg.norm(direction, axis=1)
+    groupable = np.isfinite(origin).all(axis=1) & np.isfinite(length) & (length > 1e-12)
+    groupable &= np.isfinite(v_range).all(axis=1)
+    loose = np.column_stack(
+        [radius[~groupable] * 2.0, face_depth[~groupable], np.zeros(int((~groupable).sum()))]
+    )
+    if not groupable.any():
+        return loose.reshape(-1, 3)
+
+    radius, origin, v_range = radius[groupable], origin[groupable], v_range[groupable]
+    unit = direction[groupable] / length[groupable, None]
+
+    # d and -d describe the same line: flip so the first non-zero quantised
+    # component is positive. rint is symmetric, so both signs quantise alike.
+    quantised = np.rint(unit / DIRECTION_TOL).astype(np.int64)
+    nonzero = quantised != 0
+    first = np.argmax(nonzero, axis=1)
+    sign = np.sign(quantised[np.arange(len(quantised)), first]).astype(np.float64)
+    sign[sign == 0] = 1.0
+    unit = unit * sign[:, None]
+    quantised = quantised * sign.astype(np.int64)[:, None]
+
+    along = np.einsum("ij,ij->i", origin, unit)
+    closest = origin - along[:, None] * unit
+    keys = np.column_stack([quantised, np.rint(closest / POSITION_TOL_MM).astype(np.int64)])
+    _, group = np.unique(keys, axis=0, return_inverse=True)
+    group = group.reshape(-1)
+
+    # Axial interval of each face, measured along the normalised direction.
+    t = along[:, None] + v_range * sign[:, None]
+    start, end = t.min(axis=1), t.max(axis=1)
+
+    order = np.lexsort((start, group))
+    group, start, end = group[order], start[order], end[order]
+    radius, unit = radius[order], unit[order]
+
+    shift = _shift_per_group(group, np.concatenate([start, end]))
+    reach = np.maximum.accumulate(end + shift) - shift
+    new_hole = np.ones(len(group), dtype=bool)
+    new_hole[1:] = (group[1:] != group[:-1]) | (start[1:] > reach[:-1] + MERGE_GAP_MM)
+    first_face = np.flatnonzero(new_hole)
+
+    hole_start = start[first_face]
+    hole_end = np.maximum.reduceat(end, first_face)
+    hole_radius = np.minimum.reduceat(radius, first_face)
+    hole_unit = unit[first_face]
+
+    # Part extent along each hole axis, from the bounding box corners.
+    projected_lower = np.minimum(hole_unit * lower, hole_unit * upper).sum(axis=1)
+    projected_upper = np.maximum(hole_unit * lower, hole_unit * upper).sum(axis=1)
+    through = (hole_start <= projected_lower + THROUGH_TOL_MM) & (hole_end >= projected_upper - THROUGH_TOL_MM)
+
+    grouped = np.column_stack([hole_radius * 2.0, hole_end - hole_start, through.astype(np.float64)])
+    return np.concatenate([grouped, loose.reshape(-1, 3)])
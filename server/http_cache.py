@@ -0,0 +1,115 @@
+"""
+Validators and cache policies for file artifacts served by the API.
+
+Artifacts (GLB previews, view PNG/SVG, metadata, reports) are regenerated in
+place under stable URLs, so browsers must revalidate them, but a revalidation
+should cost a header round-trip rather than the multi-MB body. Every response
+gets a strong ETag derived from the file content; a matching ``If-None-Match``
+short-circuits to ``304 Not Modified``. Byte ranges (``Range``/``If-Range``)
+are handled by Starlette's ``FileResponse`` against the same ETag.
+
+A URL that pins the content with ``?v=<etag>`` (or an artifact that is
+written exactly once) is served as immutable instead. Endpoints that negotiate
+the representation by ``Accept`` pass a ``variant`` so each representation has
+its own ETag and caches key on ``Vary: Accept``.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
+
+REVALIDATE = "private, no-cache"
+IMMUTABLE = "private, max-age=31536000, immutable"
+VERSION_PARAM = "v"
+
+_HASH_CHUNK_BYTES = 1 << 20
+_MEMO_LIMIT = 4096
+_memo: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def content_etag(path: Path) -> str:
+    """Strong ETag for ``path``; hashes once per (path, mtime, size)."""
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _memo_lock:
+        cached = _memo.get(key)
+        if cached is not None:
+            _memo.move_to_end(key)
+            return cached
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    etag = f'"{digest.hexdigest()[:32]}"'
+    with _memo_lock:
+        _memo[key] = etag
+        while len(_memo) > _MEMO_LIMIT:
+            _memo.popitem(last=False)
+    return etag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` uses weak comparison, so ``W/"x"`` matches ``"x"``."""
+    if not if_none_match:
+        return False
+    candidates = [item.strip() for item in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def cache_control_for(request: Request, etag: str, default: str = REVALIDATE) -> str:
+    if request.query_params.get(VERSION_PARAM) == etag.strip('"'):
+        return IMMUTABLE
+    return default
+
+
+def cache_headers(
+    request: Request,
+    path: Path,
+    cache_control: str = REVALIDATE,
+    *,
+    variant: str | None = None,
+) -> Dict[str, str]:
+    """
+    ETag and Cache-Control for ``path``. ``variant`` names the representation
+    when one URL serves several (chosen by ``Accept``); each then gets its own
+    ETag and the response varies on ``Accept``.
+    """
+    etag = content_etag(path)
+    headers = {}
+    if variant:
+        etag = f'{etag[:-1]}-{variant}"'
+        headers["Vary"] = "Accept"
+    headers.update({"ETag": etag, "Cache-Control": cache_control_for(request, etag, cache_control)})
+    return headers
+
+
+def not_modified(request: Request, headers: Dict[str, str]) -> Response | None:
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+async def file_response(
+    request: Request,
+    path: Path,
+    *,
+    media_type: str | None = None,
+    filename: str | None = None,
+    cache_control: str = REVALIDATE,
+) -> Response:
+    """``FileResponse`` with a content ETag, cache policy, 304 and range support."""
+    headers = await run_in_threadpool(cache_headers, request, path, cache_control)
+    cached = not_modified(request, headers)
+    if cached is not None:
+        return cached
+    return FileResponse(path, media_type=media_type, filename=filename, headers=headers)
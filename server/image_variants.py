@@ -0,0 +1,132 @@
+"""
+Thumbnail and WebP variants of rendered view PNGs.
+
+List UIs show views at a few hundred pixels but used to download the full
+1500 px transparent PNG. Every PNG written by ``line_raster`` now queues its
+variants on a background thread, next to the original::
+
+    top.png          full raster (unchanged)
+    top.webp         full size, lossy WebP with alpha
+    top.thumb.png    THUMBNAIL_PX on the long side
+    top.thumb.webp
+
+``ensure_variant`` is the read path: it returns a fresh variant, rendering it
+inline if the background job has not caught up (or the view predates this).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+from uuid import uuid4
+
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_PX = 256
+WEBP_QUALITY = 80
+SIZES = ("full", "thumb")
+FORMATS = ("png", "webp")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def variant_path(png_path: Path, *, size: str = "full", format: str = "png") -> Path:
+    if size not in SIZES or format not in FORMATS:
+        raise ValueError(f"Unknown image variant: {size}/{format}")
+    infix = "" if size == "full" else f".{size}"
+    return png_path.with_name(f"{png_path.stem}{infix}.{format}")
+
+
+def is_fresh(variant: Path, source: Path) -> bool:
+    try:
+        return variant.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _thumbnail(image: Image.Image) -> Image.Image:
+    # Resample premultiplied so transparent pixels do not bleed dark fringes.
+    premultiplied = image.convert("RGBA").convert("RGBa")
+    premultiplied.thumbnail((THUMBNAIL_PX, THUMBNAIL_PX), Image.Resampling.LANCZOS)
+    return premultiplied.convert("RGBA")
+
+
+def _save_atomic(image: Image.Image, out_path: Path, format: str) -> None:
+    tmp_path = out_path.with_name(f".{out_path.name}.{uuid4().hex}.tmp")
+    try:
+        if format == "webp":
+            image.convert("RGBA").save(tmp_path, format="WEBP", quality=WEBP_QUALITY, method=4)
+        else:
+            image.save(tmp_path, format="PNG", optimize=True)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_variant(png_path: Path, *, size: str, format: str, image: Image.Image | None = None) -> Path:
+    out_path = variant_path(png_path, size=size, format=format)
+    if size == "full" and format == "png":
+        return png_path
+    if image is None:
+        with Image.open(png_path) as source:
+            source.load()
+            image = source.copy()
+    if size == "thumb":
+        image = _thumbnail(image)
+    _save_atomic(image, out_path, format)
+    return out_path
+
+
+def write_variants(png_path: Path, image: Image.Image | None = None) -> List[Path]:
+    """Write every non-original variant of ``png_path``."""
+    if image is None:
+        with Image.open(png_path) as source:
+            source.load()
+            image = source.copy()
+    thumb = _thumbnail(image)
+    written = [write_variant(png_path, size="full", format="webp", image=image)]
+    for format in FORMATS:
+        out_path = variant_path(png_path, size="thumb", format=format)
+        _save_atomic(thumb, out_path, format)
+        written.append(out_path)
+    return written
+
+
+def ensure_variant(png_path: Path, *, size: str = "full", format: str = "png") -> Path:
+    out_path = variant_path(png_path, size=size, format=format)
+    if out_path == png_path or is_fresh(out_path, png_path):
+        return out_path
+    return write_variant(png_path, size=size, format=format)
+
+
+def _background_write(png_path: Path, image: Image.Image, source_mtime_ns: int) -> None:
+    try:
+        if png_path.stat().st_mtime_ns != source_mtime_ns:
+            # Re-rendered since this job was queued; the newer job owns the variants.
+            return
+        write_variants(png_path, image)
+    except FileNotFoundError:
+        return
+    except Exception:
+        logger.exception("Failed to write image variants for %s", png_path)
+
+
+def schedule_variants(png_path: Path, image: Image.Image | None = None) -> Future | None:
+    """Queue variant generation for a freshly written PNG; returns the job's future."""
+    global _executor
+    try:
+        source_mtime_ns = png_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-variants")
+        executor = _executor
+    return executor.submit(_background_write, png_path, image, source_mtime_ns)
@@ -0,0 +1,117 @@
+"""
+Process-safe JSON persistence helpers.
+
+Every store under ``server/data`` is a JSON document that several uvicorn workers
+(or several replicas mounting the same data volume) may read and rewrite at the
+same time. Writes go through a unique temp file plus ``os.replace`` so readers
+never observe a half-written document, and read-modify-write cycles hold an
+exclusive advisory lock on a sidecar ``.lock`` file for their whole duration.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator
+from uuid import uuid4
+
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+
+class JsonStoreError(RuntimeError):
+    pass
+
+
+class JsonStoreLockTimeout(JsonStoreError):
+    pass
+
+
+DEFAULT_LOCK_TIMEOUT_SEC = 30.0
+_LOCK_POLL_SEC = 0.02
+
+
+def _lock_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.lock")
+
+
+def _try_lock(handle) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:  # pragma: no cover - Windows
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        return True
+    except OSError:
+        return False
+
+
+def _unlock(handle) -> None:
+    if fcntl is not None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@contextmanager
+def file_lock(path: Path, *, timeout_sec: float = DEFAULT_LOCK_TIMEOUT_SEC) -> Iterator[None]:
+    """Hold an exclusive inter-process lock guarding ``path``."""
+    lock_path = _lock_path(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + max(0.0, timeout_sec)
+    with lock_path.open("a+b") as handle:
+        while not _try_lock(handle):
+            if time.monotonic() >= deadline:
+                raise JsonStoreLockTimeout(f"Timed out waiting for lock on {path.name}.")
+            time.sleep(_LOCK_POLL_SEC)
+        try:
+            yield
+        finally:
+            _unlock(handle)
+
+
+def read_json(path: Path, default: Any = None) -> Any:
+    if not path.exists():
+        return default
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_json_atomic(path: Path, payload: Any, *, indent: int | None = 2) -> None:
+    """Write ``payload`` so concurrent readers see either the old or the new document."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=indent)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def json_transaction(
+    path: Path,
+    default_factory: Callable[[], Any],
+    *,
+    timeout_sec: float = DEFAULT_LOCK_TIMEOUT_SEC,
+) -> Iterator[Any]:
+    """
+    Lock ``path``, yield its decoded payload for in-place mutation and persist it
+    atomically when the block exits cleanly. Exceptions leave the file untouched.
+    """
+    with file_lock(path, timeout_sec=timeout_sec):
+        payload = read_json(path, default=None)
+        if payload is None:
+            payload = default_factory()
+        yield payload
+        write_json_atomic(path, payload)
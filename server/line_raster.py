@@ -0,0 +1,142 @@
+"""
+Direct line-drawing rasterizer shared by every 2D view renderer.
+
+The view pipelines used to build a 5x5 in / 300 dpi pyplot figure per view, add
+a ``LineCollection`` and save with ``bbox_inches="tight"``, which draws the
+figure twice and then encodes a full RGBA canvas. This module rasterizes
+normalized segment arrays with the Agg renderer on a bare canvas and writes the
+coverage mask as a palette PNG (one byte per pixel plus a tRNS alpha ramp).
+
+Framing is pixel-equivalent to the old output: the unit square maps
+edge-to-edge onto a 1500 x 1500 px canvas, y pointing up, and line widths are
+given in points at 300 dpi.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+from PIL import Image, ImageColor
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from .image_variants import schedule_variants
+
+DEFAULT_SIZE_PX = 1500
+DEFAULT_DPI = 300
+_ALPHA_RAMP = bytes(range(256))
+
+
+def as_segment_array(segments) -> np.ndarray:
+    """Coerce segments (or a list of per-segment pairs) into an ``(N, 2, 2)`` float array."""
+    array = np.asarray(segments, dtype=np.float64)
+    if array.size == 0:
+        return np.zeros((0, 2, 2), dtype=np.float64)
+    return array.reshape(-1, 2, 2)
+
+
+def polylines_to_segments(polylines) -> np.ndarray:
+    """Flatten ``(k, 2)`` polylines into one contiguous ``(N, 2, 2)`` segment array."""
+    pieces = [
+        np.stack([line[:-1], line[1:]], axis=1)
+        for line in (np.asarray(item, dtype=np.float64) for item in polylines)
+        if line.ndim == 2 and line.shape[0] >= 2
+    ]
+    if not pieces:
+        return np.zeros((0, 2, 2), dtype=np.float64)
+    return np.concatenate(pieces, axis=0)
+
+
+def normalize_segments(segments) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Scale segments into the unit square; returns ``(normalized, min_vals, max_vals)``."""
+    segments = as_segment_array(segments)
+    if segments.shape[0] == 0:
+        zeros = np.zeros(2, dtype=np.float64)
+        return segments, zeros, zeros
+    points = segments.reshape(-1, 2)
+    min_vals = points.min(axis=0)
+    max_vals = points.max(axis=0)
+    span = np.clip(max_vals - min_vals, 1e-5, None)
+    return (segments - min_vals) / span, min_vals, max_vals
+
+
+def rasterize_coverage(
+    segments,
+    *,
+    linewidth_pt: float,
+    size_px: int = DEFAULT_SIZE_PX,
+    dpi: int = DEFAULT_DPI,
+) -> np.ndarray:
+    """Return the anti-aliased ``uint8`` coverage mask for unit-square segments."""
+    segments = as_segment_array(segments)
+    fig = Figure(figsize=(size_px / dpi, size_px / dpi), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0.0)
+    ax = fig.add_axes((0.0, 0.0, 1.0, 1.0))
+    ax.set_axis_off()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.add_collection(LineCollection(segments, colors="#000000", linewidths=linewidth_pt))
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())[..., 3].copy()
+
+
+def coverage_to_image(coverage: np.ndarray, *, color: str) -> Image.Image:
+    """Wrap a coverage mask as a single-colour palette image with a tRNS alpha ramp."""
+    height, width = coverage.shape
+    image = Image.frombytes("P", (width, height), np.ascontiguousarray(coverage, dtype=np.uint8).tobytes())
+    image.putpalette(list(ImageColor.getrgb(color)[:3]) * 256)
+    image.info["transparency"] = _ALPHA_RAMP
+    return image
+
+
+def rasterize_segments(
+    segments,
+    *,
+    color: str,
+    linewidth_pt: float,
+    size_px: int = DEFAULT_SIZE_PX,
+    dpi: int = DEFAULT_DPI,
+) -> Image.Image:
+    """Rasterize unit-square segments to a transparent image."""
+    coverage = rasterize_coverage(segments, linewidth_pt=linewidth_pt, size_px=size_px, dpi=dpi)
+    return coverage_to_image(coverage, color=color)
+
+
+def render_segments_png(
+    segments,
+    out_path: Path,
+    *,
+    color: str,
+    linewidth_pt: float,
+    size_px: int = DEFAULT_SIZE_PX,
+    dpi: int = DEFAULT_DPI,
+    variants: bool = True,
+) -> Path:
+    """
+    Rasterize unit-square segments and write them as a transparent PNG.
+    With ``variants`` the thumbnail/WebP copies are queued in the background.
+    """
+    image = rasterize_segments(
+        segments,
+        color=color,
+        linewidth_pt=linewidth_pt,
+        size_px=size_px,
+        dpi=dpi,
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Views can be re-rendered in place while clients fetch them; swap atomically.
+    tmp_path = out_path.with_name(f".{out_path.name}.{uuid4().hex}.tmp")
+    try:
+        image.save(tmp_path, format="PNG", transparency=_ALPHA_RAMP, dpi=(dpi, dpi))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    if variants:
+        schedule_variants(out_path, image)
+    return out_path
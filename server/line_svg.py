@@ -0,0 +1,147 @@
+"""
+SVG writer for the 2D view renderers.
+
+Views are emitted as a single ``<path>`` built straight from the unit-square
+segment arrays used for the PNG raster, framed identically (1500 x 1500 px,
+y pointing up, stroke widths in points at 300 dpi) so the SVG can replace the
+PNG in the drawing canvas and be zoomed without re-rendering.
+
+Coordinates are quantized onto an integer grid (``QUANT_PER_PX`` steps per
+pixel), which makes duplicate and degenerate segments exact to detect and lets
+consecutive collinear segments be merged into one path run. Path data uses
+relative integer moves to keep the files small.
+"""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+from .line_raster import DEFAULT_DPI, DEFAULT_SIZE_PX, as_segment_array
+
+QUANT_PER_PX = 10
+
+
+def quantize_segments(segments, *, size_px: int = DEFAULT_SIZE_PX, quant_per_px: int = QUANT_PER_PX) -> np.ndarray:
+    """
+    Map unit-square segments onto the integer SVG grid (y flipped) and drop
+    zero-length and repeated segments, keeping the first occurrence order.
+    """
+    segments = as_segment_array(segments)
+    if segments.shape[0] == 0:
+        return np.zeros((0, 2, 2), dtype=np.int64)
+    scale = size_px * quant_per_px
+    grid = np.empty(segments.shape, dtype=np.int64)
+    grid[..., 0] = np.rint(segments[..., 0] * scale)
+    grid[..., 1] = np.rint((1.0 - segments[..., 1]) * scale)
+
+    grid = grid[np.any(grid[:, 0] != grid[:, 1], axis=1)]
+    if grid.shape[0] == 0:
+        return grid
+    # Undirected duplicate detection: order each segment's endpoints canonically.
+    flat = grid.reshape(-1, 4)
+    swap = (flat[:, 0] > flat[:, 2]) | ((flat[:, 0] == flat[:, 2]) & (flat[:, 1] > flat[:, 3]))
+    canonical = np.where(swap[:, None], flat[:, [2, 3, 0, 1]], flat)
+    _, first = np.unique(canonical, axis=0, return_index=True)
+    return grid[np.sort(first)]
+
+
+def _run_points(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Chain consecutive segments that share an endpoint into polylines and drop
+    the interior vertices of collinear, same-direction runs.
+
+    Returns the kept vertices in drawing order and a mask flagging the first
+    vertex of every run.
+    """
+    starts = grid[:, 0]
+    ends = grid[:, 1]
+    joined = np.all(starts[1:] == ends[:-1], axis=1)
+
+    direction = ends - starts
+    cross = direction[:-1, 0] * direction[1:, 1] - direction[:-1, 1] * direction[1:, 0]
+    dot = np.einsum("ij,ij->i", direction[:-1], direction[1:])
+
+    run_start = np.ones(grid.shape[0], dtype=bool)
+    run_start[1:] = ~joined
+    # The end vertex of segment i disappears when segment i + 1 simply extends it.
+    keep_end = np.ones(grid.shape[0], dtype=bool)
+    keep_end[:-1] = ~(joined & (cross == 0) & (dot > 0))
+
+    points = grid.reshape(-1, 2)
+    keep = np.stack([run_start, keep_end], axis=1).ravel()
+    first = np.stack([run_start, np.zeros_like(run_start)], axis=1).ravel()
+    return points[keep], first[keep]
+
+
+def merge_runs(grid: np.ndarray) -> list[np.ndarray]:
+    """Split the merged vertex stream into one ``(k, 2)`` array per polyline."""
+    if grid.shape[0] == 0:
+        return []
+    points, first = _run_points(grid)
+    return np.split(points, np.flatnonzero(first)[1:])
+
+
+def path_data(grid: np.ndarray) -> str:
+    """Encode quantized segments as compact SVG path data with relative line-tos."""
+    if grid.shape[0] == 0:
+        return ""
+    points, first = _run_points(grid)
+    deltas = np.diff(points, axis=0, prepend=points[:1])
+    values = np.where(first[:, None], points, deltas).tolist()
+    # "M x y" opens a run and the following "l" covers all of its deltas.
+    templates = np.where(first, "M{} {}l", " {} {}")
+    after_move = np.zeros(first.shape[0], dtype=bool)
+    after_move[1:] = first[:-1]
+    templates[after_move] = "{} {}"
+    return "".join(template.format(x, y) for template, (x, y) in zip(templates.tolist(), values))
+
+
+def segments_to_svg(
+    segments,
+    *,
+    color: str,
+    linewidth_pt: float,
+    size_px: int = DEFAULT_SIZE_PX,
+    dpi: int = DEFAULT_DPI,
+    quant_per_px: int = QUANT_PER_PX,
+) -> str:
+    """Build an SVG document for unit-square segments."""
+    grid = quantize_segments(segments, size_px=size_px, quant_per_px=quant_per_px)
+    extent = size_px * quant_per_px
+    stroke = linewidth_pt * dpi / 72.0 * quant_per_px
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size_px}" height="{size_px}" '
+        f'viewBox="0 0 {extent} {extent}">'
+        f'<path d="{path_data(grid)}" fill="none" stroke="{color}" stroke-width="{stroke:.4g}" '
+        'stroke-linecap="butt" stroke-linejoin="round"/></svg>\n'
+    )
+
+
+def render_segments_svg(
+    segments,
+    out_path: Path,
+    *,
+    color: str,
+    linewidth_pt: float,
+    size_px: int = DEFAULT_SIZE_PX,
+    dpi: int = DEFAULT_DPI,
+) -> Path:
+    """Write unit-square segments as an SVG file next to the raster output."""
+    document = segments_to_svg(segments, color=color, linewidth_pt=linewidth_pt, size_px=size_px, dpi=dpi)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_text(document, encoding="utf-8")
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return out_path
+
+
+def svg_path_for(png_path: Path) -> Path:
+    """Location of the SVG rendition written next to a view PNG."""
+    return png_path.with_suffix(".svg")
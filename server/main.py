@@ -1,22 +1,24 @@
 from __future__ import annotations
 
-import io
+import itertools
+import json
 import logging
 import os
 import shutil
-import zipfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Literal
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from .analysis_runs import AnalysisRunNotFoundError, AnalysisRunStore, AnalysisRunStoreError
 from .cad_service import CADProcessingError, CADService
-from .cad_service_occ import CADServiceOCC
+from .cad_service_occ import DEFAULT_LINE_STYLE, CADServiceOCC, LineStyle
 from .cnc_analysis import CncAnalysisError, CncAnalysisService, CncReportNotFoundError
 from .draftlint_demo import (
     DraftLintDemoError,
@@ -34,7 +36,7 @@ from .dfm_planning import (
     plan_dfm_execution,
     plan_dfm_execution_with_template_catalog,
 )
-from .dfm_review_v2 import DfmReviewV2Body, DfmReviewV2Error, generate_dfm_review_v2
+from .dfm_review_v2 import DfmReviewV2Body, DfmReviewV2Error, generate_dfm_review_v2, review_fact_keys
 from .dfm_template_store import (
     DfmTemplateNotFoundError,
     DfmTemplateStore,
@@ -46,9 +48,11 @@ from .fusion_analysis import (
     FusionReportNotFoundError,
     vision_report_matches_component,
 )
-from .model_store import ModelStore
+from .line_svg import svg_path_for
+from .model_store import ModelMetadata, ModelNotFoundError, ModelStore
 from .part_facts import PartFactsError, PartFactsService
 from .review_store import ReviewStore
+from . import http_cache, image_variants, section_stack, view_metadata, view_tiles, zip_stream
 from .vision_analysis import (
     VisionAnalysisError,
     VisionAnalysisService,
@@ -58,7 +62,8 @@ from .vision_analysis import (
 )
 
 BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "data"
+# Point every worker/replica at the same (shared) volume to scale horizontally.
+DATA_DIR = Path(os.getenv("RAPIDDRAFT_DATA_DIR") or BASE_DIR / "data")
 MODELS_DIR = DATA_DIR / "models"
 PROCESS_DIR = DATA_DIR / "processing"
 WEB_DIST_DIR = BASE_DIR.parent / "web" / "dist"
@@ -131,7 +136,12 @@ try:
 except DfmBundleValidationError as exc:
     raise RuntimeError(f"DFM bundle validation failed during startup: {exc}") from exc
 
-part_facts_service = PartFactsService(root=MODELS_DIR, bundle=DFM_BUNDLE)
+# Bulk part-facts workers each keep a whole STEP in memory, so they are capped
+# separately from the HLR workers (RAPIDDRAFT_HLR_WORKERS).
+_part_facts_workers = os.getenv("RAPIDDRAFT_PART_FACTS_WORKERS", "").strip()
+PART_FACTS_WORKERS = int(_part_facts_workers) if _part_facts_workers.isdigit() else os.cpu_count() or 1
+
+part_facts_service = PartFactsService(root=MODELS_DIR, bundle=DFM_BUNDLE, bulk_workers=PART_FACTS_WORKERS)
 dfm_template_store = DfmTemplateStore(root=MODELS_DIR, bundle=DFM_BUNDLE)
 
 
@@ -188,6 +198,11 @@ class ComponentProfileBody(BaseModel):
     industry: str
 
 
+class PartFactsBulkBody(BaseModel):
+    component_node_names: list[str] | None = None
+    force_refresh: bool = False
+
+
 class DfmPlanBody(BaseModel):
     extracted_part_facts: dict[str, object] = Field(default_factory=dict)
     analysis_mode: str | None = None
@@ -259,6 +274,15 @@ class VisionProviderBody(BaseModel):
 
 class CreateVisionViewSetBody(BaseModel):
     component_node_name: str | None = None
+    quality: Literal["exact", "fast"] = "exact"
+    upgrade_exact: bool = True
+    renderer: Literal["hlr", "shaded"] = "hlr"
+
+
+class SectionStackBody(BaseModel):
+    axis: Literal["x", "y", "z"] = "z"
+    count: int = Field(default=8, ge=1, le=section_stack.MAX_SECTION_SLICES)
+    component_node_name: str | None = None
 
 
 class VisionPastedImageBody(BaseModel):
@@ -307,6 +331,16 @@ def _require_model(model_id: str) -> None:
         raise HTTPException(status_code=404, detail="Model not found")
 
 
+@contextmanager
+def _model_transaction(model_id: str) -> Iterator[ModelMetadata]:
+    """``model_store.transaction`` for endpoints; a model removed since the lookup is a 404."""
+    try:
+        with model_store.transaction(model_id) as metadata:
+            yield metadata
+    except ModelNotFoundError:
+        raise HTTPException(status_code=404, detail="Model not found")
+
+
 def _raise_optional_service_unavailable(service_name: str) -> None:
     detail = _OPTIONAL_SERVICE_STARTUP_ERRORS.get(service_name, "Service is unavailable.")
     raise HTTPException(status_code=503, detail=f"{service_name} unavailable: {detail}")
@@ -457,27 +491,49 @@ def _generate_dfm_review_v2_payload(
     if planning_inputs and component_node_name:
         extracted_facts = planning_inputs.get("extracted_part_facts")
         if not isinstance(extracted_facts, dict) or not extracted_facts:
-            try:
-                part_facts_payload = part_facts_service.get_or_create(
-                    model_id=model_id,
-                    step_path=metadata.step_path,
-                    component_node_name=component_node_name,
-                    component_display_name=str(component_display_name),
+
+            def extract_part_facts(fact_keys: set[str]) -> dict[str, Any]:
+                try:
+                    part_facts_payload = part_facts_service.get_or_create(
+                        model_id=model_id,
+                        step_path=metadata.step_path,
+                        component_node_name=component_node_name,
+                        component_display_name=str(component_display_name),
+                        component_profile=component_profile,
+                        triangle_count=(component or {}).get("triangleCount") if component else None,
+                        assembly_component_count=len(metadata.components),
+                        force_refresh=False,
+                        fact_keys=fact_keys,
+                    )
+                except PartFactsError as exc:
+                    raise HTTPException(
+                        status_code=500,
+                        detail=f"Failed to resolve part facts for DFM review: {exc}",
+                    )
+                return build_extracted_facts_from_part_facts(
+                    part_facts_payload=part_facts_payload,
                     component_profile=component_profile,
-                    triangle_count=(component or {}).get("triangleCount") if component else None,
-                    assembly_component_count=len(metadata.components),
-                    force_refresh=False,
+                    context_payload=context_payload,
                 )
-            except PartFactsError as exc:
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Failed to resolve part facts for DFM review: {exc}",
+
+            # Extract what the process classifier needs to plan, then only
+            # what the planned rules and the cost model read. Other facts are
+            # filled in when the full part facts are requested.
+            fact_keys = set(DFM_BUNDLE.process_classifier.get("input_facts", []))
+            planning_inputs["extracted_part_facts"] = extract_part_facts(fact_keys)
+            try:
+                fact_keys |= review_fact_keys(
+                    DFM_BUNDLE,
+                    planning_inputs=planning_inputs,
+                    selected_execution_plan_id=body.selected_execution_plan_id,
+                    context_payload=context_payload,
+                    cost_enabled=DFM_COST_ENABLED,
                 )
-            planning_inputs["extracted_part_facts"] = build_extracted_facts_from_part_facts(
-                part_facts_payload=part_facts_payload,
-                component_profile=component_profile,
-                context_payload=context_payload,
-            )
+            except (DfmReviewV2Error, DfmPlanningError):
+                # generate_dfm_review_v2 reports the same error below.
+                pass
+            else:
+                planning_inputs["extracted_part_facts"] = extract_part_facts(fact_keys)
     execution_plans = (
         [plan.dict() for plan in body.execution_plans]
         if body.execution_plans
@@ -573,7 +629,7 @@ async def get_draftlint_report(report_id: str):
 
 
 @app.get("/api/draftlint/reports/{report_id}/artifacts/{artifact_name}")
-async def get_draftlint_report_artifact(report_id: str, artifact_name: str):
+async def get_draftlint_report_artifact(report_id: str, artifact_name: str, request: Request):
     try:
         artifact_path = draftlint_demo_service.get_artifact_path(
             report_id=report_id,
@@ -594,7 +650,8 @@ async def get_draftlint_report_artifact(report_id: str, artifact_name: str):
     elif artifact_path.suffix.lower() == ".png":
         media_type = "image/png"
 
-    return FileResponse(
+    return await http_cache.file_response(
+        request,
         artifact_path,
         media_type=media_type,
         filename=artifact_path.name,
@@ -708,13 +765,28 @@ async def upsert_component_profile(model_id: str, node_name: str, body: Componen
     if body.industry and body.industry not in industry_labels:
         raise HTTPException(status_code=400, detail="Invalid industry")
 
-    metadata.component_profiles[node_name] = {
+    profile = {
         "material": body.material,
         "manufacturingProcess": body.manufacturing_process,
         "industry": body.industry,
     }
-    model_store.update(metadata)
-    return {"nodeName": node_name, "profile": metadata.component_profiles[node_name]}
+    with _model_transaction(model_id) as current:
+        current.component_profiles[node_name] = profile
+
+    # Only the context layer depends on the profile; reuse cached geometry.
+    try:
+        part_facts_service.refresh_context(
+            model_id=model_id,
+            step_path=metadata.step_path,
+            component_node_name=node_name,
+            component_display_name=str(component.get("displayName") or node_name),
+            component_profile=profile,
+            triangle_count=component.get("triangleCount"),
+            assembly_component_count=len(metadata.components),
+        )
+    except PartFactsError:
+        pass
+    return {"nodeName": node_name, "profile": profile}
 
 
 @app.get("/api/models/{model_id}/components/{node_name}/part-facts")
@@ -742,8 +814,65 @@ async def get_component_part_facts(model_id: str, node_name: str):
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.post("/api/models/{model_id}/part-facts/bulk")
+async def bulk_component_part_facts(model_id: str, body: PartFactsBulkBody | None = None):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+
+    body = body or PartFactsBulkBody()
+    components = metadata.components
+    if body.component_node_names is not None:
+        components = []
+        for node_name in body.component_node_names:
+            component = _get_component_entry(metadata, node_name)
+            if not component:
+                raise HTTPException(status_code=400, detail=f"Unknown component node_name: {node_name}")
+            components.append(component)
+
+    records = part_facts_service.iter_many(
+        model_id=model_id,
+        step_path=metadata.step_path,
+        components=[
+            {
+                "component_node_name": component["nodeName"],
+                "component_display_name": str(component.get("displayName") or component["nodeName"]),
+                "component_profile": metadata.component_profiles.get(component["nodeName"], {}),
+                "triangle_count": component.get("triangleCount"),
+            }
+            for component in components
+        ],
+        assembly_component_count=len(metadata.components),
+        force_refresh=body.force_refresh,
+    )
+    # One JSON object per line, flushed as each component finishes.
+    return StreamingResponse(
+        (json.dumps(record) + "\n" for record in records),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.get("/api/models/{model_id}/components/{node_name}/part-facts/thickness-map")
+async def get_component_thickness_map(model_id: str, node_name: str, request: Request):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    if not _get_component_entry(metadata, node_name):
+        raise HTTPException(status_code=400, detail="Unknown component node_name")
+
+    path = part_facts_service.thickness_map_path(model_id=model_id, component_node_name=node_name)
+    if not path.exists():
+        raise HTTPException(status_code=404, detail="Thickness map not generated; refresh part facts.")
+    return await http_cache.file_response(
+        request,
+        path,
+        media_type="model/gltf-binary",
+        filename=f"{model_id}-{node_name}-thickness.glb",
+    )
+
+
 @app.post("/api/models/{model_id}/components/{node_name}/part-facts/refresh")
-async def refresh_component_part_facts(model_id: str, node_name: str):
+async def refresh_component_part_facts(model_id: str, node_name: str, force: bool = Query(default=False)):
     metadata = model_store.get(model_id)
     if not metadata:
         raise HTTPException(status_code=404, detail="Model not found")
@@ -761,7 +890,8 @@ async def refresh_component_part_facts(model_id: str, node_name: str):
             component_profile=metadata.component_profiles.get(node_name, {}),
             triangle_count=component.get("triangleCount"),
             assembly_component_count=len(metadata.components),
-            force_refresh=True,
+            # Recomputes only the layers whose stamped inputs changed unless forced.
+            force_refresh=force,
         )
     except PartFactsError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
@@ -822,7 +952,7 @@ async def get_cnc_geometry_report(model_id: str, report_id: str):
 
 
 @app.get("/api/models/{model_id}/cnc/reports/{report_id}/pdf")
-async def get_cnc_geometry_report_pdf(model_id: str, report_id: str):
+async def get_cnc_geometry_report_pdf(model_id: str, report_id: str, request: Request):
     _require_model(model_id)
     try:
         pdf_path = cnc_analysis_service.get_report_pdf_path(
@@ -833,10 +963,13 @@ async def get_cnc_geometry_report_pdf(model_id: str, report_id: str):
         raise HTTPException(status_code=404, detail=str(exc))
     except CncAnalysisError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
-    return FileResponse(
+    # Report ids are never reused, so the PDF under this URL never changes.
+    return await http_cache.file_response(
+        request,
         pdf_path,
         media_type="application/pdf",
         filename=f"{report_id}.pdf",
+        cache_control=http_cache.IMMUTABLE,
     )
 
 
@@ -864,6 +997,10 @@ async def create_vision_view_set(model_id: str, body: CreateVisionViewSetBody):
             step_path=metadata.step_path,
             component_node_name=body.component_node_name,
             component_solid_index=component_solid_index,
+            quality=body.quality,
+            upgrade_exact=body.upgrade_exact,
+            renderer=body.renderer,
+            mesh_path=metadata.preview_path,
         )
     except VisionAnalysisError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -1080,8 +1217,27 @@ async def get_analysis_run_manifest(model_id: str, analysis_run_id: str):
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@app.get("/api/models/{model_id}/vision/view-sets/{view_set_id}")
+async def get_vision_view_set_status(model_id: str, view_set_id: str):
+    _require_model(model_id)
+    vision_service = _require_vision_service()
+    try:
+        return vision_service.get_view_set_status(model_id=model_id, view_set_id=view_set_id)
+    except VisionViewSetMissingError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except VisionAnalysisError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @app.get("/api/models/{model_id}/vision/view-sets/{view_set_id}/views/{view_name}")
-async def get_vision_view_image(model_id: str, view_set_id: str, view_name: str):
+async def get_vision_view_image(
+    model_id: str,
+    view_set_id: str,
+    view_name: str,
+    request: Request,
+    format: str = Query(default="png"),
+    size: str = Query(default="full"),
+):
     _require_model(model_id)
     vision_service = _require_vision_service()
     try:
@@ -1095,10 +1251,15 @@ async def get_vision_view_image(model_id: str, view_set_id: str, view_name: str)
     except VisionAnalysisError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    return FileResponse(
-        image_path,
-        media_type="image/png",
-        filename=f"{view_set_id}_{view_name}.png",
+    if format not in image_variants.FORMATS or size not in image_variants.SIZES:
+        raise HTTPException(status_code=400, detail="format must be 'png' or 'webp' and size 'full' or 'thumb'.")
+    variant = await run_in_threadpool(image_variants.ensure_variant, image_path, size=size, format=format)
+    suffix = "" if size == "full" else f"_{size}"
+    return await http_cache.file_response(
+        request,
+        variant,
+        media_type=f"image/{format}",
+        filename=f"{view_set_id}_{view_name}{suffix}.{format}",
     )
 
 
@@ -1274,7 +1435,7 @@ async def upload_model(file: UploadFile = File(...)):
 
 
 @app.post("/api/models/{model_id}/views")
-async def generate_views(model_id: str):
+async def generate_views(model_id: str, tiles: bool = Query(default=False)):
     metadata = model_store.get(model_id)
     if not metadata:
         raise HTTPException(status_code=404, detail="Model not found")
@@ -1283,9 +1444,11 @@ async def generate_views(model_id: str):
     except CADProcessingError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    metadata.views = view_files
-    metadata.view_metadata = meta_files
-    model_store.update(metadata)
+    with _model_transaction(model_id) as current:
+        current.views = view_files
+        current.view_metadata = meta_files
+    if tiles:
+        _prewarm_view_tiles(metadata, "views", meta_files)
 
     views_response = {name: f"/api/models/{model_id}/views/{name}" for name in view_files.keys()}
     meta_response = {name: f"/api/models/{model_id}/views/{name}/metadata" for name in meta_files.keys()}
@@ -1293,7 +1456,7 @@ async def generate_views(model_id: str):
 
 
 @app.post("/api/models/{model_id}/shape2d")
-async def generate_shape2d_views(model_id: str):
+async def generate_shape2d_views(model_id: str, tiles: bool = Query(default=False)):
     metadata = model_store.get(model_id)
     if not metadata:
         raise HTTPException(status_code=404, detail="Model not found")
@@ -1302,9 +1465,11 @@ async def generate_shape2d_views(model_id: str):
     except CADProcessingError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    metadata.shape_views = view_files
-    metadata.shape_view_metadata = meta_files
-    model_store.update(metadata)
+    with _model_transaction(model_id) as current:
+        current.shape_views = view_files
+        current.shape_view_metadata = meta_files
+    if tiles:
+        _prewarm_view_tiles(metadata, "shape2d", meta_files)
 
     views_response = {name: f"/api/models/{model_id}/shape2d/{name}" for name in view_files.keys()}
     meta_response = {name: f"/api/models/{model_id}/shape2d/{name}/metadata" for name in meta_files.keys()}
@@ -1312,11 +1477,12 @@ async def generate_shape2d_views(model_id: str):
 
 
 @app.get("/api/models/{model_id}/preview")
-async def preview_model(model_id: str):
+async def preview_model(model_id: str, request: Request):
     metadata = model_store.get(model_id)
     if not metadata or not metadata.preview_path.exists():
         raise HTTPException(status_code=404, detail="Preview not found")
-    return FileResponse(
+    return await http_cache.file_response(
+        request,
         metadata.preview_path,
         media_type="model/gltf-binary",
         filename=f"{metadata.model_id}-preview.glb",
@@ -1324,77 +1490,231 @@ async def preview_model(model_id: str):
 
 
 @app.get("/api/models/{model_id}/views/{view_name}")
-async def fetch_view(model_id: str, view_name: str):
+async def fetch_view(model_id: str, view_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.views:
         raise HTTPException(status_code=404, detail="View not found")
 
-    file_path = metadata.views[view_name]
+    return await _view_image_response(metadata.views[view_name], request=request, format=format, size=size, missing_detail="View image missing on disk")
+
+
+async def _view_image_response(file_path: Path, *, request: Request, format: str, size: str = "full", missing_detail: str):
+    """Serve a rendered view as the PNG raster, its SVG twin, or a WebP/thumbnail variant."""
+    requested = (format or "png").strip().lower()
+    requested_size = (size or "full").strip().lower()
+    if requested not in {"png", "svg", "webp"}:
+        raise HTTPException(status_code=400, detail="format must be 'png', 'svg' or 'webp'.")
+    if requested_size not in image_variants.SIZES:
+        raise HTTPException(status_code=400, detail="size must be 'full' or 'thumb'.")
     if not file_path.exists():
-        raise HTTPException(status_code=404, detail="View image missing on disk")
-    return FileResponse(file_path, media_type="image/png")
+        raise HTTPException(status_code=404, detail=missing_detail)
+    if requested == "svg":
+        # Vector output is resolution independent; every size is the same file.
+        svg_path = svg_path_for(file_path)
+        if not svg_path.exists():
+            raise HTTPException(status_code=404, detail=f"{missing_detail} (SVG not generated; regenerate the views)")
+        return await http_cache.file_response(request, svg_path, media_type="image/svg+xml")
+    variant = await run_in_threadpool(image_variants.ensure_variant, file_path, size=requested_size, format=requested)
+    return await http_cache.file_response(request, variant, media_type=f"image/{requested}")
+
+
+async def _view_metadata_response(file_path: Path, *, request: Request, format: str | None, missing_detail: str):
+    """Serve view metadata as JSON (default) or as the memory-mapped binary container."""
+    requested = (format or "").strip().lower()
+    if not requested:
+        accept = request.headers.get("accept", "")
+        requested = "binary" if view_metadata.MEDIA_TYPE in accept else "json"
+    if requested not in {"json", "binary"}:
+        raise HTTPException(status_code=400, detail="format must be 'json' or 'binary'.")
+    if not view_metadata.exists(file_path):
+        raise HTTPException(status_code=404, detail=missing_detail)
+
+    try:
+        if requested == "json":
+            source = view_metadata.json_source(file_path)
+            # Decoding happens before the first chunk; a corrupt file fails the request, not the stream.
+            chunks = view_metadata.iter_json_chunks(file_path)
+            first = await run_in_threadpool(next, chunks, b"")
+        else:
+            source = await run_in_threadpool(view_metadata.ensure_binary, file_path)
+    except view_metadata.ViewMetadataNotFoundError:
+        raise HTTPException(status_code=404, detail=missing_detail)
+    except view_metadata.ViewMetadataError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    # Both representations share this URL, so each needs its own validator.
+    headers = await run_in_threadpool(http_cache.cache_headers, request, source, variant=requested)
+    cached = http_cache.not_modified(request, headers)
+    if cached is not None:
+        return cached
+    if requested == "json":
+        # Encoded while streaming, so the length is not known up front.
+        return StreamingResponse(itertools.chain((first,), chunks), media_type="application/json", headers=headers)
+    return StreamingResponse(
+        view_metadata.iter_mapped_chunks(source),
+        media_type=view_metadata.MEDIA_TYPE,
+        headers={**headers, "Content-Length": str(source.stat().st_size)},
+    )
+
 
 @app.get("/api/models/{model_id}/views/{view_name}/metadata")
-async def fetch_view_metadata(model_id: str, view_name: str):
+async def fetch_view_metadata(model_id: str, view_name: str, request: Request, format: str | None = Query(default=None)):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.view_metadata:
         raise HTTPException(status_code=404, detail="Metadata not found")
-    file_path = metadata.view_metadata[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Metadata file missing on disk")
-    return FileResponse(file_path, media_type="application/json")
+    return await _view_metadata_response(
+        metadata.view_metadata[view_name],
+        request=request,
+        format=format,
+        missing_detail="Metadata file missing on disk",
+    )
+
+
+# Tile pyramids exist for the view families whose metadata carries their segments.
+_TILE_FAMILIES = {"views": "view_metadata", "shape2d": "shape_view_metadata"}
+
+
+def _tile_cache_root(metadata, family: str, view_name: str) -> Path:
+    return metadata.step_path.parent / "tiles" / family / view_name
+
+
+def _tile_pyramid(metadata, family: str, view_name: str) -> view_tiles.ViewTilePyramid:
+    meta_path = getattr(metadata, _TILE_FAMILIES[family]).get(view_name)
+    if meta_path is None:
+        raise HTTPException(status_code=404, detail="View not found")
+    try:
+        return view_tiles.ViewTilePyramid(meta_path, _tile_cache_root(metadata, family, view_name))
+    except view_tiles.ViewTileNotFoundError:
+        raise HTTPException(status_code=404, detail="View metadata missing on disk")
+
+
+def _prewarm_view_tiles(metadata, family: str, meta_files: dict[str, Path]) -> None:
+    for view_name, meta_path in meta_files.items():
+        try:
+            view_tiles.ViewTilePyramid(meta_path, _tile_cache_root(metadata, family, view_name)).prewarm()
+        except view_tiles.ViewTileError as exc:
+            logger.warning("Skipping tile prewarm for %s/%s: %s", family, view_name, exc)
+
+
+async def _view_tiles_descriptor(model_id: str, family: str, view_name: str):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    pyramid = _tile_pyramid(metadata, family, view_name)
+    return {
+        **pyramid.describe(),
+        "url": f"/api/models/{model_id}/{family}/{view_name}/tiles/{{z}}/{{x}}/{{y}}",
+    }
+
+
+async def _view_tile_response(model_id: str, family: str, view_name: str, z: int, x: int, y: int, request: Request):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    pyramid = _tile_pyramid(metadata, family, view_name)
+    try:
+        tile_path = await run_in_threadpool(pyramid.get, z, x, y)
+    except view_tiles.ViewTileNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    except view_tiles.ViewTileError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+    return await http_cache.file_response(request, tile_path, media_type="image/png")
+
+
+@app.get("/api/models/{model_id}/views/{view_name}/tiles")
+async def fetch_view_tiles(model_id: str, view_name: str):
+    return await _view_tiles_descriptor(model_id, "views", view_name)
+
+
+@app.get("/api/models/{model_id}/views/{view_name}/tiles/{z}/{x}/{y}")
+async def fetch_view_tile(model_id: str, view_name: str, z: int, x: int, y: int, request: Request):
+    return await _view_tile_response(model_id, "views", view_name, z, x, y, request)
+
+
+@app.get("/api/models/{model_id}/shape2d/{view_name}/tiles")
+async def fetch_shape2d_view_tiles(model_id: str, view_name: str):
+    return await _view_tiles_descriptor(model_id, "shape2d", view_name)
+
+
+@app.get("/api/models/{model_id}/shape2d/{view_name}/tiles/{z}/{x}/{y}")
+async def fetch_shape2d_view_tile(model_id: str, view_name: str, z: int, x: int, y: int, request: Request):
+    return await _view_tile_response(model_id, "shape2d", view_name, z, x, y, request)
 
 
 @app.get("/api/models/{model_id}/shape2d/{view_name}")
-async def fetch_shape2d_view(model_id: str, view_name: str):
+async def fetch_shape2d_view(model_id: str, view_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.shape_views:
         raise HTTPException(status_code=404, detail="View not found")
 
-    file_path = metadata.shape_views[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Shape2D view missing on disk")
-    return FileResponse(file_path, media_type="image/png")
+    return await _view_image_response(metadata.shape_views[view_name], request=request, format=format, size=size, missing_detail="Shape2D view missing on disk")
 
 @app.get("/api/models/{model_id}/shape2d/{view_name}/metadata")
-async def fetch_shape2d_view_metadata(model_id: str, view_name: str):
+async def fetch_shape2d_view_metadata(model_id: str, view_name: str, request: Request, format: str | None = Query(default=None)):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.shape_view_metadata:
         raise HTTPException(status_code=404, detail="Metadata not found")
-    file_path = metadata.shape_view_metadata[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Shape2D metadata missing on disk")
-    return FileResponse(file_path, media_type="application/json")
+    return await _view_metadata_response(
+        metadata.shape_view_metadata[view_name],
+        request=request,
+        format=format,
+        missing_detail="Shape2D metadata missing on disk",
+    )
 
 
 @app.post("/api/models/{model_id}/occ_views")
-async def generate_occ_views(model_id: str):
+async def generate_occ_views(
+    model_id: str,
+    quality: Literal["exact", "fast"] = Query(default="exact"),
+    upgrade: bool = Query(default=True),
+    line_color: str = Query(default=DEFAULT_LINE_STYLE.color, pattern=r"^#[0-9a-fA-F]{6}$"),
+    line_width_pt: float = Query(default=DEFAULT_LINE_STYLE.linewidth_pt, gt=0, le=5),
+):
     metadata = model_store.get(model_id)
     if not metadata:
         raise HTTPException(status_code=404, detail="Model not found")
     occ_service = _require_occ_service()
     try:
-        view_files = occ_service.generate_occ_views(metadata.step_path, metadata.step_path.parent / "occ_views")
+        view_files, timings = occ_service.generate_occ_views_with_timings(
+            metadata.step_path,
+            metadata.step_path.parent / "occ_views",
+            quality=quality,
+            upgrade_exact=upgrade,
+            style=LineStyle(color=line_color, linewidth_pt=line_width_pt),
+        )
     except CADProcessingError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    metadata.occ_views = view_files
-    model_store.update(metadata)
+    with _model_transaction(model_id) as current:
+        current.occ_views = view_files
 
     views_response = {name: f"/api/models/{model_id}/occ_views/{name}" for name in view_files.keys()}
-    return {"modelId": model_id, "views": views_response}
+    return {
+        "modelId": model_id,
+        "views": views_response,
+        "timings": timings,
+        "status": occ_service.read_views_status(metadata.step_path.parent / "occ_views"),
+    }
+
+
+@app.get("/api/models/{model_id}/occ_views/status")
+async def fetch_occ_views_status(model_id: str):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    occ_service = _require_occ_service()
+    status = occ_service.read_views_status(metadata.step_path.parent / "occ_views")
+    if status is None:
+        raise HTTPException(status_code=404, detail="OCC views not generated yet")
+    return status
 
 
 @app.get("/api/models/{model_id}/occ_views/{view_name}")
-async def fetch_occ_view(model_id: str, view_name: str):
+async def fetch_occ_view(model_id: str, view_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.occ_views:
         raise HTTPException(status_code=404, detail="View not found")
 
-    file_path = metadata.occ_views[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="OCC view missing on disk")
-    return FileResponse(file_path, media_type="image/png")
+    return await _view_image_response(metadata.occ_views[view_name], request=request, format=format, size=size, missing_detail="OCC view missing on disk")
 
 
 @app.post("/api/models/{model_id}/mid_views")
@@ -1408,23 +1728,88 @@ async def generate_mid_views(model_id: str):
     except CADProcessingError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    metadata.mid_views = view_files
-    model_store.update(metadata)
+    with _model_transaction(model_id) as current:
+        current.mid_views = view_files
 
     views_response = {name: f"/api/models/{model_id}/mid_views/{name}" for name in view_files.keys()}
     return {"modelId": model_id, "views": views_response}
 
 
 @app.get("/api/models/{model_id}/mid_views/{view_name}")
-async def fetch_mid_view(model_id: str, view_name: str):
+async def fetch_mid_view(model_id: str, view_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.mid_views:
         raise HTTPException(status_code=404, detail="View not found")
 
-    file_path = metadata.mid_views[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Mid view missing on disk")
-    return FileResponse(file_path, media_type="image/png")
+    return await _view_image_response(metadata.mid_views[view_name], request=request, format=format, size=size, missing_detail="Mid view missing on disk")
+
+
+def _section_stack_dir(metadata, stack_id: str) -> Path:
+    if not section_stack.is_stack_id(stack_id):
+        raise HTTPException(status_code=404, detail="Section stack not found")
+    return metadata.step_path.parent / "section_stacks" / stack_id
+
+
+@app.post("/api/models/{model_id}/section_stacks")
+async def generate_section_stack(model_id: str, body: SectionStackBody):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    occ_service = _require_occ_service()
+    stack_id = section_stack.stack_id_for(body.axis, body.count, body.component_node_name)
+    try:
+        result = occ_service.generate_section_stack(
+            metadata.step_path,
+            _section_stack_dir(metadata, stack_id),
+            axis=body.axis,
+            count=body.count,
+            component_node_name=body.component_node_name,
+        )
+    except CADProcessingError as exc:
+        raise HTTPException(status_code=500, detail=str(exc))
+
+    base_url = f"/api/models/{model_id}/section_stacks/{stack_id}"
+    return {
+        "modelId": model_id,
+        "stackId": stack_id,
+        "axis": result["axis"],
+        "positions": result["positions"],
+        "sliceSegmentCounts": result["slice_segment_counts"],
+        "slices": {name: f"{base_url}/slices/{name}" for name in result["views"].keys()},
+        "metadata": f"{base_url}/metadata",
+        "timings": result["timings"],
+    }
+
+
+@app.get("/api/models/{model_id}/section_stacks/{stack_id}/metadata")
+async def fetch_section_stack_metadata(
+    model_id: str, stack_id: str, request: Request, format: str | None = Query(default=None)
+):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    return await _view_metadata_response(
+        _section_stack_dir(metadata, stack_id) / section_stack.STACK_METADATA_FILENAME,
+        request=request,
+        format=format,
+        missing_detail="Section stack not found",
+    )
+
+
+@app.get("/api/models/{model_id}/section_stacks/{stack_id}/slices/{slice_name}")
+async def fetch_section_stack_slice(model_id: str, stack_id: str, slice_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
+    metadata = model_store.get(model_id)
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Model not found")
+    if not section_stack.is_slice_name(slice_name):
+        raise HTTPException(status_code=404, detail="Slice not found")
+    return await _view_image_response(
+        _section_stack_dir(metadata, stack_id) / f"{slice_name}.png",
+        request=request,
+        format=format,
+        size=size,
+        missing_detail="Slice not found",
+    )
 
 
 @app.post("/api/models/{model_id}/isometric_shape2d")
@@ -1437,9 +1822,9 @@ async def generate_isometric_shape2d(model_id: str):
     except CADProcessingError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    metadata.isometric_shape2d = view_files
-    metadata.isometric_shape2d_metadata = meta_files
-    model_store.update(metadata)
+    with _model_transaction(model_id) as current:
+        current.isometric_shape2d = view_files
+        current.isometric_shape2d_metadata = meta_files
 
     views_response = {name: f"/api/models/{model_id}/isometric_shape2d/{name}" for name in view_files.keys()}
     meta_response = {name: f"/api/models/{model_id}/isometric_shape2d/{name}/metadata" for name in meta_files.keys()}
@@ -1447,25 +1832,24 @@ async def generate_isometric_shape2d(model_id: str):
 
 
 @app.get("/api/models/{model_id}/isometric_shape2d/{view_name}")
-async def fetch_isometric_shape2d(model_id: str, view_name: str):
+async def fetch_isometric_shape2d(model_id: str, view_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.isometric_shape2d:
         raise HTTPException(status_code=404, detail="View not found")
 
-    file_path = metadata.isometric_shape2d[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Isometric Shape2D view missing on disk")
-    return FileResponse(file_path, media_type="image/png")
+    return await _view_image_response(metadata.isometric_shape2d[view_name], request=request, format=format, size=size, missing_detail="Isometric Shape2D view missing on disk")
 
 @app.get("/api/models/{model_id}/isometric_shape2d/{view_name}/metadata")
-async def fetch_isometric_shape2d_metadata(model_id: str, view_name: str):
+async def fetch_isometric_shape2d_metadata(model_id: str, view_name: str, request: Request, format: str | None = Query(default=None)):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.isometric_shape2d_metadata:
         raise HTTPException(status_code=404, detail="Metadata not found")
-    file_path = metadata.isometric_shape2d_metadata[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Isometric Shape2D metadata missing on disk")
-    return FileResponse(file_path, media_type="application/json")
+    return await _view_metadata_response(
+        metadata.isometric_shape2d_metadata[view_name],
+        request=request,
+        format=format,
+        missing_detail="Isometric Shape2D metadata missing on disk",
+    )
 
 
 @app.post("/api/models/{model_id}/isometric_matplotlib")
@@ -1478,9 +1862,9 @@ async def generate_isometric_matplotlib(model_id: str):
     except CADProcessingError as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
-    metadata.isometric_matplotlib = view_files
-    metadata.isometric_matplotlib_metadata = meta_files
-    model_store.update(metadata)
+    with _model_transaction(model_id) as current:
+        current.isometric_matplotlib = view_files
+        current.isometric_matplotlib_metadata = meta_files
 
     views_response = {name: f"/api/models/{model_id}/isometric_matplotlib/{name}" for name in view_files.keys()}
     meta_response = {name: f"/api/models/{model_id}/isometric_matplotlib/{name}/metadata" for name in meta_files.keys()}
@@ -1488,43 +1872,89 @@ async def generate_isometric_matplotlib(model_id: str):
 
 
 @app.get("/api/models/{model_id}/isometric_matplotlib/{view_name}")
-async def fetch_isometric_matplotlib(model_id: str, view_name: str):
+async def fetch_isometric_matplotlib(model_id: str, view_name: str, request: Request, format: str = Query(default="png"), size: str = Query(default="full")):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.isometric_matplotlib:
         raise HTTPException(status_code=404, detail="View not found")
 
-    file_path = metadata.isometric_matplotlib[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Isometric matplotlib view missing on disk")
-    return FileResponse(file_path, media_type="image/png")
+    return await _view_image_response(metadata.isometric_matplotlib[view_name], request=request, format=format, size=size, missing_detail="Isometric matplotlib view missing on disk")
 
 @app.get("/api/models/{model_id}/isometric_matplotlib/{view_name}/metadata")
-async def fetch_isometric_matplotlib_metadata(model_id: str, view_name: str):
+async def fetch_isometric_matplotlib_metadata(model_id: str, view_name: str, request: Request, format: str | None = Query(default=None)):
     metadata = model_store.get(model_id)
     if not metadata or view_name not in metadata.isometric_matplotlib_metadata:
         raise HTTPException(status_code=404, detail="Metadata not found")
-    file_path = metadata.isometric_matplotlib_metadata[view_name]
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Isometric matplotlib metadata missing on disk")
-    return FileResponse(file_path, media_type="application/json")
+    return await _view_metadata_response(
+        metadata.isometric_matplotlib_metadata[view_name],
+        request=request,
+        format=format,
+        missing_detail="Isometric matplotlib metadata missing on disk",
+    )
+
+
+# Export families: (zip folder, image attribute, metadata attribute) on ModelMetadata.
+_EXPORT_FAMILIES: dict[str, list[tuple[str, str, str | None]]] = {
+    "views": [("", "views", "view_metadata")],
+    "shape2d": [("shape2d/", "shape_views", "shape_view_metadata")],
+    "occ": [("occ_views/", "occ_views", None)],
+    "mid": [("mid_views/", "mid_views", None)],
+    "isometric": [
+        ("isometric_shape2d/", "isometric_shape2d", "isometric_shape2d_metadata"),
+        ("isometric_matplotlib/", "isometric_matplotlib", "isometric_matplotlib_metadata"),
+    ],
+}
+ExportFamily = Literal["views", "shape2d", "occ", "mid", "isometric"]
+
+
+def _export_entries(metadata, families: list[str], include_metadata: bool):
+    """
+    Yield ``(arcname, source)`` pairs lazily so the archive is built as it streams.
+    Metadata JSON is encoded straight into its entry; nothing is written to disk.
+    """
+    for family in dict.fromkeys(families):
+        for folder, views_attr, metadata_attr in _EXPORT_FAMILIES[family]:
+            for name, path in getattr(metadata, views_attr).items():
+                yield f"{folder}{name}.png", path
+                svg_path = svg_path_for(path)
+                if svg_path.exists():
+                    yield f"{folder}{name}.svg", svg_path
+            if not include_metadata or metadata_attr is None:
+                continue
+            for name, path in getattr(metadata, metadata_attr).items():
+                chunks = view_metadata.iter_json_chunks(path)
+                try:
+                    # Decoding happens before the first chunk, so a bad file is skipped whole.
+                    first = next(chunks, b"")
+                except view_metadata.ViewMetadataError as exc:
+                    logger.warning("Skipping metadata %s in export: %s", path, exc)
+                    continue
+                yield f"{folder}{name}.json", itertools.chain((first,), chunks)
 
 
 @app.post("/api/models/{model_id}/export")
-async def export_views(model_id: str):
+async def export_views(
+    model_id: str,
+    include: list[ExportFamily] = Query(default=["views"]),
+    include_metadata: bool = Query(default=False),
+):
     metadata = model_store.get(model_id)
-    if not metadata or not metadata.views:
+    if not metadata:
+        raise HTTPException(status_code=404, detail="Views not generated yet")
+    available = any(
+        path.exists()
+        for family in include
+        for _, views_attr, _ in _EXPORT_FAMILIES[family]
+        for path in getattr(metadata, views_attr).values()
+    )
+    if not available:
         raise HTTPException(status_code=404, detail="Views not generated yet")
 
-    memory_file = io.BytesIO()
-    with zipfile.ZipFile(memory_file, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for name, path in metadata.views.items():
-            if not path.exists():
-                continue
-            zf.write(path, arcname=f"{name}.png")
-    memory_file.seek(0)
     headers = {"Content-Disposition": f'attachment; filename="views-{model_id}.zip"'}
-
-    return StreamingResponse(memory_file, media_type="application/zip", headers=headers)
+    return StreamingResponse(
+        zip_stream.iter_zip(_export_entries(metadata, include, include_metadata)),
+        media_type="application/zip",
+        headers=headers,
+    )
 
 
 if WEB_DIST_DIR.exists():
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-import json
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from uuid import uuid4
 
+from .json_store import file_lock, read_json, write_json_atomic
+
+
+class ModelStoreError(RuntimeError):
+    pass
+
+
+class ModelNotFoundError(ModelStoreError):
+    pass
+
 
 @dataclass
 class ModelMetadata:
@@ -71,20 +81,28 @@ class ModelMetadata:
 class ModelStore:
     """
     Handles persistence of uploaded models on disk.
+
+    ``metadata.json`` is shared by every worker process, so callers that change a
+    few fields should go through :meth:`transaction` instead of a ``get``/``update``
+    pair; that re-reads the document under the file lock and cannot drop writes
+    made by another worker in between.
     """
 
     def __init__(self, root: Path):
         self.root = root
         self.root.mkdir(parents=True, exist_ok=True)
 
+    def _metadata_path(self, model_id: str) -> Path:
+        return self.root / model_id / "metadata.json"
+
     def _read_metadata(self, metadata_path: Path) -> Optional[ModelMetadata]:
-        if not metadata_path.exists():
+        payload = read_json(metadata_path)
+        if payload is None:
             return None
-        payload = json.loads(metadata_path.read_text(encoding="utf-8"))
         return ModelMetadata.from_dict(payload)
 
     def _write_metadata(self, metadata_path: Path, metadata: ModelMetadata) -> None:
-        metadata_path.write_text(json.dumps(metadata.to_dict(), indent=2), encoding="utf-8")
+        write_json_atomic(metadata_path, metadata.to_dict())
 
     def create(self, original_name: str) -> ModelMetadata:
         model_id = uuid4().hex
@@ -100,10 +118,21 @@ class ModelStore:
         return metadata
 
     def get(self, model_id: str) -> Optional[ModelMetadata]:
-        metadata_path = self.root / model_id / "metadata.json"
-        return self._read_metadata(metadata_path)
+        return self._read_metadata(self._metadata_path(model_id))
 
     def update(self, metadata: ModelMetadata) -> ModelMetadata:
         metadata_path = metadata.step_path.parent / "metadata.json"
-        self._write_metadata(metadata_path, metadata)
+        with file_lock(metadata_path):
+            self._write_metadata(metadata_path, metadata)
         return metadata
+
+    @contextmanager
+    def transaction(self, model_id: str) -> Iterator[ModelMetadata]:
+        """Yield the current metadata under an exclusive lock and persist it on exit."""
+        metadata_path = self._metadata_path(model_id)
+        with file_lock(metadata_path):
+            metadata = self._read_metadata(metadata_path)
+            if metadata is None:
+                raise ModelNotFoundError(f"Model '{model_id}' not found.")
+            yield metadata
+            self._write_metadata(metadata_path, metadata)
@@ -0,0 +1,145 @@
+"""
+Process pool for independent, CPU-bound CAD jobs.
+
+OCC's hidden-line removal holds the GIL and runs for tens of seconds on complex
+parts, so per-direction passes are farmed out to worker processes. Workers are
+spawned (never forked from the threaded API process) and kept alive between
+requests so the OCC import cost is paid once per worker.
+
+``run`` returns results in submission order, regardless of which worker
+finishes first; ``iter_completed`` yields them as they finish instead. A single
+job or a single configured worker runs inline in the calling process. A worker
+that dies (typically OCC crashing on one shape) breaks the pool; the unfinished
+jobs are retried once on a fresh pool and a second crash raises
+``CADProcessingError``. They are never rerun inline, where the same crash would
+take down the API process.
+"""
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Iterator, Sequence, Tuple
+
+from .cad_service import CADProcessingError
+
+logger = logging.getLogger(__name__)
+
+WORKERS_ENV = "RAPIDDRAFT_HLR_WORKERS"
+POOL_ATTEMPTS = 2
+
+
+def resolve_worker_count(job_count: int, configured: int | None = None) -> int:
+    """Workers to use for ``job_count`` jobs: explicit value, then env, then CPU count."""
+    if configured is None:
+        raw = os.getenv(WORKERS_ENV, "").strip()
+        configured = int(raw) if raw.isdigit() else None
+    if configured is None:
+        configured = os.cpu_count() or 1
+    return max(1, min(configured, job_count))
+
+
+class ParallelJobRunner:
+    def __init__(self, *, max_workers: int | None = None) -> None:
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_workers = 0
+        self._lock = threading.Lock()
+
+    def run(self, fn: Callable[..., Any], jobs: Sequence[Tuple[str, tuple]]) -> Dict[str, Any]:
+        """
+        Call ``fn(*args)`` for every ``(name, args)`` job and return the results
+        keyed by name, in the order the jobs were given.
+        """
+        workers = self.worker_count(len(jobs))
+        if workers <= 1:
+            return self._run_inline(fn, jobs)
+
+        results: Dict[str, Any] = {}
+        attempt = 0
+        while True:
+            attempt += 1
+            executor = self._get_executor(workers)
+            try:
+                futures = [(name, executor.submit(fn, *args)) for name, args in jobs if name not in results]
+                for name, future in futures:
+                    results[name] = future.result()
+                return {name: results[name] for name, _ in jobs}
+            except BrokenProcessPool:
+                self._pool_crashed(executor, attempt, len(jobs) - len(results))
+
+    def iter_completed(self, fn: Callable[..., Any], jobs: Sequence[Tuple[str, tuple]]) -> Iterator[Tuple[str, Any]]:
+        """Yield ``(name, fn(*args))`` for every job as soon as it finishes."""
+        workers = self.worker_count(len(jobs))
+        if workers <= 1:
+            for name, args in jobs:
+                yield name, fn(*args)
+            return
+
+        remaining = dict(jobs)
+        futures: dict[Any, str] = {}
+        attempt = 0
+        try:
+            while remaining:
+                attempt += 1
+                executor = self._get_executor(workers)
+                try:
+                    futures = {executor.submit(fn, *args): name for name, args in remaining.items()}
+                    while futures:
+                        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            name = futures.pop(future)
+                            result = future.result()
+                            del remaining[name]
+                            yield name, result
+                except BrokenProcessPool:
+                    futures = {}
+                    self._pool_crashed(executor, attempt, len(remaining))
+        finally:
+            # A consumer that stops early (e.g. a dropped stream) leaves no queued work behind.
+            for future in futures:
+                future.cancel()
+
+    def worker_count(self, job_count: int) -> int:
+        return resolve_worker_count(job_count, self.max_workers)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._executor_workers = 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _pool_crashed(self, executor: ProcessPoolExecutor, attempt: int, job_count: int) -> None:
+        self._discard_executor(executor)
+        if attempt >= POOL_ATTEMPTS:
+            raise CADProcessingError(f"Worker process crashed twice; {job_count} job(s) did not finish")
+        logger.warning("Worker pool crashed; retrying %d job(s) on a fresh pool.", job_count)
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        # Other requests may share the broken pool and retry on their own; only
+        # the first to notice replaces it, and nobody's futures are cancelled.
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self._executor_workers = 0
+        executor.shutdown(wait=False)
+
+    def _run_inline(self, fn: Callable[..., Any], jobs: Sequence[Tuple[str, tuple]]) -> Dict[str, Any]:
+        return {name: fn(*args) for name, args in jobs}
+
+    def _get_executor(self, workers: int) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None or self._executor_workers < workers:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                self._executor_workers = workers
+            return self._executor
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import math
+import os
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+from uuid import uuid4
 
+import numpy as np
+
+from .cad_service import CADProcessingError
 from .cnc_geometry_occ import CncGeometryAnalyzer, CncGeometryError
+from .dfm_part_facts_bridge import DERIVED_FACT_SOURCES
+from .hole_features import HOLE_COLUMNS, recognize_holes
+from .parallel_jobs import ParallelJobRunner
+from .shaded_render import ShadedRenderError, load_mesh
+from .thickness_map import DEFAULT_TIME_BUDGET_SEC, ThicknessMapError, compute_thickness_map, write_thickness_glb
+from .topology_index import TopologyIndex, build_topology_index
+from .wall_thickness import min_opposed_plane_gap
 
 KNOWN_METRIC_STATES = {"measured", "inferred", "declared"}
 NOT_APPLICABLE_STATE = "not_applicable"
@@ -70,8 +85,169 @@ def _safe_optional_int(value: Any) -> int | None:
     return None
 
 
+# Stamped input -> recompute reason reported when it differs from the stored facts.
+_INPUT_CHANGE_REASONS = {
+    "step_sha256": "step_changed",
+    "preview_sha256": "preview_changed",
+    "profile_sha256": "profile_changed",
+    "component_sha256": "component_changed",
+    "bundle_version": "bundle_changed",
+    "bundle_inputs_sha256": "bundle_changed",
+    "geometry_extractor_version": "extractor_changed",
+    "context_extractor_version": "extractor_changed",
+}
+
+
+@dataclass(frozen=True)
+class FactExtractor:
+    name: str
+    # Metric keys written into the sections, plus the review facts the DFM
+    # bridge derives from them, so rule inputs map straight to extractors.
+    produces: frozenset[str]
+    needs_step: bool = True
+
+
+def _fact_keys(*metric_keys: str) -> frozenset[str]:
+    """``metric_keys`` plus every review fact the DFM bridge derives from one of them."""
+    keys = set(metric_keys)
+    keys.update(fact for fact, sources in DERIVED_FACT_SOURCES.items() if keys.intersection(sources))
+    return frozenset(keys)
+
+
+FACT_EXTRACTORS: tuple[FactExtractor, ...] = (
+    FactExtractor(
+        "bbox",
+        _fact_keys(
+            "bbox_x_mm",
+            "bbox_y_mm",
+            "bbox_z_mm",
+            "bbox_volume_mm3",
+            "bbox_diagonal_mm",
+            "part_bounding_box",
+            "bbox_dimensions",
+        ),
+    ),
+    FactExtractor("body_count", _fact_keys("body_count")),
+    FactExtractor("mass_properties", _fact_keys("part_volume_mm3", "surface_area_mm2")),
+    FactExtractor(
+        "cnc_corners",
+        _fact_keys(
+            "corner_count",
+            "critical_corner_count",
+            "warning_corner_count",
+            "caution_corner_count",
+            "ok_corner_count",
+            "min_internal_radius_mm",
+            "count_radius_below_1_5_mm",
+            "count_radius_below_3_0_mm",
+            "unique_internal_radius_count",
+            "radius_variation_ratio",
+            "max_pocket_depth_mm",
+            "max_depth_to_radius_ratio",
+            "long_reach_tool_risk_count",
+            "pockets_present",
+            "feature_complexity_score",
+            "radii_set",
+            "pocket_corner_radius",
+            "pocket_depth",
+            "geometry_features",
+        ),
+    ),
+    FactExtractor(
+        "holes",
+        _fact_keys(
+            "hole_count",
+            "through_hole_count",
+            "hole_table",
+            "min_hole_diameter_mm",
+            "max_hole_depth_mm",
+            "threaded_holes_count",
+            "hole_features",
+            "hole_diameter",
+            "hole_depth",
+        ),
+    ),
+    FactExtractor("walls", _fact_keys("min_wall_thickness_mm", "min_wall_thickness", "wall_thickness_map")),
+    FactExtractor(
+        "thickness_map",
+        _fact_keys(
+            "raycast_min_wall_thickness_mm",
+            "wall_thickness_percentiles_mm",
+            "thin_wall_area_fraction",
+            "wall_thickness_map",
+            "min_wall_thickness_mm",
+            "min_wall_thickness",
+        ),
+        needs_step=False,
+    ),
+)
+
+
+def extractors_for(fact_keys: Iterable[str] | None) -> list[str]:
+    """Names of the extractors producing any of ``fact_keys``; all of them for ``None``."""
+    if fact_keys is None:
+        return [extractor.name for extractor in FACT_EXTRACTORS]
+    wanted = set(fact_keys)
+    return [extractor.name for extractor in FACT_EXTRACTORS if extractor.produces & wanted]
+
+
+@dataclass
+class _LoadedGeometry:
+    step_path: Path
+    component_node_name: str
+    shape: Any
+    analysis_shape: Any
+    bounds: tuple[float, float, float, float, float, float]
+    topology: TopologyIndex
+
+
+def _json_sha256(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+# One geometry-only service per bulk worker process, reused across jobs so the
+# STEP it last loaded stays in memory for the next component of the model. The
+# pool only lives for one ``iter_many`` batch, so the shape goes with it.
+_BULK_EXTRACTOR: dict[tuple[Any, ...], "PartFactsService"] = {}
+
+
+def _extract_geometry_layer(
+    root: Path,
+    geometry_analyzer: CncGeometryAnalyzer,
+    thickness_time_budget_sec: float,
+    model_id: str,
+    step_path: Path,
+    component_node_name: str,
+    geometry_key: dict[str, Any],
+    base_layer: dict[str, Any] | None,
+) -> dict[str, Any]:
+    key = (str(root), type(geometry_analyzer), thickness_time_budget_sec)
+    service = _BULK_EXTRACTOR.get(key)
+    if service is None:
+        _BULK_EXTRACTOR.clear()
+        service = _BULK_EXTRACTOR[key] = PartFactsService(
+            root=root,
+            bundle=None,
+            geometry_analyzer=geometry_analyzer,
+            thickness_time_budget_sec=thickness_time_budget_sec,
+            bulk_workers=1,
+            reuse_loaded_step=True,
+        )
+    return service._build_geometry_layer(
+        model_id=model_id,
+        step_path=step_path,
+        component_node_name=component_node_name,
+        geometry_key=geometry_key,
+        base_layer=base_layer,
+    )
+
+
 class PartFactsService:
-    SCHEMA_VERSION = "1.2.0"
+    SCHEMA_VERSION = "1.7.0"
+    # Bump when an extractor changes its output so cached facts are rebuilt:
+    # geometry for the STEP/mesh extractors, context for the profile rules.
+    GEOMETRY_EXTRACTOR_VERSION = "4"
+    CONTEXT_EXTRACTOR_VERSION = "1"
 
     def __init__(
         self,
@@ -79,10 +255,31 @@ class PartFactsService:
         root: Path,
         bundle: Any,
         geometry_analyzer: CncGeometryAnalyzer | None = None,
+        thickness_time_budget_sec: float = DEFAULT_TIME_BUDGET_SEC,
+        bulk_workers: int | None = None,
+        reuse_loaded_step: bool = False,
     ) -> None:
         self.root = root
         self.bundle = bundle
         self.geometry_analyzer = geometry_analyzer or CncGeometryAnalyzer()
+        self.thickness_time_budget_sec = thickness_time_budget_sec
+        # Keeping the last STEP loaded only pays off when one model's
+        # components are extracted back to back (bulk workers).
+        self.reuse_loaded_step = reuse_loaded_step
+        self._loaded_step: tuple[tuple[str, int, int], Any] | None = None
+        # Each bulk worker holds a whole STEP, so the pool is sized on its own
+        # rather than from the HLR worker setting.
+        self.bulk_workers = bulk_workers if bulk_workers is not None else os.cpu_count() or 1
+        self._digest_memo: dict[tuple[str, int, int], str] = {}
+        manifest = getattr(bundle, "manifest", None) if bundle is not None else None
+        self.bundle_version = manifest.get("version") if isinstance(manifest, dict) else None
+        # Catches bundle edits that were not accompanied by a version bump.
+        self.bundle_inputs_sha256 = _json_sha256(
+            {
+                "rule_library": getattr(bundle, "rule_library", None),
+                "process_classifier": getattr(bundle, "process_classifier", None),
+            }
+        )
         self.rule_input_frequency = self._collect_rule_input_frequency(bundle)
         self.process_input_keys = self._collect_process_input_keys(bundle)
         self.high_priority_rule_inputs = [
@@ -120,56 +317,493 @@ class PartFactsService:
         triangle_count: int | None,
         assembly_component_count: int,
         force_refresh: bool = False,
+        fact_keys: Iterable[str] | None = None,
     ) -> dict[str, Any]:
+        """
+        Part facts for one component, recomputed only where inputs changed.
+
+        ``fact_keys`` limits extraction to the extractors producing those
+        keys (all of them when ``None``). Extractors not run yet are filled
+        in by a later call that asks for their keys.
+        """
+        extractors = extractors_for(fact_keys)
+        context_inputs = self._context_inputs(
+            component_display_name=component_display_name,
+            component_profile=component_profile or {},
+            triangle_count=triangle_count,
+            assembly_component_count=assembly_component_count,
+        )
+        geometry_key = self._geometry_key(model_id=model_id, step_path=step_path)
+        inputs = self._input_stamp(geometry_key=geometry_key, context_inputs=context_inputs)
+        if force_refresh:
+            recompute_reasons = ["forced"]
+        else:
+            payload, recompute_reasons = self._cached_payload(
+                model_id=model_id,
+                component_node_name=component_node_name,
+                inputs=inputs,
+                extractors=extractors,
+            )
+            if payload is not None:
+                return payload
+
+        geometry_layer = None
         if not force_refresh:
-            try:
-                payload = self.get(model_id=model_id, component_node_name=component_node_name)
-                if payload.get("schema_version") == self.SCHEMA_VERSION:
-                    return payload
-            except PartFactsNotFoundError:
-                pass
+            geometry_layer = self._load_geometry_layer(
+                model_id=model_id,
+                component_node_name=component_node_name,
+                geometry_key=geometry_key,
+            )
+        if geometry_layer is None or not set(extractors) <= set(geometry_layer.get("extractors", [])):
+            geometry_layer = self._build_geometry_layer(
+                model_id=model_id,
+                step_path=step_path,
+                component_node_name=component_node_name,
+                geometry_key=geometry_key,
+                extractors=extractors,
+                base_layer=geometry_layer,
+            )
+            self._write_json(
+                self._geometry_layer_path(model_id=model_id, component_node_name=component_node_name),
+                geometry_layer,
+            )
 
-        payload = self._build_payload(
+        return self._persist_payload(
             model_id=model_id,
-            step_path=step_path,
             component_node_name=component_node_name,
+            geometry_layer=geometry_layer,
+            context_inputs=context_inputs,
+            inputs=inputs,
+            recompute_reasons=recompute_reasons,
+        )
+
+    def refresh_context(
+        self,
+        *,
+        model_id: str,
+        step_path: Path,
+        component_node_name: str,
+        component_display_name: str,
+        component_profile: dict[str, Any] | None,
+        triangle_count: int | None,
+        assembly_component_count: int,
+    ) -> dict[str, Any] | None:
+        """Rebuild the context layer over cached geometry; ``None`` when none is cached without errors."""
+        geometry_key = self._geometry_key(model_id=model_id, step_path=step_path)
+        geometry_layer = self._load_geometry_layer(
+            model_id=model_id,
+            component_node_name=component_node_name,
+            geometry_key=geometry_key,
+        )
+        if geometry_layer is None or geometry_layer.get("errors"):
+            return None
+        context_inputs = self._context_inputs(
             component_display_name=component_display_name,
             component_profile=component_profile or {},
             triangle_count=triangle_count,
             assembly_component_count=assembly_component_count,
         )
-
-        payload_path = self._facts_path(
+        inputs = self._input_stamp(geometry_key=geometry_key, context_inputs=context_inputs)
+        payload, recompute_reasons = self._cached_payload(
+            model_id=model_id,
+            component_node_name=component_node_name,
+            inputs=inputs,
+            extractors=geometry_layer.get("extractors", []),
+        )
+        if payload is not None:
+            return payload
+        return self._persist_payload(
             model_id=model_id,
             component_node_name=component_node_name,
+            geometry_layer=geometry_layer,
+            context_inputs=context_inputs,
+            inputs=inputs,
+            recompute_reasons=recompute_reasons,
         )
-        payload_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def iter_many(
+        self,
+        *,
+        model_id: str,
+        step_path: Path,
+        components: list[dict[str, Any]],
+        assembly_component_count: int,
+        force_refresh: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Part facts for several components of one model, yielded as each is ready.
+
+        ``components`` entries carry ``component_node_name``,
+        ``component_display_name``, ``component_profile`` and
+        ``triangle_count``. Cached facts and cached geometry come first; the
+        rest are extracted across a bulk worker pool started for this call,
+        where each worker reads the STEP once and reuses it for every
+        component it is given.
+        Each yielded record has ``component_node_name``, ``source``
+        (``cached``, ``geometry_cache`` or ``extracted``) and either
+        ``part_facts`` or ``error``.
+        """
+        geometry_key = self._geometry_key(model_id=model_id, step_path=step_path)
+        all_extractors = extractors_for(None)
+        pending: dict[str, tuple[dict[str, Any], dict[str, Any], list[str]]] = {}
+        base_layers: dict[str, dict[str, Any] | None] = {}
+        for component in components:
+            node_name = component["component_node_name"]
+            context_inputs = self._context_inputs(
+                component_display_name=component.get("component_display_name") or node_name,
+                component_profile=component.get("component_profile") or {},
+                triangle_count=component.get("triangle_count"),
+                assembly_component_count=assembly_component_count,
+            )
+            inputs = self._input_stamp(geometry_key=geometry_key, context_inputs=context_inputs)
+            if force_refresh:
+                pending[node_name] = (context_inputs, inputs, ["forced"])
+                continue
+            payload, recompute_reasons = self._cached_payload(
+                model_id=model_id,
+                component_node_name=node_name,
+                inputs=inputs,
+                extractors=all_extractors,
+            )
+            if payload is not None:
+                yield {"component_node_name": node_name, "source": "cached", "part_facts": payload}
+                continue
+            geometry_layer = self._load_geometry_layer(
+                model_id=model_id,
+                component_node_name=node_name,
+                geometry_key=geometry_key,
+            )
+            if geometry_layer is None or set(geometry_layer.get("extractors", [])) != set(all_extractors):
+                # Partially extracted layers are finished in the worker, not redone.
+                base_layers[node_name] = geometry_layer
+                pending[node_name] = (context_inputs, inputs, recompute_reasons)
+                continue
+            yield self._bulk_record(
+                model_id=model_id,
+                component_node_name=node_name,
+                source="geometry_cache",
+                geometry_layer=geometry_layer,
+                context_inputs=context_inputs,
+                inputs=inputs,
+                recompute_reasons=recompute_reasons,
+            )
+
+        jobs = [
+            (
+                node_name,
+                (
+                    self.root,
+                    self.geometry_analyzer,
+                    self.thickness_time_budget_sec,
+                    model_id,
+                    step_path,
+                    node_name,
+                    geometry_key,
+                    base_layers.get(node_name),
+                ),
+            )
+            for node_name in pending
+        ]
+        # A fresh pool per batch: shutting it down afterwards is what frees the
+        # STEP each worker kept loaded.
+        runner = ParallelJobRunner(max_workers=self.bulk_workers)
         try:
-            payload_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        except Exception as exc:
-            raise PartFactsError(f"Failed to persist part facts: {exc}") from exc
+            for node_name, geometry_layer in runner.iter_completed(_extract_geometry_layer, jobs):
+                context_inputs, inputs, recompute_reasons = pending.pop(node_name)
+                yield self._bulk_record(
+                    model_id=model_id,
+                    component_node_name=node_name,
+                    source="extracted",
+                    geometry_layer=geometry_layer,
+                    context_inputs=context_inputs,
+                    inputs=inputs,
+                    recompute_reasons=recompute_reasons,
+                )
+        except CADProcessingError as exc:
+            # The worker pool crashed twice; every component still waiting gets the error.
+            for node_name in pending:
+                yield {"component_node_name": node_name, "source": "extracted", "error": str(exc)}
+        finally:
+            runner.shutdown()
+            # Inline runs keep the loaded STEP in this process; drop it with the request.
+            _BULK_EXTRACTOR.clear()
+
+    def _bulk_record(
+        self,
+        *,
+        model_id: str,
+        component_node_name: str,
+        source: str,
+        geometry_layer: dict[str, Any],
+        context_inputs: dict[str, Any],
+        inputs: dict[str, Any],
+        recompute_reasons: list[str],
+    ) -> dict[str, Any]:
+        record: dict[str, Any] = {"component_node_name": component_node_name, "source": source}
+        try:
+            if source == "extracted":
+                self._write_json(
+                    self._geometry_layer_path(model_id=model_id, component_node_name=component_node_name),
+                    geometry_layer,
+                )
+            record["part_facts"] = self._persist_payload(
+                model_id=model_id,
+                component_node_name=component_node_name,
+                geometry_layer=geometry_layer,
+                context_inputs=context_inputs,
+                inputs=inputs,
+                recompute_reasons=recompute_reasons,
+            )
+        except PartFactsError as exc:
+            record["error"] = str(exc)
+        return record
+
+    def _persist_payload(
+        self,
+        *,
+        model_id: str,
+        component_node_name: str,
+        geometry_layer: dict[str, Any],
+        context_inputs: dict[str, Any],
+        inputs: dict[str, Any],
+        recompute_reasons: list[str],
+    ) -> dict[str, Any]:
+        payload = self._build_payload(
+            model_id=model_id,
+            component_node_name=component_node_name,
+            geometry_layer=geometry_layer,
+            context_inputs=context_inputs,
+        )
+        payload["inputs"] = inputs
+        payload["recompute_reasons"] = recompute_reasons
+        self._write_json(
+            self._facts_path(model_id=model_id, component_node_name=component_node_name),
+            payload,
+        )
         return payload
 
-    def _build_payload(
+    def _cached_payload(
         self,
         *,
         model_id: str,
-        step_path: Path,
         component_node_name: str,
+        inputs: dict[str, Any],
+        extractors: Iterable[str],
+    ) -> tuple[dict[str, Any] | None, list[str]]:
+        """The stored payload when it is still current, else ``None`` and why it is stale."""
+        try:
+            payload = self.get(model_id=model_id, component_node_name=component_node_name)
+        except PartFactsNotFoundError:
+            return None, ["not_cached"]
+        except PartFactsError:
+            return None, ["unreadable"]
+        if payload.get("schema_version") != self.SCHEMA_VERSION:
+            return None, ["schema_changed"]
+        stored = payload.get("inputs")
+        if not isinstance(stored, dict):
+            return None, ["unstamped"]
+        reasons: list[str] = []
+        for key, reason in _INPUT_CHANGE_REASONS.items():
+            if stored.get(key) != inputs[key] and reason not in reasons:
+                reasons.append(reason)
+        if payload.get("errors"):
+            # Extraction failures are often transient (STEP/OCC import), so
+            # they are retried rather than served until the inputs change.
+            reasons.append("previous_errors")
+        elif not set(extractors) <= set(payload.get("extractors", [])):
+            # Failed extractors are missing from ``extractors`` too; those are
+            # covered by ``previous_errors`` above.
+            reasons.append("facts_requested")
+        if reasons:
+            return None, reasons
+        return payload, []
+
+    def _input_stamp(self, *, geometry_key: dict[str, Any], context_inputs: dict[str, Any]) -> dict[str, Any]:
+        component = {key: value for key, value in context_inputs.items() if key != "component_profile"}
+        return {
+            "step_sha256": geometry_key["step_sha256"],
+            "preview_sha256": geometry_key["preview_sha256"],
+            "profile_sha256": _json_sha256(context_inputs["component_profile"]),
+            "component_sha256": _json_sha256(component),
+            "bundle_version": self.bundle_version,
+            "bundle_inputs_sha256": self.bundle_inputs_sha256,
+            "geometry_extractor_version": self.GEOMETRY_EXTRACTOR_VERSION,
+            "context_extractor_version": self.CONTEXT_EXTRACTOR_VERSION,
+        }
+
+    def _context_inputs(
+        self,
+        *,
         component_display_name: str,
         component_profile: dict[str, Any],
         triangle_count: int | None,
         assembly_component_count: int,
     ) -> dict[str, Any]:
+        return {
+            "component_display_name": component_display_name,
+            "component_profile": component_profile,
+            "triangle_count": None if triangle_count is None else int(triangle_count),
+            "assembly_component_count": int(assembly_component_count),
+        }
+
+    def _build_geometry_layer(
+        self,
+        *,
+        model_id: str,
+        step_path: Path,
+        component_node_name: str,
+        geometry_key: dict[str, Any],
+        extractors: Iterable[str] | None = None,
+        base_layer: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Run ``extractors`` (all by default) that ``base_layer`` has not run yet."""
+        if base_layer is not None:
+            layer = copy.deepcopy(base_layer)
+        else:
+            # Extractors only write into process_inputs / rule_inputs, so
+            # those start empty and keep just the geometry-derived entries.
+            layer = {
+                "geometry_key": geometry_key,
+                "extractors": [],
+                "failed_extractors": {},
+                "assumptions": [],
+                "errors": [],
+                "sections": {
+                    "geometry": self._geometry_section_defaults(),
+                    "manufacturing_signals": self._manufacturing_section_defaults(),
+                    "process_inputs": {},
+                    "rule_inputs": {},
+                },
+            }
+        requested = set(extractors_for(None) if extractors is None else extractors)
+        done = set(layer["extractors"])
+        pending = [extractor for extractor in FACT_EXTRACTORS if extractor.name in requested - done]
+        if not pending:
+            return layer
+
+        sections, assumptions = layer["sections"], layer["assumptions"]
+        # Failed extractors stay out of ``extractors`` with their error, so the
+        # next request that needs them runs them again.
+        failed: dict[str, str] = dict(layer.get("failed_extractors", {}))
+        for extractor in pending:
+            failed.pop(extractor.name, None)
+
+        geometry = None
+        load_error = None
+        if any(extractor.needs_step for extractor in pending):
+            try:
+                geometry = self._load_geometry(step_path=step_path, component_node_name=component_node_name)
+            except PartFactsError as exc:
+                load_error = str(exc)
+            except Exception as exc:
+                load_error = f"Unexpected geometry extraction error: {exc.__class__.__name__}: {exc}"
+
+        for extractor in pending:
+            if extractor.needs_step:
+                if geometry is None:
+                    failed[extractor.name] = load_error or "Geometry unavailable."
+                    continue
+                inputs: dict[str, Any] = {"geometry": geometry}
+            else:
+                inputs = {"assumptions": assumptions, "model_id": model_id, "component_node_name": component_node_name}
+            try:
+                getattr(self, f"_extract_{extractor.name}")(sections=sections, **inputs)
+            except PartFactsError as exc:
+                failed[extractor.name] = str(exc)
+                continue
+            except Exception as exc:
+                failed[extractor.name] = (
+                    f"Unexpected {extractor.name} extraction error: {exc.__class__.__name__}: {exc}"
+                )
+                continue
+            done.add(extractor.name)
+
+        layer["extractors"] = [extractor.name for extractor in FACT_EXTRACTORS if extractor.name in done]
+        layer["failed_extractors"] = {
+            extractor.name: failed[extractor.name] for extractor in FACT_EXTRACTORS if extractor.name in failed
+        }
+        layer["errors"] = list(dict.fromkeys(layer["failed_extractors"].values()))
+        layer["generated_at"] = self._now_iso()
+        return layer
+
+    def _load_geometry_layer(
+        self,
+        *,
+        model_id: str,
+        component_node_name: str,
+        geometry_key: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        path = self._geometry_layer_path(model_id=model_id, component_node_name=component_node_name)
+        try:
+            layer = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(layer, dict) or layer.get("geometry_key") != geometry_key:
+            return None
+        return layer
+
+    def _geometry_key(self, *, model_id: str, step_path: Path) -> dict[str, Any]:
+        return {
+            "extractor_version": self.GEOMETRY_EXTRACTOR_VERSION,
+            "step_sha256": self._file_digest(step_path),
+            "preview_sha256": self._file_digest(self.root / model_id / "preview.glb"),
+        }
+
+    def _file_digest(self, path: Path) -> str | None:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        # Profile edits re-key the same files repeatedly; only rehash when
+        # the file itself changed.
+        memo_key = (str(path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digest_memo.get(memo_key)
+        if digest is None:
+            hasher = hashlib.sha256()
+            with path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    hasher.update(chunk)
+            digest = hasher.hexdigest()
+            self._digest_memo[memo_key] = digest
+        return digest
+
+    def _write_json(self, path: Path, payload: dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            tmp_path.unlink(missing_ok=True)
+            raise PartFactsError(f"Failed to persist part facts: {exc}") from exc
+
+    def _build_payload(
+        self,
+        *,
+        model_id: str,
+        component_node_name: str,
+        geometry_layer: dict[str, Any],
+        context_inputs: dict[str, Any],
+    ) -> dict[str, Any]:
+        component_display_name = context_inputs["component_display_name"]
+        component_profile = context_inputs["component_profile"]
+        triangle_count = context_inputs["triangle_count"]
+        assembly_component_count = context_inputs["assembly_component_count"]
+
         assumptions = [
             "Units assumed mm from CAD kernel context.",
             "STEP contains no native drawing-note semantics; drawing-derived fields can remain unknown.",
         ]
-        errors: list[str] = []
+        assumptions.extend(geometry_layer.get("assumptions", []))
+        errors: list[str] = list(geometry_layer.get("errors", []))
 
+        # The context rules below mutate sections, so work on a private copy.
+        geometry_sections = copy.deepcopy(geometry_layer.get("sections", {}))
         sections = {
-            "geometry": self._geometry_section_defaults(),
-            "manufacturing_signals": self._manufacturing_section_defaults(),
+            "geometry": geometry_sections.get("geometry") or self._geometry_section_defaults(),
+            "manufacturing_signals": (
+                geometry_sections.get("manufacturing_signals") or self._manufacturing_section_defaults()
+            ),
             "declared_context": self._declared_context_defaults(component_profile),
             "process_inputs": self._process_input_defaults(),
             "rule_inputs": self._rule_input_defaults(),
@@ -196,16 +830,8 @@ class PartFactsService:
                 source="model.components.triangleCount",
             )
 
-        try:
-            self._apply_geometry_metrics(
-                sections=sections,
-                step_path=step_path,
-                component_node_name=component_node_name,
-            )
-        except PartFactsError as exc:
-            errors.append(str(exc))
-        except Exception as exc:
-            errors.append(f"Unexpected geometry extraction error: {exc.__class__.__name__}: {exc}")
+        sections["process_inputs"].update(geometry_sections.get("process_inputs", {}))
+        sections["rule_inputs"].update(geometry_sections.get("rule_inputs", {}))
 
         # Assembly-aware input signal.
         sections["rule_inputs"]["assembly_model"] = _metric(
@@ -268,6 +894,11 @@ class PartFactsService:
             "component_node_name": component_node_name,
             "component_display_name": component_display_name,
             "generated_at": self._now_iso(),
+            "geometry_generated_at": geometry_layer.get("generated_at"),
+            "extractors": list(geometry_layer.get("extractors", [])),
+            "pending_extractors": [
+                name for name in extractors_for(None) if name not in geometry_layer.get("extractors", [])
+            ],
             "coverage": {
                 "core_extraction_coverage": core_extraction_coverage,
                 "full_rule_readiness_coverage": full_rule_readiness_coverage,
@@ -279,30 +910,39 @@ class PartFactsService:
             "sections": sections,
         }
 
-    def _apply_geometry_metrics(
-        self,
-        *,
-        sections: dict[str, dict[str, dict[str, Any]]],
-        step_path: Path,
-        component_node_name: str,
-    ) -> None:
+    def _load_geometry(self, *, step_path: Path, component_node_name: str) -> _LoadedGeometry:
         if not step_path.exists():
             raise PartFactsError("STEP file not found for part facts extraction.")
 
         analyzer = self.geometry_analyzer
         try:
             occ = analyzer._import_occ()
-            shape = analyzer._load_shape(occ, step_path)
+            shape = self._load_step(occ, step_path)
             analysis_shape, _ = analyzer._resolve_analysis_shape(occ, shape, component_node_name)
             bounds = analyzer._shape_bounds(occ, analysis_shape)
+            topology = build_topology_index(occ, analysis_shape)
         except CncGeometryError as exc:
             raise PartFactsError(str(exc)) from exc
         except Exception as exc:
             raise PartFactsError(
                 f"Failed to load geometry for part facts: {exc.__class__.__name__}: {exc}"
             ) from exc
+        return _LoadedGeometry(
+            step_path=step_path,
+            component_node_name=component_node_name,
+            shape=shape,
+            analysis_shape=analysis_shape,
+            bounds=tuple(bounds),
+            topology=topology,
+        )
 
-        x_min, y_min, z_min, x_max, y_max, z_max = bounds
+    def _extract_bbox(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        geometry: _LoadedGeometry,
+    ) -> None:
+        x_min, y_min, z_min, x_max, y_max, z_max = geometry.bounds
         dx = max(0.0, x_max - x_min)
         dy = max(0.0, y_max - y_min)
         dz = max(0.0, z_max - z_min)
@@ -349,8 +989,30 @@ class PartFactsService:
             confidence=1.0,
             source="occ.bbox",
         )
+        sections["rule_inputs"]["part_bounding_box"] = _metric(
+            label="Part bounding box available",
+            value=True,
+            unit=None,
+            state="measured",
+            confidence=1.0,
+            source="occ.bbox",
+        )
+        sections["process_inputs"]["bbox_dimensions"] = _metric(
+            label="Bounding-box dimensions available",
+            value=True,
+            unit=None,
+            state="measured",
+            confidence=1.0,
+            source="occ.bbox",
+        )
 
-        body_count = self._count_solids(occ=occ, shape=analysis_shape)
+    def _extract_body_count(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        geometry: _LoadedGeometry,
+    ) -> None:
+        body_count = self._count_solids(geometry.topology)
         sections["geometry"]["body_count"] = _metric(
             label="Solid body count",
             value=body_count,
@@ -360,7 +1022,13 @@ class PartFactsService:
             source="occ.topology",
         )
 
-        volume, surface_area = self._mass_properties(analysis_shape)
+    def _extract_mass_properties(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        geometry: _LoadedGeometry,
+    ) -> None:
+        volume, surface_area = self._mass_properties(geometry.analysis_shape)
         if volume is not None:
             sections["geometry"]["part_volume_mm3"] = _metric(
                 label="Part volume",
@@ -380,13 +1048,21 @@ class PartFactsService:
                 source="occ.mass_properties",
             )
 
+    def _extract_cnc_corners(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        geometry: _LoadedGeometry,
+    ) -> None:
         try:
-            cnc_payload = analyzer.analyze(
-                step_path=step_path,
-                component_node_name=component_node_name,
-                component_display_name=component_node_name,
+            cnc_payload = self.geometry_analyzer.analyze(
+                step_path=geometry.step_path,
+                component_node_name=geometry.component_node_name,
+                component_display_name=geometry.component_node_name,
                 include_ok_rows=True,
                 criteria=None,
+                shape=geometry.shape,
+                topology=geometry.topology,
             )
         except Exception:
             cnc_payload = {}
@@ -589,14 +1265,6 @@ class PartFactsService:
             confidence=0.7,
             source="cnc_geometry_occ",
         )
-        sections["rule_inputs"]["part_bounding_box"] = _metric(
-            label="Part bounding box available",
-            value=True,
-            unit=None,
-            state="measured",
-            confidence=1.0,
-            source="occ.bbox",
-        )
 
         sections["process_inputs"]["pockets_present"] = _metric(
             label="Pockets present",
@@ -606,14 +1274,6 @@ class PartFactsService:
             confidence=0.7,
             source="cnc_geometry_occ",
         )
-        sections["process_inputs"]["bbox_dimensions"] = _metric(
-            label="Bounding-box dimensions available",
-            value=True,
-            unit=None,
-            state="measured",
-            confidence=1.0,
-            source="occ.bbox",
-        )
         sections["process_inputs"]["feature_complexity_score"] = _metric(
             label="Feature complexity score available",
             value=True,
@@ -623,10 +1283,15 @@ class PartFactsService:
             source="cnc_geometry_occ.summary",
         )
 
+    def _extract_holes(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        geometry: _LoadedGeometry,
+    ) -> None:
         cylindrical_metrics = self._extract_cylindrical_feature_metrics(
-            occ=occ,
-            shape=analysis_shape,
-            bbox_dims=(dx, dy, dz),
+            topology=geometry.topology,
+            bounds=geometry.bounds,
         )
         if cylindrical_metrics:
             hole_count = cylindrical_metrics.get("hole_count")
@@ -637,7 +1302,7 @@ class PartFactsService:
                     unit=None,
                     state="measured",
                     confidence=0.65,
-                    source="occ.cylindrical_faces",
+                    source="occ.coaxial_hole_groups",
                 )
                 sections["rule_inputs"]["hole_features"] = _metric(
                     label="Hole features available",
@@ -645,7 +1310,7 @@ class PartFactsService:
                     unit=None,
                     state="measured",
                     confidence=0.65,
-                    source="occ.cylindrical_faces",
+                    source="occ.coaxial_hole_groups",
                 )
 
             min_hole_diameter = cylindrical_metrics.get("min_hole_diameter_mm")
@@ -656,7 +1321,7 @@ class PartFactsService:
                     unit="mm",
                     state="measured",
                     confidence=0.65,
-                    source="occ.cylindrical_faces",
+                    source="occ.coaxial_hole_groups",
                 )
                 sections["rule_inputs"]["hole_diameter"] = _metric(
                     label="Hole diameter",
@@ -664,7 +1329,7 @@ class PartFactsService:
                     unit="mm",
                     state="measured",
                     confidence=0.65,
-                    source="occ.cylindrical_faces",
+                    source="occ.coaxial_hole_groups",
                 )
 
             max_hole_depth = cylindrical_metrics.get("max_hole_depth_mm")
@@ -675,7 +1340,7 @@ class PartFactsService:
                     unit="mm",
                     state="measured",
                     confidence=0.6,
-                    source="occ.cylindrical_faces",
+                    source="occ.coaxial_hole_groups",
                 )
                 sections["rule_inputs"]["hole_depth"] = _metric(
                     label="Hole depth",
@@ -683,7 +1348,27 @@ class PartFactsService:
                     unit="mm",
                     state="measured",
                     confidence=0.6,
-                    source="occ.cylindrical_faces",
+                    source="occ.coaxial_hole_groups",
+                )
+
+            hole_rows = cylindrical_metrics.get("holes")
+            if isinstance(hole_rows, list):
+                sections["manufacturing_signals"]["through_hole_count"] = _metric(
+                    label="Through hole count",
+                    value=cylindrical_metrics.get("through_hole_count", 0),
+                    unit=None,
+                    state="inferred",
+                    confidence=0.5,
+                    source="occ.coaxial_hole_groups.bbox_span",
+                )
+                sections["manufacturing_signals"]["hole_table"] = _metric(
+                    label="Hole table",
+                    value={"columns": list(HOLE_COLUMNS), "rows": hole_rows},
+                    unit="mm",
+                    state="measured",
+                    confidence=0.6,
+                    source="occ.coaxial_hole_groups",
+                    reason="through is 1 when the hole spans the part bounding box along its axis.",
                 )
 
             threaded_holes_count = cylindrical_metrics.get("threaded_holes_count")
@@ -694,7 +1379,7 @@ class PartFactsService:
                     unit=None,
                     state="inferred",
                     confidence=0.45,
-                    source="occ.cylindrical_faces.heuristic",
+                    source="occ.coaxial_hole_groups.heuristic",
                     reason="heuristic from hole geometry; validate via drawing callouts for release.",
                 )
                 sections["process_inputs"]["threaded_holes_count"] = _metric(
@@ -703,13 +1388,16 @@ class PartFactsService:
                     unit=None,
                     state="inferred",
                     confidence=0.45,
-                    source="occ.cylindrical_faces.heuristic",
+                    source="occ.coaxial_hole_groups.heuristic",
                 )
 
-        wall_thickness = self._estimate_min_wall_thickness_mm(
-            occ=occ,
-            shape=analysis_shape,
-        )
+    def _extract_walls(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        geometry: _LoadedGeometry,
+    ) -> None:
+        wall_thickness = self._estimate_min_wall_thickness_mm(geometry.topology)
         if isinstance(wall_thickness, (int, float)) and wall_thickness > 0:
             wall_thickness = float(wall_thickness)
             sections["manufacturing_signals"]["min_wall_thickness_mm"] = _metric(
@@ -728,14 +1416,112 @@ class PartFactsService:
                 confidence=0.55,
                 source="occ.opposed_planar_faces",
             )
-            sections["rule_inputs"]["wall_thickness_map"] = _metric(
-                label="Wall thickness map available",
-                value=True,
-                unit=None,
+            # A measured ray-cast map (thickness_map) outranks this estimate,
+            # whichever of the two extractors ran first.
+            if sections["rule_inputs"].get("wall_thickness_map", {}).get("state") != "measured":
+                sections["rule_inputs"]["wall_thickness_map"] = _metric(
+                    label="Wall thickness map available",
+                    value=True,
+                    unit=None,
+                    state="inferred",
+                    confidence=0.55,
+                    source="occ.opposed_planar_faces",
+                )
+
+    def _extract_thickness_map(
+        self,
+        *,
+        sections: dict[str, dict[str, dict[str, Any]]],
+        assumptions: list[str],
+        model_id: str,
+        component_node_name: str,
+    ) -> None:
+        mesh_path = self.root / model_id / "preview.glb"
+        if not mesh_path.exists():
+            return
+        try:
+            vertices, faces = load_mesh(mesh_path, component_node_name)
+            thickness = compute_thickness_map(vertices, faces, time_budget_sec=self.thickness_time_budget_sec)
+            write_thickness_glb(
+                vertices,
+                faces,
+                thickness["vertex_thickness"],
+                self.thickness_map_path(model_id=model_id, component_node_name=component_node_name),
+            )
+        except (ShadedRenderError, ThicknessMapError) as exc:
+            raise PartFactsError(f"Wall thickness map unavailable: {exc}") from exc
+
+        summary = thickness["summary"]
+        if summary["min_mm"] is None:
+            return
+        if summary["truncated"]:
+            assumptions.append(
+                f"Wall thickness map sampled {summary['coverage'] * 100:.0f}% of the surface area within its time budget."
+            )
+        confidence = round(0.75 * summary["coverage"], 4)
+        signals = sections["manufacturing_signals"]
+        signals["raycast_min_wall_thickness_mm"] = _metric(
+            label="Minimum wall thickness (ray-cast)",
+            value=summary["min_mm"],
+            unit="mm",
+            state="measured",
+            confidence=confidence,
+            source="mesh.raycast_bvh",
+        )
+        signals["wall_thickness_percentiles_mm"] = _metric(
+            label="Wall thickness percentiles (area weighted)",
+            value=summary["percentiles_mm"],
+            unit="mm",
+            state="measured",
+            confidence=confidence,
+            source="mesh.raycast_bvh",
+        )
+        signals["thin_wall_area_fraction"] = _metric(
+            label="Thin-wall surface area fraction",
+            value=summary["thin_wall_area_fraction"],
+            unit=None,
+            state="measured",
+            confidence=confidence,
+            source="mesh.raycast_bvh",
+            reason=f"area fraction with walls under {summary['thin_wall_mm']:g} mm",
+        )
+        robust_min = summary["percentiles_mm"].get("p1")
+        if robust_min is not None and not _state_known(signals["min_wall_thickness_mm"].get("state")):
+            # Curved walls the opposed-planes heuristic cannot see. The 1st
+            # percentile ignores knife edges a few sample points wide.
+            signals["min_wall_thickness_mm"] = _metric(
+                label="Minimum wall thickness",
+                value=robust_min,
+                unit="mm",
                 state="inferred",
-                confidence=0.55,
-                source="occ.opposed_planar_faces",
+                confidence=round(confidence * 0.8, 4),
+                source="mesh.raycast_bvh.p1",
+            )
+            sections["process_inputs"]["min_wall_thickness"] = _metric(
+                label="Minimum wall thickness",
+                value=robust_min,
+                unit="mm",
+                state="inferred",
+                confidence=round(confidence * 0.8, 4),
+                source="mesh.raycast_bvh.p1",
             )
+        sections["rule_inputs"]["wall_thickness_map"] = _metric(
+            label="Wall thickness map available",
+            value=True,
+            unit=None,
+            state="measured",
+            confidence=confidence,
+            source="mesh.raycast_bvh",
+        )
+
+    def _load_step(self, occ: dict[str, Any], step_path: Path):
+        if not self.reuse_loaded_step:
+            return self.geometry_analyzer._load_shape(occ, step_path)
+        stat = step_path.stat()
+        memo_key = (str(step_path), stat.st_size, stat.st_mtime_ns)
+        if self._loaded_step is None or self._loaded_step[0] != memo_key:
+            self._loaded_step = (memo_key, self.geometry_analyzer._load_shape(occ, step_path))
+        return self._loaded_step[1]
 
     def _mass_properties(self, shape) -> tuple[float | None, float | None]:
         try:
@@ -753,160 +1539,55 @@ class PartFactsService:
         except Exception:
             return None, None
 
-    def _count_solids(self, *, occ: dict[str, Any], shape) -> int:
-        try:
-            explorer = occ["TopExp_Explorer"](shape, occ["TopAbs_SOLID"])
-            count = 0
-            while explorer.More():
-                count += 1
-                explorer.Next()
-            return max(1, count)
-        except Exception:
-            return 1
+    def _count_solids(self, topology: TopologyIndex) -> int:
+        return max(1, len(topology.solids))
 
     def _extract_cylindrical_feature_metrics(
         self,
         *,
-        occ: dict[str, Any],
-        shape,
-        bbox_dims: tuple[float, float, float],
+        topology: TopologyIndex,
+        bounds: tuple[float, float, float, float, float, float],
     ) -> dict[str, Any]:
-        try:
-            from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
-            from OCC.Core.GeomAbs import GeomAbs_Cylinder
-        except Exception:
-            return {}
-
-        min_bbox_dim = min((dim for dim in bbox_dims if dim > 0), default=0.0)
-        cylindrical_candidates: list[tuple[float, float | None]] = []
-
-        try:
-            explorer = occ["TopExp_Explorer"](shape, occ["TopAbs_FACE"])
-            while explorer.More():
-                face = occ["topods"].Face(explorer.Current())
-                explorer.Next()
-                try:
-                    surface = BRepAdaptor_Surface(face, True)
-                except Exception:
-                    continue
-                if surface.GetType() != GeomAbs_Cylinder:
-                    continue
-
-                try:
-                    radius = abs(float(surface.Cylinder().Radius()))
-                except Exception:
-                    continue
-                if not math.isfinite(radius) or radius <= 0:
-                    continue
-
-                diameter = radius * 2.0
-                if min_bbox_dim > 0 and diameter > (min_bbox_dim * 0.7):
-                    # Likely an exterior cylindrical body, not a hole feature.
-                    continue
-
-                depth_mm: float | None = None
-                try:
-                    v_first = float(surface.FirstVParameter())
-                    v_last = float(surface.LastVParameter())
-                    depth_candidate = abs(v_last - v_first)
-                    if math.isfinite(depth_candidate) and depth_candidate > 0:
-                        depth_mm = depth_candidate
-                except Exception:
-                    depth_mm = None
-
-                if depth_mm is not None and depth_mm < (diameter * 0.15):
-                    # Very shallow cylindrical patches are usually blends/chamfers.
-                    continue
-
-                cylindrical_candidates.append((diameter, depth_mm))
-        except Exception:
-            return {}
-
-        if not cylindrical_candidates:
+        cylinders = [record for record in topology.faces_of_type("cylinder") if record.cylinder_radius is not None]
+        if not cylinders:
             return {"hole_count": 0, "threaded_holes_count": 0}
 
-        diameters = [diameter for diameter, _ in cylindrical_candidates if diameter > 0]
-        depths = [depth for _, depth in cylindrical_candidates if isinstance(depth, (int, float)) and depth > 0]
+        missing_axis = ((math.nan,) * 3, (math.nan,) * 3)
+        axes = np.array([record.cylinder_axis or missing_axis for record in cylinders], dtype=np.float64)
+        holes = recognize_holes(
+            np.array([record.cylinder_radius for record in cylinders], dtype=np.float64),
+            axes[:, 0],
+            axes[:, 1],
+            np.array([record.v_range or (math.nan, math.nan) for record in cylinders], dtype=np.float64),
+            bounds,
+        )
+        if not len(holes):
+            return {"hole_count": 0, "threaded_holes_count": 0}
 
-        threaded_holes_count = 0
-        for diameter, depth in cylindrical_candidates:
-            if not isinstance(depth, (int, float)) or depth <= 0:
-                continue
-            ratio = depth / max(diameter, 1e-9)
-            if 2.5 <= diameter <= 20.0 and 0.8 <= ratio <= 4.0:
-                threaded_holes_count += 1
+        diameters, depths, through = holes[:, 0], holes[:, 1], holes[:, 2]
+        with np.errstate(invalid="ignore"):
+            ratio = depths / np.maximum(diameters, 1e-9)
+            threaded = (diameters >= 2.5) & (diameters <= 20.0) & (ratio >= 0.8) & (ratio <= 4.0)
 
         payload: dict[str, Any] = {
-            "hole_count": len(cylindrical_candidates),
-            "threaded_holes_count": threaded_holes_count,
+            "hole_count": int(len(holes)),
+            "threaded_holes_count": int(threaded.sum()),
+            "through_hole_count": int(through.sum()),
+            "holes": [
+                [round(float(diameter), 4), round(float(depth), 4) if math.isfinite(depth) else None, int(flag)]
+                for diameter, depth, flag in holes
+            ],
         }
-        if diameters:
-            payload["min_hole_diameter_mm"] = min(diameters)
-        if depths:
-            payload["max_hole_depth_mm"] = max(depths)
+        if (diameters > 0).any():
+            payload["min_hole_diameter_mm"] = float(diameters[diameters > 0].min())
+        if (depths > 0).any():
+            payload["max_hole_depth_mm"] = float(depths[depths > 0].max())
         return payload
 
-    def _estimate_min_wall_thickness_mm(self, *, occ: dict[str, Any], shape) -> float | None:
-        try:
-            from OCC.Core.BRepAdaptor import BRepAdaptor_Surface
-            from OCC.Core.GeomAbs import GeomAbs_Plane
-        except Exception:
-            return None
-
-        plane_equations: list[tuple[tuple[float, float, float], float]] = []
-        try:
-            explorer = occ["TopExp_Explorer"](shape, occ["TopAbs_FACE"])
-            while explorer.More():
-                face = occ["topods"].Face(explorer.Current())
-                explorer.Next()
-                try:
-                    surface = BRepAdaptor_Surface(face, True)
-                except Exception:
-                    continue
-                if surface.GetType() != GeomAbs_Plane:
-                    continue
-                try:
-                    plane = surface.Plane()
-                    normal_dir = plane.Axis().Direction()
-                    point = plane.Location()
-                    normal = (
-                        float(normal_dir.X()),
-                        float(normal_dir.Y()),
-                        float(normal_dir.Z()),
-                    )
-                    length = math.sqrt(
-                        normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2]
-                    )
-                    if length <= 1e-9:
-                        continue
-                    unit_normal = (normal[0] / length, normal[1] / length, normal[2] / length)
-                    d = -(
-                        unit_normal[0] * float(point.X())
-                        + unit_normal[1] * float(point.Y())
-                        + unit_normal[2] * float(point.Z())
-                    )
-                except Exception:
-                    continue
-                plane_equations.append((unit_normal, d))
-        except Exception:
-            return None
-
-        if len(plane_equations) < 2:
-            return None
-
-        min_distance: float | None = None
-        for idx, (n1, d1) in enumerate(plane_equations):
-            for n2, d2 in plane_equations[idx + 1 :]:
-                dot = n1[0] * n2[0] + n1[1] * n2[1] + n1[2] * n2[2]
-                if dot > -0.97:
-                    continue
-                candidate = abs(d1 - d2)
-                if not math.isfinite(candidate) or candidate <= 1e-4:
-                    continue
-                if min_distance is None or candidate < min_distance:
-                    min_distance = candidate
-
-        return min_distance
+    def _estimate_min_wall_thickness_mm(self, topology: TopologyIndex) -> float | None:
+        return min_opposed_plane_gap(
+            record.plane for record in topology.faces_of_type("plane") if record.plane is not None
+        )
 
     def _geometry_section_defaults(self) -> dict[str, dict[str, Any]]:
         return {
@@ -937,7 +1618,12 @@ class PartFactsService:
             "pockets_present": _metric(label="Pockets/slotted corners detected"),
             "feature_complexity_score": _metric(label="Feature complexity score"),
             "min_wall_thickness_mm": _metric(label="Minimum wall thickness", unit="mm"),
+            "raycast_min_wall_thickness_mm": _metric(label="Minimum wall thickness (ray-cast)", unit="mm"),
+            "wall_thickness_percentiles_mm": _metric(label="Wall thickness percentiles (area weighted)", unit="mm"),
+            "thin_wall_area_fraction": _metric(label="Thin-wall surface area fraction"),
             "hole_count": _metric(label="Hole count"),
+            "through_hole_count": _metric(label="Through hole count"),
+            "hole_table": _metric(label="Hole table", unit="mm"),
             "threaded_holes_count": _metric(label="Threaded hole count"),
             "min_hole_diameter_mm": _metric(label="Minimum hole diameter", unit="mm"),
             "max_hole_depth_mm": _metric(label="Maximum hole depth", unit="mm"),
@@ -1284,6 +1970,16 @@ class PartFactsService:
 
         return missing[:24]
 
+    def thickness_map_path(self, *, model_id: str, component_node_name: str) -> Path:
+        return self._facts_path(model_id=model_id, component_node_name=component_node_name).with_suffix(
+            ".thickness.glb"
+        )
+
+    def _geometry_layer_path(self, *, model_id: str, component_node_name: str) -> Path:
+        return self._facts_path(model_id=model_id, component_node_name=component_node_name).with_suffix(
+            ".geometry.json"
+        )
+
     def _facts_path(self, *, model_id: str, component_node_name: str) -> Path:
         safe_component = re.sub(r"[^a-zA-Z0-9_.-]+", "_", component_node_name.strip()).strip("._")
         if not safe_component:
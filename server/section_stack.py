@@ -0,0 +1,132 @@
+"""
+Section stacks: N parallel planar slices through a part along one axis.
+
+The OCC side (``CADServiceOCC.generate_section_stack``) intersects the shape
+with every slice plane in a single boolean operation and hands back the
+projected section polylines per slice. This module owns the geometry-agnostic
+part: where the slices go, which slice a section edge belongs to, and how the
+stack is stored (one binary metadata file with a stacked segment array plus a
+PNG/SVG render per slice, all sharing one normalization so slices line up).
+"""
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+from .line_raster import normalize_segments, render_segments_png
+from .line_svg import render_segments_svg, svg_path_for
+from .view_metadata import write_view_metadata
+
+MAX_SECTION_SLICES = 64
+AXIS_INDEX = {"x": 0, "y": 1, "z": 2}
+STACK_METADATA_FILENAME = "stack.json"
+SLICE_COLOR = "#0e1e2f"
+SLICE_LINEWIDTH_PT = 0.7
+
+_COMPONENT_RE = re.compile(r"^component_\d+$")
+_STACK_ID_RE = re.compile(r"^[xyz]\d{1,2}(?:_component_\d+)?$")
+_SLICE_NAME_RE = re.compile(r"^slice_\d{3}$")
+
+
+class SectionStackError(RuntimeError):
+    pass
+
+
+def slice_name(index: int) -> str:
+    return f"slice_{index:03d}"
+
+
+def stack_id_for(axis: str, count: int, component_node_name: str | None = None) -> str:
+    """Directory-safe id for a stack; only ``component_N`` names select a sub-solid."""
+    stack_id = f"{axis}{count}"
+    if isinstance(component_node_name, str) and _COMPONENT_RE.match(component_node_name.strip()):
+        stack_id += f"_{component_node_name.strip()}"
+    return stack_id
+
+
+def is_stack_id(value: str) -> bool:
+    return bool(_STACK_ID_RE.match(value))
+
+
+def is_slice_name(value: str) -> bool:
+    return bool(_SLICE_NAME_RE.match(value))
+
+
+def slice_positions(lo: float, hi: float, count: int) -> np.ndarray:
+    """Cell-centred slice offsets, so no plane grazes the bounding faces."""
+    if count < 1 or count > MAX_SECTION_SLICES:
+        raise SectionStackError(f"count must be between 1 and {MAX_SECTION_SLICES}.")
+    step = (hi - lo) / count
+    return lo + step * (np.arange(count, dtype=np.float64) + 0.5)
+
+
+def assign_to_slices(coords: np.ndarray, positions: np.ndarray) -> np.ndarray:
+    """Index of the nearest slice plane for each axis coordinate."""
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1)
+    return np.abs(coords[:, None] - positions[None, :]).argmin(axis=1)
+
+
+def stack_slices(slice_segments: Sequence[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+    """Concatenate per-slice ``(n_i, 2, 2)`` arrays; returns ``(segments, slice_ids)``."""
+    pieces = [np.asarray(item, dtype=np.float64).reshape(-1, 2, 2) for item in slice_segments]
+    if not pieces:
+        return np.zeros((0, 2, 2), dtype=np.float64), np.zeros(0, dtype=np.uint32)
+    segments = np.concatenate(pieces, axis=0)
+    slice_ids = np.repeat(np.arange(len(pieces), dtype=np.uint32), [piece.shape[0] for piece in pieces])
+    return segments, slice_ids
+
+
+def _remove_stale_slices(output_dir: Path, *, keep) -> None:
+    """Drop renders (and their variants) of slices a previous run left behind."""
+    keep = set(keep)
+    for path in output_dir.glob("slice_*"):
+        name = path.name.split(".", 1)[0]
+        if is_slice_name(name) and name not in keep:
+            path.unlink(missing_ok=True)
+
+
+def write_section_stack(
+    output_dir: Path,
+    *,
+    axis: str,
+    positions: np.ndarray,
+    slice_segments: Sequence[np.ndarray],
+) -> Dict[str, Any]:
+    """
+    Render every non-empty slice and write the stacked metadata. Returns the
+    per-slice PNG paths (keyed by ``slice_name``) and the metadata path.
+    """
+    segments, slice_ids = stack_slices(slice_segments)
+    if segments.shape[0] == 0:
+        raise SectionStackError("Section stack produced no geometry.")
+    normalized, min_vals, max_vals = normalize_segments(segments)
+
+    views: Dict[str, Path] = {}
+    counts: List[int] = np.bincount(slice_ids, minlength=len(positions)).tolist()
+    for index, count in enumerate(counts):
+        if count == 0:
+            continue
+        selected = normalized[slice_ids == index]
+        out_path = output_dir / f"{slice_name(index)}.png"
+        render_segments_png(selected, out_path, color=SLICE_COLOR, linewidth_pt=SLICE_LINEWIDTH_PT)
+        render_segments_svg(selected, svg_path_for(out_path), color=SLICE_COLOR, linewidth_pt=SLICE_LINEWIDTH_PT)
+        views[slice_name(index)] = out_path
+    _remove_stale_slices(output_dir, keep=views.keys())
+
+    meta_path = output_dir / STACK_METADATA_FILENAME
+    write_view_metadata(
+        meta_path,
+        {
+            "type": "section_stack",
+            "axis": axis,
+            "positions": [float(value) for value in positions],
+            "slice_segment_counts": counts,
+            "bounds": {"min": min_vals.tolist(), "max": max_vals.tolist()},
+            "segments": normalized,
+            "segment_slices": slice_ids,
+        },
+    )
+    return {"views": views, "metadata": meta_path, "slice_segment_counts": counts}
@@ -0,0 +1,221 @@
+"""
+CPU-only shaded renderer for vision view sets.
+
+HLR line drawings are exact but slow on large parts and carry no surface
+cues. This renderer takes the preview tessellation (the GLB written at import)
+and rasterizes it orthographically with a vectorized NumPy z-buffer and flat
+Lambert shading, producing the same ``x``/``y``/``z`` views as the OCC path.
+
+Rasterization is scanline based but vectorized across triangles: every
+(triangle, pixel row) pair is intersected with the triangle's edges at once,
+the resulting spans are expanded into fragments with depth taken from the
+triangle's plane, and the depth test is a single ``np.minimum.at``.
+Triangles are processed in chunks so memory stays bounded.
+"""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+from uuid import uuid4
+
+import numpy as np
+import trimesh
+from PIL import Image, ImageColor
+
+from .image_variants import schedule_variants
+
+DEFAULT_SIZE_PX = 1500
+DEFAULT_MARGIN_PX = 30
+DEFAULT_COLOR = "#8fa6bf"
+AMBIENT = 0.25
+DIFFUSE = 0.75
+_MAX_FRAGMENTS = 1 << 22
+
+# Same view directions and screen bases as the OCC projection table.
+VIEW_DIRECTIONS: Dict[str, Dict[str, Tuple[float, float, float]]] = {
+    "x": {"dir": (1.0, 0.0, 0.0), "basis_x": (0.0, 1.0, 0.0), "basis_y": (0.0, 0.0, 1.0)},
+    "y": {"dir": (0.0, 1.0, 0.0), "basis_x": (1.0, 0.0, 0.0), "basis_y": (0.0, 0.0, 1.0)},
+    "z": {"dir": (0.0, 0.0, 1.0), "basis_x": (1.0, 0.0, 0.0), "basis_y": (0.0, 1.0, 0.0)},
+}
+
+
+class ShadedRenderError(RuntimeError):
+    pass
+
+
+def load_mesh(mesh_path: Path, node_name: str | None = None) -> Tuple[np.ndarray, np.ndarray]:
+    """World-space ``(vertices, faces)`` of a GLB, or of one component node in it."""
+    if not mesh_path.exists():
+        raise ShadedRenderError("Preview mesh not found; re-import the model.")
+    scene = trimesh.load(mesh_path, force="scene")
+    if node_name is not None and node_name not in scene.graph.nodes_geometry:
+        raise ShadedRenderError(f"Component '{node_name}' not found in preview mesh.")
+    nodes = [node_name] if node_name is not None else list(scene.graph.nodes_geometry)
+
+    vertices: list[np.ndarray] = []
+    faces: list[np.ndarray] = []
+    offset = 0
+    for node in nodes:
+        transform, geometry_name = scene.graph[node]
+        mesh = scene.geometry.get(geometry_name)
+        if not isinstance(mesh, trimesh.Trimesh) or len(mesh.faces) == 0:
+            continue
+        vertices.append(trimesh.transform_points(mesh.vertices, transform))
+        faces.append(np.asarray(mesh.faces, dtype=np.int64) + offset)
+        offset += len(mesh.vertices)
+    if not faces:
+        raise ShadedRenderError("Preview mesh has no triangles.")
+    return np.concatenate(vertices, axis=0), np.concatenate(faces, axis=0)
+
+
+def _triangle_chunks(costs: np.ndarray, budget: int) -> Iterable[np.ndarray]:
+    """Split triangle indices into runs whose summed cost stays near ``budget``."""
+    cumulative = np.cumsum(costs)
+    start = 0
+    while start < costs.size:
+        spent = cumulative[start - 1] if start else 0
+        stop = max(int(np.searchsorted(cumulative, spent + budget, side="right")), start + 1)
+        yield np.arange(start, stop)
+        start = stop
+
+
+def rasterize_mesh(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    *,
+    view_dir: Tuple[float, float, float],
+    basis_x: Tuple[float, float, float],
+    basis_y: Tuple[float, float, float],
+    size_px: int = DEFAULT_SIZE_PX,
+    margin_px: int = DEFAULT_MARGIN_PX,
+    color: str = DEFAULT_COLOR,
+) -> np.ndarray:
+    """Orthographic, Lambert-shaded RGBA ``uint8`` image of a triangle mesh."""
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    direction = np.asarray(view_dir, dtype=np.float64)
+    bx = np.asarray(basis_x, dtype=np.float64)
+    by = np.asarray(basis_y, dtype=np.float64)
+
+    # Screen space: the viewer sits on +direction, so depth grows away from it.
+    u, v, depth = vertices @ bx, vertices @ by, -(vertices @ direction)
+    u_mid, v_mid = (u.min() + u.max()) / 2.0, (v.min() + v.max()) / 2.0
+    span = max(np.ptp(u), np.ptp(v), 1e-9)
+    scale = (size_px - 2 * margin_px) / span
+    screen = np.stack([(u - u_mid) * scale + size_px / 2.0, size_px / 2.0 - (v - v_mid) * scale, depth], axis=1)
+    tri = screen[faces]  # (T, 3, 3): x, y, depth per corner
+
+    # Depth plane z = a*x + b*y + c per triangle; edge-on triangles are dropped.
+    plane = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    keep = np.flatnonzero(np.abs(plane[:, 2]) > 1e-12)
+    tri, plane = tri[keep], plane[keep]
+    slope_x = -plane[:, 0] / plane[:, 2]
+    slope_y = -plane[:, 1] / plane[:, 2]
+    offset = tri[:, 0, 2] - slope_x * tri[:, 0, 0] - slope_y * tri[:, 0, 1]
+
+    # Two-sided flat Lambert with a headlight raised up and to the left.
+    corners = vertices[faces[keep]]
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1)
+    light = direction + 0.45 * by - 0.3 * bx
+    light /= np.linalg.norm(light)
+    shade = AMBIENT + DIFFUSE * np.abs(normals @ light) / np.where(lengths > 0, lengths, 1.0)
+
+    # Pixel rows whose centres can fall inside each triangle.
+    row_lo = np.clip(np.ceil(tri[:, :, 1].min(axis=1) - 0.5), 0, size_px).astype(np.int64)
+    row_hi = np.clip(np.floor(tri[:, :, 1].max(axis=1) - 0.5), -1, size_px - 1).astype(np.int64)
+    row_counts = np.maximum(row_hi - row_lo + 1, 0)
+    width = np.ceil(np.ptp(tri[:, :, 0], axis=1)).astype(np.int64) + 1
+
+    zbuf = np.full(size_px * size_px, np.inf)
+    shade_buf = np.zeros(size_px * size_px)
+    for chunk in _triangle_chunks(row_counts * width, _MAX_FRAGMENTS):
+        counts = row_counts[chunk]
+        if counts.sum() == 0:
+            continue
+        # One entry per (triangle, row): intersect the row centre with the edges.
+        owner = np.repeat(chunk, counts)
+        first_row = np.cumsum(counts) - counts
+        row = row_lo[owner] + np.arange(owner.size) - np.repeat(first_row, counts)
+        cy = row + 0.5
+        left = np.full(owner.size, np.inf)
+        right = np.full(owner.size, -np.inf)
+        for i, j in ((0, 1), (1, 2), (2, 0)):
+            ax, ay = tri[owner, i, 0], tri[owner, i, 1]
+            bx_, by_ = tri[owner, j, 0], tri[owner, j, 1]
+            crosses = (ay != by_) & (cy >= np.minimum(ay, by_)) & (cy <= np.maximum(ay, by_))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x = ax + (cy - ay) / (by_ - ay) * (bx_ - ax)
+            left = np.where(crosses, np.minimum(left, x), left)
+            right = np.where(crosses, np.maximum(right, x), right)
+        valid = np.isfinite(left)
+        col_lo = np.clip(np.ceil(np.where(valid, left, 0.0) - 0.5), 0, size_px).astype(np.int64)
+        col_hi = np.clip(np.floor(np.where(valid, right, -1.0) - 0.5), -1, size_px - 1).astype(np.int64)
+        spans = np.maximum(col_hi - col_lo + 1, 0)
+        if spans.sum() == 0:
+            continue
+
+        # Expand spans into fragments.
+        frag_owner = np.repeat(owner, spans)
+        frag_row = np.repeat(row, spans)
+        frag_col = np.repeat(col_lo, spans) + np.arange(frag_owner.size) - np.repeat(np.cumsum(spans) - spans, spans)
+        z = slope_x[frag_owner] * (frag_col + 0.5) + slope_y[frag_owner] * (frag_row + 0.5) + offset[frag_owner]
+        pix = frag_row * size_px + frag_col
+
+        # Depth test: keep the nearest fragment per pixel, then shade the winners.
+        np.minimum.at(zbuf, pix, z)
+        winners = z == zbuf[pix]
+        shade_buf[pix[winners]] = shade[frag_owner[winners]]
+
+    covered = np.isfinite(zbuf)
+    base = np.array(ImageColor.getrgb(color)[:3], dtype=np.float64)
+    image = np.zeros((size_px * size_px, 4), dtype=np.uint8)
+    image[covered, :3] = np.clip(shade_buf[covered, None] * base[None, :], 0, 255).astype(np.uint8)
+    image[covered, 3] = 255
+    return image.reshape(size_px, size_px, 4)
+
+
+def _save_png(pixels: np.ndarray, out_path: Path) -> Path:
+    image = Image.fromarray(pixels, mode="RGBA")
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.{uuid4().hex}.tmp")
+    try:
+        image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    schedule_variants(out_path, image)
+    return out_path
+
+
+def render_shaded_views(
+    mesh_path: Path,
+    output_dir: Path,
+    *,
+    component_node_name: str | None = None,
+    size_px: int = DEFAULT_SIZE_PX,
+) -> Tuple[Dict[str, Path], Dict[str, float]]:
+    """Render every ``VIEW_DIRECTIONS`` entry; returns view paths and timings."""
+    started = time.perf_counter()
+    vertices, faces = load_mesh(mesh_path, component_node_name)
+    loaded = time.perf_counter()
+
+    views: Dict[str, Path] = {}
+    timings: Dict[str, float] = {"load_sec": round(loaded - started, 4), "triangle_count": int(faces.shape[0])}
+    for name, config in VIEW_DIRECTIONS.items():
+        view_started = time.perf_counter()
+        pixels = rasterize_mesh(
+            vertices,
+            faces,
+            view_dir=config["dir"],
+            basis_x=config["basis_x"],
+            basis_y=config["basis_y"],
+            size_px=size_px,
+        )
+        views[name] = _save_png(pixels, output_dir / f"{name}.png")
+        timings[f"{name}_sec"] = round(time.perf_counter() - view_started, 4)
+    timings["total_sec"] = round(time.perf_counter() - started, 4)
+    return views, timings
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.cad_service import CADService  # noqa: E402
+from server.view_metadata import binary_path_for, read_view_metadata  # noqa: E402
+
+
+def _legacy_collect_edges(triangles: np.ndarray) -> list[tuple[int, int]]:
+    edges = set()
+    for a, b, c in triangles:
+        edges.add(tuple(sorted((int(a), int(b)))))
+        edges.add(tuple(sorted((int(b), int(c)))))
+        edges.add(tuple(sorted((int(c), int(a)))))
+    return sorted(edges)
+
+
+def test_collect_edges_matches_set_based_extraction(tmp_path: Path):
+    service = CADService(workspace=tmp_path / "work")
+    rng = np.random.default_rng(7)
+    triangles = rng.integers(0, 400, size=(2000, 3), dtype=np.int32)
+
+    edges = service._collect_edges(triangles)
+
+    assert edges.shape[1] == 2
+    assert [tuple(edge) for edge in edges.tolist()] == _legacy_collect_edges(triangles)
+    assert service._collect_edges(np.zeros((0, 3), dtype=np.int32)).shape == (0, 2)
+
+
+def test_render_projection_draws_deduplicated_edges(tmp_path: Path):
+    service = CADService(workspace=tmp_path / "work")
+    projected = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])
+    triangles = np.array([[0, 1, 2], [0, 2, 3]])
+    edges = service._collect_edges(triangles)
+    out_path = tmp_path / "top.png"
+
+    assert len(edges) == 5  # the shared diagonal is only drawn once
+    service._render_projection(projected, edges, out_path)
+
+    image = Image.open(out_path)
+    assert image.size == (1500, 1500)
+    alpha = np.asarray(image.convert("RGBA"))[..., 3]
+    assert alpha[750, 750] > 0  # diagonal edge through the centre
+    assert alpha[375, 375] == 0
+
+
+class _Vec:
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+class _Edge:
+    def __init__(self, points: list[tuple[float, float]]) -> None:
+        self.points = points
+        self.calls = 0
+
+    def discretize(self, count: int) -> list[_Vec]:
+        self.calls += 1
+        return [_Vec(x, y) for x, y in self.points]
+
+
+class _Shape:
+    def __init__(self, edges: list[_Edge]) -> None:
+        self.Edges = edges
+
+
+def _legacy_normalized_segments(edges: list[_Edge]) -> list:
+    segments, all_points = [], []
+    for edge in edges:
+        pts = [_Vec(x, y) for x, y in edge.points]
+        for a, b in zip(pts, pts[1:]):
+            pair = [[a.x, a.y], [b.x, b.y]]
+            segments.append(pair)
+            all_points.extend(pair)
+    coords = np.array(all_points, dtype=np.float64)
+    min_vals = coords.min(axis=0)
+    span = np.clip(coords.max(axis=0) - min_vals, 1e-5, None)
+    return [[((np.array(a) - min_vals) / span).tolist(), ((np.array(b) - min_vals) / span).tolist()] for a, b in segments]
+
+
+def test_shape2d_view_discretizes_each_edge_once(tmp_path: Path):
+    service = CADService(workspace=tmp_path / "work")
+    edges = [_Edge([(0.0, 0.0), (4.0, 0.0), (4.0, 2.0)]), _Edge([(4.0, 2.0), (1.0, 3.0)])]
+    out_path = tmp_path / "top.png"
+
+    meta_path = service._write_shape2d_view(
+        _Shape(edges), out_path, tmp_path / "top.json", {"type": "shape2d", "direction": [0.0, 0.0, 1.0]}
+    )
+
+    assert [edge.calls for edge in edges] == [1, 1]
+    assert out_path.exists() and out_path.with_suffix(".svg").exists()
+    payload = read_view_metadata(binary_path_for(meta_path))
+    assert list(payload) == ["type", "direction", "bounds", "style", "segments"]
+    assert payload["bounds"] == {"min": [0.0, 0.0], "max": [4.0, 3.0]}
+    assert np.allclose(payload["segments"], _legacy_normalized_segments(edges))
+
+    assert service._write_shape2d_view(_Shape([]), tmp_path / "empty.png", tmp_path / "empty.json", {}) is None
@@ -156,3 +156,38 @@ def test_component_mapping_falls_back_to_full_shape_when_index_missing():
     resolved_shape, fallback = analyzer._resolve_analysis_shape(occ, shape, "component_7")
     assert resolved_shape is shape
     assert fallback is True
+
+
+def test_analyze_reuses_preloaded_shape_and_topology_without_reading_step(tmp_path: Path):
+    from server.topology_index import TopologyIndex
+
+    class FakeShape:
+        def ShapeType(self):
+            return "compound"
+
+    class EmptyExplorer:
+        def __init__(self, *_args):
+            pass
+
+        def More(self):
+            return False
+
+    class PreloadedAnalyzer(CncGeometryAnalyzer):
+        def _import_occ(self):
+            return {"TopExp_Explorer": EmptyExplorer, "TopAbs_SOLID": "solid"}
+
+        def _load_shape(self, occ, step_path):
+            raise AssertionError("STEP must not be re-read when a shape is supplied")
+
+        def _shape_bounds(self, occ, shape):
+            return (0.0, 0.0, 0.0, 10.0, 10.0, 10.0)
+
+    payload = PreloadedAnalyzer().analyze(
+        step_path=tmp_path / "missing.step",
+        component_node_name="component_1",
+        shape=FakeShape(),
+        topology=TopologyIndex(solids=[], faces=[], edges=[]),
+    )
+    assert payload["part_filename"] == "missing.step"
+    assert payload["summary"]["machinability_score"] == 100
+    assert payload["corners"] == []
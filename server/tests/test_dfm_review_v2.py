@@ -14,6 +14,7 @@ from server.dfm_review_v2 import (
     _evaluate_rule_violation,
     _missing_required_inputs,
     generate_dfm_review_v2,
+    review_fact_keys,
 )
 
 
@@ -592,3 +593,25 @@ def test_review_v2_phase2_geometry_route_emits_new_violations_and_coverage_summa
         coverage["checks_evaluated"] + coverage["blocked_by_missing_inputs"] + coverage["checks_unresolved"]
     )
     assert coverage["checks_no_evaluator"] <= coverage["checks_unresolved"]
+
+
+def test_review_fact_keys_cover_planned_rule_inputs_only():
+    bundle = _bundle()
+    plan = {
+        "plan_id": "plan_1",
+        "route_source": "selected",
+        "process_id": "cnc_milling",
+        "pack_ids": ["A_DRAWING"],
+        "overlay_id": None,
+        "role_id": "general_dfm",
+        "template_id": "executive_1page",
+    }
+
+    keys = review_fact_keys(bundle, execution_plans=[plan], cost_enabled=False)
+    expected = set(_all_required_facts(bundle, ["A_DRAWING"]))
+    assert keys == expected
+    other_pack_inputs = set(_all_required_facts(bundle, [pack["pack_id"] for pack in bundle.rule_library["packs"]]))
+    assert keys < other_pack_inputs
+
+    with_cost = review_fact_keys(bundle, execution_plans=[plan])
+    assert {"bbox_x_mm", "part_volume_mm3", "hole_count"} <= with_cost - keys
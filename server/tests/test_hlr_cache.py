@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.hlr_cache import HlrSegmentCache, component_key, direction_key  # noqa: E402
+
+
+_CONFIG_X = {"axis": "x", "dir": (1.0, 0.0, 0.0), "basis_x": (0.0, 1.0, 0.0), "basis_y": (0.0, 0.0, 1.0)}
+
+
+def test_store_and_load_round_trip(tmp_path: Path):
+    cache = HlrSegmentCache(tmp_path / "cache")
+    segments = np.array([[[0.0, 0.0], [1.0, 2.0]], [[1.0, 2.0], [3.0, 4.0]]])
+    key = direction_key("x", _CONFIG_X)
+
+    assert cache.load("abc", component_key(None), "exact", key) is None
+    cache.store("abc", component_key(None), "exact", key, segments)
+
+    loaded = cache.load("abc", "all", "exact", key)
+    assert np.array_equal(loaded, segments)
+    assert cache.load("abc", "all", "fast", key) is None
+    assert cache.load("abc", component_key(2), "exact", key) is None
+    assert list(cache.load_many("abc", "all", "exact", [key, "y_missing"])) == [key]
+
+
+def test_shape_hash_follows_file_content(tmp_path: Path):
+    cache = HlrSegmentCache(tmp_path / "cache")
+    step_a = tmp_path / "a.step"
+    step_b = tmp_path / "b.step"
+    step_a.write_bytes(b"ISO-10303-21; solid A")
+    step_b.write_bytes(b"ISO-10303-21; solid A")
+
+    assert cache.shape_hash(step_a) == cache.shape_hash(step_b)
+    step_b.write_bytes(b"ISO-10303-21; solid B, edited")
+    assert cache.shape_hash(step_a) != cache.shape_hash(step_b)
+
+
+def test_direction_key_changes_with_projection_and_corrupt_entries_miss(tmp_path: Path):
+    flipped = dict(_CONFIG_X, dir=(-1.0, 0.0, 0.0))
+    assert direction_key("x", _CONFIG_X) != direction_key("x", flipped)
+
+    cache = HlrSegmentCache(tmp_path / "cache")
+    key = direction_key("x", _CONFIG_X)
+    path = cache.store("abc", "all", "exact", key, np.zeros((1, 2, 2)))
+    path.write_bytes(b"not a numpy file")
+    assert cache.load("abc", "all", "exact", key) is None
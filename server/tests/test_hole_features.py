@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.hole_features import recognize_holes  # noqa: E402
+
+BOUNDS = (0.0, 0.0, 0.0, 100.0, 60.0, 20.0)
+NAN3 = (np.nan, np.nan, np.nan)
+
+
+def _holes(faces):
+    radius, origin, direction, v_range = zip(*faces)
+    rows = recognize_holes(np.array(radius), np.array(origin), np.array(direction), np.array(v_range), BOUNDS)
+    return sorted(map(tuple, rows.tolist()), key=lambda row: (row[0], row[1]))
+
+
+def test_split_cylinders_and_counterbores_become_single_holes():
+    faces = [
+        # Through hole split into two half faces, one with a reversed axis.
+        (3.0, (10.0, 10.0, 0.0), (0.0, 0.0, 1.0), (0.0, 20.0)),
+        (3.0, (10.0, 10.0, 20.0), (0.0, 0.0, -1.0), (0.0, 20.0)),
+        # Counterbored hole: 4 mm bore meeting a 7 mm counterbore 6 mm below the top.
+        (2.0, (40.0, 30.0, 0.0), (0.0, 0.0, 1.0), (0.0, 14.0)),
+        (3.5, (40.0, 30.0, 14.0), (0.0, 0.0, 1.0), (0.0, 6.0)),
+        # Blind 5 mm hole drilled along x.
+        (2.5, (100.0, 50.0, 10.0), (-1.0, 0.0, 0.0), (0.0, 12.0)),
+        # Coaxial with the first hole but not touching it: a separate feature.
+        (1.5, (10.0, 10.0, 30.0), (0.0, 0.0, 1.0), (0.0, 5.0)),
+        # Fillet strip and outer boss are not holes.
+        (2.0, (60.0, 10.0, 0.0), (0.0, 0.0, 1.0), (0.0, 0.1)),
+        (20.0, (50.0, 30.0, 0.0), (0.0, 0.0, 1.0), (0.0, 20.0)),
+    ]
+
+    assert _holes(faces) == [
+        (3.0, 5.0, 0.0),
+        (4.0, pytest.approx(20.0), 1.0),
+        (5.0, pytest.approx(12.0), 0.0),
+        (6.0, pytest.approx(20.0), 1.0),
+    ]
+
+
+def test_faces_without_axis_are_kept_as_their_own_holes():
+    faces = [
+        (4.0, NAN3, NAN3, (0.0, 10.0)),
+        (4.0, NAN3, NAN3, (np.nan, np.nan)),
+    ]
+    rows = _holes(faces)
+    assert rows[0] == (8.0, 10.0, 0.0)
+    assert rows[1][0] == 8.0 and np.isnan(rows[1][1])
+    assert recognize_holes(np.empty(0), np.empty((0, 3)), np.empty((0, 3)), np.empty((0, 2)), BOUNDS).shape == (0, 3)
+
+
+def test_grouping_scales_to_thousands_of_faces():
+    rng = np.random.default_rng(3)
+    centres = np.column_stack([rng.uniform(0, 100, 5000), rng.uniform(0, 60, 5000), np.zeros(5000)])
+    # Each hole is two half faces, the second one with its axis reversed from the top.
+    origin = np.concatenate([centres, centres + [0.0, 0.0, 20.0]])
+    direction = np.concatenate([np.tile([0.0, 0.0, 1.0], (5000, 1)), np.tile([0.0, 0.0, -1.0], (5000, 1))])
+    rows = recognize_holes(np.full(10000, 1.0), origin, direction, np.tile([0.0, 20.0], (10000, 1)), BOUNDS)
+    assert rows.shape == (5000, 3)
+    assert np.allclose(rows[:, 1], 20.0) and rows[:, 2].all()
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server import http_cache  # noqa: E402
+
+
+def _client(path: Path) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/artifact")
+    async def artifact(request: Request):
+        return await http_cache.file_response(request, path, media_type="model/gltf-binary")
+
+    return TestClient(app)
+
+
+def test_etag_revalidation_returns_304_until_content_changes(tmp_path: Path):
+    artifact = tmp_path / "preview.glb"
+    artifact.write_bytes(b"glTF" + bytes(range(256)) * 64)
+    client = _client(artifact)
+
+    first = client.get("/artifact")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag == http_cache.content_etag(artifact)
+    assert first.headers["cache-control"] == http_cache.REVALIDATE
+
+    repeat = client.get("/artifact", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["etag"] == etag
+
+    artifact.write_bytes(b"glTF regenerated")
+    changed = client.get("/artifact", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.content == b"glTF regenerated"
+
+
+def test_byte_ranges_and_pinned_versions(tmp_path: Path):
+    artifact = tmp_path / "preview.glb"
+    payload = bytes(range(256)) * 16
+    artifact.write_bytes(payload)
+    client = _client(artifact)
+    etag = http_cache.content_etag(artifact)
+
+    partial = client.get("/artifact", headers={"Range": "bytes=100-199", "If-Range": etag})
+    assert partial.status_code == 206
+    assert partial.content == payload[100:200]
+
+    stale = client.get("/artifact", headers={"Range": "bytes=100-199", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == payload
+
+    pinned = client.get(f"/artifact?v={etag.strip(chr(34))}")
+    assert pinned.headers["cache-control"] == http_cache.IMMUTABLE
+
+
+def test_negotiated_representations_get_distinct_validators(tmp_path: Path):
+    source = tmp_path / "top.bin"
+    source.write_bytes(b"RDVM" + bytes(64))
+    app = FastAPI()
+
+    @app.get("/metadata")
+    async def metadata(request: Request):
+        requested = "binary" if "application/octet-stream" in request.headers.get("accept", "") else "json"
+        headers = http_cache.cache_headers(request, source, variant=requested)
+        return http_cache.not_modified(request, headers) or Response(requested, headers=headers)
+
+    client = TestClient(app)
+    as_json = client.get("/metadata")
+    as_binary = client.get("/metadata", headers={"Accept": "application/octet-stream"})
+    assert as_json.headers["vary"] == as_binary.headers["vary"] == "Accept"
+    assert as_json.headers["etag"] != as_binary.headers["etag"]
+
+    # A validator for one representation never revalidates the other.
+    crossed = client.get("/metadata", headers={"Accept": "application/octet-stream", "If-None-Match": as_json.headers["etag"]})
+    assert crossed.status_code == 200
+    assert crossed.text == "binary"
+    revalidated = client.get("/metadata", headers={"If-None-Match": as_json.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["vary"] == "Accept"
+
+    pinned = client.get(f"/metadata?v={as_binary.headers['etag'].strip(chr(34))}", headers={"Accept": "application/octet-stream"})
+    assert pinned.headers["cache-control"] == http_cache.IMMUTABLE
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.image_variants import THUMBNAIL_PX, ensure_variant, schedule_variants, variant_path  # noqa: E402
+from server.line_raster import render_segments_png  # noqa: E402
+
+
+_SQUARE = np.array(
+    [
+        [[0.1, 0.1], [0.9, 0.1]],
+        [[0.9, 0.1], [0.9, 0.9]],
+        [[0.9, 0.9], [0.1, 0.9]],
+        [[0.1, 0.9], [0.1, 0.1]],
+    ]
+)
+
+
+def test_render_queues_smaller_thumbnail_and_webp_variants(tmp_path: Path):
+    png = render_segments_png(_SQUARE, tmp_path / "top.png", color="#0e1e2f", linewidth_pt=0.7, variants=False)
+    future = schedule_variants(png)
+    assert future is not None
+    future.result(timeout=30)
+
+    thumb_png = variant_path(png, size="thumb", format="png")
+    thumb_webp = variant_path(png, size="thumb", format="webp")
+    full_webp = variant_path(png, size="full", format="webp")
+    assert [path.name for path in (thumb_png, thumb_webp, full_webp)] == ["top.thumb.png", "top.thumb.webp", "top.webp"]
+
+    with Image.open(thumb_png) as thumb:
+        assert max(thumb.size) == THUMBNAIL_PX
+        assert thumb.mode == "RGBA"
+        # Lines survive the downscale and the background stays transparent.
+        alpha = np.asarray(thumb.getchannel("A"))
+        assert alpha.max() > 0 and alpha[THUMBNAIL_PX // 2, THUMBNAIL_PX // 2] == 0
+    assert thumb_webp.stat().st_size < png.stat().st_size
+    with Image.open(full_webp) as webp:
+        assert webp.size == (1500, 1500)
+
+
+def test_ensure_variant_regenerates_stale_variants(tmp_path: Path):
+    png = render_segments_png(_SQUARE, tmp_path / "top.png", color="#0e1e2f", linewidth_pt=0.7, variants=False)
+    assert ensure_variant(png) == png
+
+    thumb = ensure_variant(png, size="thumb", format="webp")
+    assert thumb.exists()
+    stale_ns = png.stat().st_mtime_ns - 10_000_000_000
+    os.utime(thumb, ns=(stale_ns, stale_ns))
+    assert ensure_variant(png, size="thumb", format="webp").stat().st_mtime_ns >= png.stat().st_mtime_ns
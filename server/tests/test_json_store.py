@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.draftlint_demo import DraftLintDemoService  # noqa: E402
+from server.json_store import json_transaction, read_json, write_json_atomic  # noqa: E402
+from server.model_store import ModelNotFoundError, ModelStore  # noqa: E402
+from server.review_store import ReviewStore  # noqa: E402
+
+
+def _increment_counter(path_str: str, iterations: int) -> None:
+    path = Path(path_str)
+    for _ in range(iterations):
+        with json_transaction(path, lambda: {"count": 0}) as payload:
+            payload["count"] += 1
+
+
+def _create_tickets(root_str: str, iterations: int) -> None:
+    store = ReviewStore(root=Path(root_str), templates_path=Path(root_str) / "templates.json")
+    for index in range(iterations):
+        store.create_ticket("model_x", {"title": f"ticket {index}", "author": "worker"})
+
+
+def _run_workers(target, args, worker_count: int = 4) -> None:
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=target, args=args) for _ in range(worker_count)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+
+
+def test_json_transaction_serializes_concurrent_processes(tmp_path: Path):
+    path = tmp_path / "counter.json"
+    _run_workers(_increment_counter, (str(path), 25))
+    assert read_json(path) == {"count": 100}
+
+
+def test_json_transaction_leaves_file_untouched_on_error(tmp_path: Path):
+    path = tmp_path / "store.json"
+    write_json_atomic(path, {"value": 1})
+
+    with pytest.raises(RuntimeError):
+        with json_transaction(path, dict) as payload:
+            payload["value"] = 2
+            raise RuntimeError("boom")
+
+    assert json.loads(path.read_text(encoding="utf-8")) == {"value": 1}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_review_store_allocates_unique_ticket_ids_across_processes(tmp_path: Path):
+    _run_workers(_create_tickets, (str(tmp_path), 10))
+
+    store = ReviewStore(root=tmp_path, templates_path=tmp_path / "templates.json")
+    ticket_ids = [ticket["id"] for ticket in store.list_tickets("model_x")]
+    assert len(ticket_ids) == 40
+    assert len(set(ticket_ids)) == 40
+
+
+def test_model_store_transaction_keeps_concurrent_field_updates(tmp_path: Path):
+    store = ModelStore(root=tmp_path)
+    created = store.create("part.step")
+
+    stale = store.get(created.model_id)
+    with store.transaction(created.model_id) as current:
+        current.component_profiles["component_1"] = {"material": "Steel"}
+    with store.transaction(created.model_id) as current:
+        current.views = {"top": tmp_path / "top.png"}
+
+    reloaded = store.get(created.model_id)
+    assert stale is not None and not stale.component_profiles
+    assert reloaded.component_profiles == {"component_1": {"material": "Steel"}}
+    assert set(reloaded.views) == {"top"}
+
+    with pytest.raises(ModelNotFoundError):
+        with store.transaction("missing"):
+            pass
+
+
+def test_draftlint_session_is_visible_to_another_service_instance(tmp_path: Path):
+    fixture_path = tmp_path / "fixture.json"
+    fixture_path.write_text(json.dumps({"issues": []}), encoding="utf-8")
+    template_png = tmp_path / "template.png"
+    template_png.write_bytes(b"png")
+
+    def _service() -> DraftLintDemoService:
+        return DraftLintDemoService(
+            root=tmp_path / "draftlint",
+            fixture_path=fixture_path,
+            template_png_path=template_png,
+        )
+
+    created = _service().create_session(
+        filename="drawing.png",
+        file_bytes=b"png-bytes",
+        standard_profile=None,
+    )
+
+    other_worker = _service()
+    session = other_worker.get_session(session_id=created["session_id"])
+    assert session["session_id"] == created["session_id"]
+    assert other_worker.get_session_source_mime_type(session_id=created["session_id"]) == "image/png"
+    assert other_worker.get_session_source_path(session_id=created["session_id"]).read_bytes() == b"png-bytes"
+
+    report_id = json.loads(
+        (tmp_path / "draftlint" / "sessions" / created["session_id"] / "session.json").read_text(encoding="utf-8")
+    )["report_id"]
+    assert other_worker.get_report(report_id=report_id)["report_id"] == report_id
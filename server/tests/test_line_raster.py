@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.line_raster import (  # noqa: E402
+    normalize_segments,
+    polylines_to_segments,
+    render_segments_png,
+)
+
+
+def _legacy_figure_png(segments: np.ndarray, out_path: Path, *, color: str, linewidth_pt: float) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    fig, ax = plt.subplots(figsize=(5, 5), dpi=300)
+    ax.add_collection(LineCollection(segments, colors=color, linewidths=linewidth_pt))
+    ax.set_aspect("equal", "box")
+    ax.axis("off")
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    fig.tight_layout(pad=0)
+    fig.savefig(out_path, transparent=True, bbox_inches="tight", pad_inches=0)
+    plt.close(fig)
+
+
+def _spiral_segments(count: int) -> np.ndarray:
+    theta = np.linspace(0.0, 12.0 * np.pi, count + 1)
+    radius = 0.05 + 0.45 * theta / theta.max()
+    points = np.stack([0.5 + radius * np.cos(theta), 0.5 + radius * np.sin(theta)], axis=1)
+    border = np.array([[[0, 0], [1, 0]], [[1, 0], [1, 1]], [[1, 1], [0, 1]], [[0, 1], [0, 0]]], dtype=np.float64)
+    return np.concatenate([border, np.stack([points[:-1], points[1:]], axis=1)], axis=0)
+
+
+def test_render_segments_png_matches_legacy_figure_framing(tmp_path: Path):
+    segments = _spiral_segments(400)
+    legacy_path = tmp_path / "legacy.png"
+    fast_path = tmp_path / "fast.png"
+
+    _legacy_figure_png(segments, legacy_path, color="#0e1e2f", linewidth_pt=0.7)
+    render_segments_png(segments, fast_path, color="#0e1e2f", linewidth_pt=0.7)
+
+    legacy = np.asarray(Image.open(legacy_path).convert("RGBA")).astype(np.int16)
+    fast = np.asarray(Image.open(fast_path).convert("RGBA")).astype(np.int16)
+    assert legacy.shape == fast.shape == (1500, 1500, 4)
+    assert np.abs(legacy[..., 3] - fast[..., 3]).max() <= 1
+    drawn = fast[..., 3] > 0
+    assert np.all(fast[drawn][:, :3] == (0x0E, 0x1E, 0x2F))
+
+
+def test_polyline_and_normalization_helpers():
+    segments = polylines_to_segments([np.array([[0.0, 0.0], [2.0, 0.0], [2.0, 4.0]]), np.array([[1.0, 1.0]])])
+    assert segments.shape == (2, 2, 2)
+
+    normalized, min_vals, max_vals = normalize_segments(segments)
+    assert min_vals.tolist() == [0.0, 0.0]
+    assert max_vals.tolist() == [2.0, 4.0]
+    assert normalized[1].tolist() == [[1.0, 0.0], [1.0, 1.0]]
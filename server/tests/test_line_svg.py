@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import numpy as np
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.line_svg import (  # noqa: E402
+    merge_runs,
+    path_data,
+    quantize_segments,
+    render_segments_svg,
+    svg_path_for,
+)
+
+
+def test_quantize_flips_y_and_drops_degenerate_and_duplicate_segments():
+    segments = np.array(
+        [
+            [[0.0, 0.0], [1.0, 0.0]],
+            [[1.0, 0.0], [0.0, 0.0]],  # reversed duplicate
+            [[0.5, 0.5], [0.50001, 0.5]],  # collapses on the grid
+            [[0.0, 1.0], [0.0, 0.5]],
+        ]
+    )
+    grid = quantize_segments(segments, size_px=100, quant_per_px=10)
+    assert grid.tolist() == [[[0, 1000], [1000, 1000]], [[0, 0], [0, 500]]]
+
+
+def test_collinear_consecutive_segments_merge_into_one_run():
+    # Four steps along a line, a corner, then a disconnected segment.
+    grid = np.array(
+        [
+            [[0, 0], [10, 0]],
+            [[10, 0], [20, 0]],
+            [[20, 0], [30, 0]],
+            [[30, 0], [30, 10]],
+            [[50, 50], [60, 60]],
+        ],
+        dtype=np.int64,
+    )
+    runs = merge_runs(grid)
+    assert [run.tolist() for run in runs] == [[[0, 0], [30, 0], [30, 10]], [[50, 50], [60, 60]]]
+    assert path_data(grid) == "M0 0l30 0 0 10M50 50l10 10"
+
+
+def test_reversal_is_not_merged():
+    grid = np.array([[[0, 0], [10, 0]], [[10, 0], [5, 0]]], dtype=np.int64)
+    assert merge_runs(grid)[0].tolist() == [[0, 0], [10, 0], [5, 0]]
+
+
+def test_render_segments_svg_writes_parseable_document(tmp_path: Path):
+    theta = np.linspace(0.0, 2.0 * np.pi, 65)
+    points = np.stack([0.5 + 0.4 * np.cos(theta), 0.5 + 0.4 * np.sin(theta)], axis=1)
+    square = np.array([[0, 0], [0.5, 0], [1, 0], [1, 1], [0, 1], [0, 0]], dtype=np.float64)
+    segments = np.concatenate(
+        [np.stack([points[:-1], points[1:]], axis=1), np.stack([square[:-1], square[1:]], axis=1)]
+    )
+
+    out_path = render_segments_svg(segments, svg_path_for(tmp_path / "top.png"), color="#102542", linewidth_pt=0.6)
+    assert out_path.name == "top.svg"
+
+    root = ET.fromstring(out_path.read_text(encoding="utf-8"))
+    assert root.get("viewBox") == "0 0 15000 15000"
+    path = root.find("{http://www.w3.org/2000/svg}path")
+    assert path is not None
+    assert path.get("stroke") == "#102542"
+    assert float(path.get("stroke-width")) == 25.0
+    # The circle chains into one run; the square's split bottom edge merges.
+    assert path.get("d").count("M") == 2
+    assert path.get("d").endswith("M0 15000l15000 0 0 -15000 -15000 0 0 15000")
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+pytest.importorskip("OCC.Core.STEPControl")
+
+from server import image_variants  # noqa: E402
+from server.cad_service_occ import VIEWS_STATUS_FILENAME, CADServiceOCC  # noqa: E402
+
+_SQUARE = np.array(
+    [
+        [[0.0, 0.0], [10.0, 0.0]],
+        [[10.0, 0.0], [10.0, 10.0]],
+        [[10.0, 10.0], [0.0, 10.0]],
+        [[0.0, 10.0], [0.0, 0.0]],
+    ]
+)
+
+
+def test_published_views_get_variants_and_leave_no_staging_files(tmp_path: Path):
+    service = CADServiceOCC.__new__(CADServiceOCC)
+    published = service._publish_views(
+        tmp_path,
+        {"x": (_SQUARE, {}), "y": (_SQUARE, {})},
+        generation="g1",
+        quality="exact",
+        exact_status=None,
+    )
+    assert published is not None
+    # The variant executor is a single FIFO thread; an empty job drains it.
+    image_variants.schedule_variants(tmp_path / "x.png").result(timeout=30)
+
+    expected = {VIEWS_STATUS_FILENAME}
+    for name in ("x", "y"):
+        png = tmp_path / f"{name}.png"
+        expected |= {png.name, png.with_suffix(".svg").name}
+        for size in image_variants.SIZES:
+            for format in image_variants.FORMATS:
+                expected.add(image_variants.variant_path(png, size=size, format=format).name)
+    assert {path.name for path in tmp_path.iterdir() if not path.name.endswith(".lock")} == expected
+    assert json.loads((tmp_path / VIEWS_STATUS_FILENAME).read_text(encoding="utf-8"))["views"] == ["x", "y"]
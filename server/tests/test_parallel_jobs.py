@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import pytest  # noqa: E402
+
+from server.cad_service import CADProcessingError  # noqa: E402
+from server.parallel_jobs import ParallelJobRunner, resolve_worker_count  # noqa: E402
+
+
+def _slow_square(value: int, delay: float) -> tuple[int, int]:
+    time.sleep(delay)
+    return value * value, os.getpid()
+
+
+def _crash_once(marker: str, value: int) -> tuple[int, int]:
+    # The first job to claim the marker kills its worker, like an OCC segfault.
+    try:
+        open(marker, "x").close()
+    except FileExistsError:
+        return value * value, os.getpid()
+    os._exit(1)
+
+
+def _crash(value: int) -> int:
+    os._exit(1)
+
+
+def test_results_keep_submission_order_across_worker_processes():
+    runner = ParallelJobRunner(max_workers=3)
+    try:
+        # The first job finishes last; the result order must not follow completion order.
+        jobs = [("x", (2, 0.6)), ("y", (3, 0.1)), ("z", (4, 0.0))]
+        results = runner.run(_slow_square, jobs)
+    finally:
+        runner.shutdown()
+
+    assert list(results) == ["x", "y", "z"]
+    assert [value for value, _ in results.values()] == [4, 9, 16]
+    assert all(pid != os.getpid() for _, pid in results.values())
+
+
+def test_single_worker_runs_inline():
+    runner = ParallelJobRunner(max_workers=1)
+    results = runner.run(_slow_square, [("a", (5, 0.0)), ("b", (6, 0.0))])
+    assert {name: value for name, (value, _) in results.items()} == {"a": 25, "b": 36}
+    assert all(pid == os.getpid() for _, pid in results.values())
+
+
+def test_resolve_worker_count_honours_env(monkeypatch):
+    monkeypatch.setenv("RAPIDDRAFT_HLR_WORKERS", "2")
+    assert resolve_worker_count(3) == 2
+    assert resolve_worker_count(1) == 1
+    assert resolve_worker_count(3, configured=8) == 3
+
+
+def test_iter_completed_yields_in_completion_order():
+    runner = ParallelJobRunner(max_workers=3)
+    try:
+        jobs = [("x", (2, 0.6)), ("y", (3, 0.3)), ("z", (4, 0.0))]
+        results = list(runner.iter_completed(_slow_square, jobs))
+    finally:
+        runner.shutdown()
+
+    assert [name for name, _ in results] == ["z", "y", "x"]
+    assert {name: value for name, (value, _) in results} == {"x": 4, "y": 9, "z": 16}
+
+
+def test_crashed_worker_is_retried_once_on_a_fresh_pool(tmp_path: Path):
+    runner = ParallelJobRunner(max_workers=2)
+    marker = str(tmp_path / "crashed")
+    try:
+        results = runner.run(_crash_once, [("a", (marker, 2)), ("b", (marker, 3))])
+        assert {name: value for name, (value, _) in results.items()} == {"a": 4, "b": 9}
+        assert all(pid != os.getpid() for _, pid in results.values())
+    finally:
+        runner.shutdown()
+
+
+def test_repeated_crash_raises_instead_of_running_inline():
+    runner = ParallelJobRunner(max_workers=2)
+    try:
+        with pytest.raises(CADProcessingError, match="crashed twice"):
+            list(runner.iter_completed(_crash, [("a", (1,)), ("b", (2,))]))
+        # The broken pool was replaced, so later jobs still run.
+        assert runner.run(_slow_square, [("c", (4, 0.0)), ("d", (5, 0.0))])["d"][0] == 25
+    finally:
+        runner.shutdown()
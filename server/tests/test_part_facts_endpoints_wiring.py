@@ -12,4 +12,4 @@ def test_part_facts_endpoints_are_wired_in_main():
     source = (REPO_ROOT / "server" / "main.py").read_text(encoding="utf-8")
     assert '@app.get("/api/models/{model_id}/components/{node_name}/part-facts")' in source
     assert '@app.post("/api/models/{model_id}/components/{node_name}/part-facts/refresh")' in source
-
+    assert '@app.post("/api/models/{model_id}/part-facts/bulk")' in source
@@ -9,7 +9,10 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from server.cnc_geometry_occ import CncGeometryError  # noqa: E402
-from server.part_facts import PartFactsService  # noqa: E402
+from server import part_facts  # noqa: E402
+from server.dfm_part_facts_bridge import NOT_APPLICABLE_INPUTS_KEY, build_extracted_facts_from_part_facts  # noqa: E402
+from server.part_facts import PartFactsError, PartFactsService, extractors_for  # noqa: E402
+from server.topology_index import FaceRecord, TopologyIndex  # noqa: E402
 
 
 class _FailingGeometryAnalyzer:
@@ -49,7 +52,7 @@ def test_part_facts_service_persists_payload_when_geometry_extraction_fails(tmp_
         force_refresh=True,
     )
 
-    assert payload["schema_version"] == "1.2.0"
+    assert payload["schema_version"] == "1.7.0"
     core = payload["coverage"]["core_extraction_coverage"]
     readiness = payload["coverage"]["full_rule_readiness_coverage"]
     assert core["total_metrics"] == core["applicable_metrics"] + core["not_applicable_metrics"]
@@ -128,3 +131,419 @@ def test_part_facts_marks_not_applicable_for_irrelevant_process_inputs(tmp_path:
 
     assert "bends_present" not in payload["missing_inputs"]
     assert "bend_features" not in payload["missing_inputs"]
+
+
+class _GeometryLoader:
+    """Stands in for ``PartFactsService._load_geometry``; the first ``failures`` calls fail."""
+
+    def __init__(self, failures: int = 0):
+        self.calls = 0
+        self.failures = failures
+
+    def __call__(self, *, step_path: Path, component_node_name: str):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise PartFactsError("STEP import failed")
+        return SimpleNamespace(
+            step_path=step_path,
+            component_node_name=component_node_name,
+            shape=None,
+            analysis_shape=None,
+            bounds=(0.0, 0.0, 0.0, 50.0, 40.0, 10.0),
+            topology=TopologyIndex(solids=["solid_1"], faces=[], edges=[]),
+        )
+
+
+def test_profile_change_reuses_cached_geometry_layer(tmp_path: Path, monkeypatch):
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": ["bends_present"]})
+    loader = _GeometryLoader()
+    monkeypatch.setattr(PartFactsService, "_load_geometry", loader)
+    service = PartFactsService(root=tmp_path, bundle=bundle, geometry_analyzer=_FailingGeometryAnalyzer())
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    request = dict(
+        model_id="model_x",
+        step_path=step_path,
+        component_node_name="component_1",
+        component_display_name="Part 1",
+        triangle_count=42,
+        assembly_component_count=1,
+    )
+
+    first = service.get_or_create(component_profile={"material": "Aluminum"}, **request)
+    assert service.get_or_create(component_profile={"material": "Aluminum"}, **request) == first
+    changed = service.get_or_create(
+        component_profile={"material": "Steel", "manufacturingProcess": "CNC Milling"}, **request
+    )
+    assert loader.calls == 1
+    assert changed["errors"] == first["errors"]
+    assert changed["sections"]["declared_context"]["material_spec"]["value"] == "Steel"
+    assert changed["sections"]["process_inputs"]["bends_present"]["state"] == "not_applicable"
+
+    refreshed = service.refresh_context(component_profile={"material": "Titanium"}, **request)
+    assert loader.calls == 1
+    assert service.get(model_id="model_x", component_node_name="component_1") == refreshed
+
+    step_path.write_text("replaced", encoding="utf-8")
+    assert service.refresh_context(component_profile={}, **request) is None
+    service.get_or_create(component_profile={}, **request)
+    assert loader.calls == 2
+
+
+class _SingleLoadAnalyzer:
+    def __init__(self):
+        self.loads = 0
+
+    def _import_occ(self):
+        return {}
+
+    def _load_shape(self, occ, step_path):
+        self.loads += 1
+        return object()
+
+    def _resolve_analysis_shape(self, occ, shape, component_node_name):
+        raise CncGeometryError(f"no solids for {component_node_name}")
+
+
+def test_failed_extraction_is_retried_on_the_next_request(tmp_path: Path, monkeypatch):
+    loader = _GeometryLoader(failures=1)
+    monkeypatch.setattr(PartFactsService, "_load_geometry", loader)
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    service = PartFactsService(root=tmp_path, bundle=bundle, geometry_analyzer=_FailingGeometryAnalyzer())
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    request = dict(
+        model_id="model_x",
+        step_path=step_path,
+        component_node_name="component_1",
+        component_display_name="Part 1",
+        component_profile={},
+        triangle_count=None,
+        assembly_component_count=1,
+    )
+
+    failed = service.get_or_create(**request)
+    assert failed["errors"] == ["STEP import failed"]
+    assert service.refresh_context(**request) is None
+
+    recovered = service.get_or_create(**request)
+    assert recovered["recompute_reasons"] == ["previous_errors"]
+    assert recovered["errors"] == []
+    assert recovered["sections"]["geometry"]["bbox_x_mm"]["value"] == 50.0
+    assert service.get_or_create(**request) == recovered
+    assert loader.calls == 2
+
+
+def test_bulk_extraction_loads_step_once_and_streams_every_component(tmp_path: Path, monkeypatch):
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    analyzer = _SingleLoadAnalyzer()
+    service = PartFactsService(root=tmp_path, bundle=bundle, geometry_analyzer=analyzer, bulk_workers=1)
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    components = [
+        {"component_node_name": f"component_{index}", "component_profile": {}, "triangle_count": 12}
+        for index in range(1, 4)
+    ]
+
+    records = list(
+        service.iter_many(model_id="model_x", step_path=step_path, components=components, assembly_component_count=3)
+    )
+    assert analyzer.loads == 1
+    assert [record["source"] for record in records] == ["extracted"] * 3
+    assert records[1]["part_facts"]["errors"] == ["no solids for component_2"]
+    assert service.get(model_id="model_x", component_node_name="component_3") == records[2]["part_facts"]
+
+    def run():
+        return list(
+            service.iter_many(
+                model_id="model_x", step_path=step_path, components=components, assembly_component_count=3
+            )
+        )
+
+    # Failed extractions are retried instead of being served from the cache.
+    retried = run()
+    assert [record["source"] for record in retried] == ["extracted"] * 3
+    assert retried[1]["part_facts"]["recompute_reasons"] == ["previous_errors"]
+    assert analyzer.loads == 2
+
+    monkeypatch.setattr(PartFactsService, "_load_geometry", _GeometryLoader())
+    assert all(record["part_facts"]["errors"] == [] for record in run())
+    components[0]["component_profile"] = {"material": "Steel"}
+    assert [record["source"] for record in run()] == ["geometry_cache", "cached", "cached"]
+
+
+def test_bulk_worker_pool_is_shut_down_after_each_batch(tmp_path: Path, monkeypatch):
+    runners = []
+
+    class _RecordingRunner(part_facts.ParallelJobRunner):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.shut_down = False
+            runners.append(self)
+
+        def shutdown(self):
+            self.shut_down = True
+            super().shutdown()
+
+    monkeypatch.setattr(part_facts, "ParallelJobRunner", _RecordingRunner)
+    monkeypatch.setenv("RAPIDDRAFT_HLR_WORKERS", "1")
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    service = PartFactsService(
+        root=tmp_path, bundle=bundle, geometry_analyzer=_FailingGeometryAnalyzer(), bulk_workers=2
+    )
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    components = [{"component_node_name": f"component_{index}", "component_profile": {}} for index in range(1, 4)]
+
+    records = list(
+        service.iter_many(model_id="model_x", step_path=step_path, components=components, assembly_component_count=3)
+    )
+    assert sorted(record["component_node_name"] for record in records) == ["component_1", "component_2", "component_3"]
+    # The HLR setting does not size the bulk pool, and the pool is gone once the batch ends.
+    assert runners[0].worker_count(len(components)) == 2
+    assert runners[0].shut_down and runners[0]._executor is None
+
+    stream = service.iter_many(
+        model_id="model_x", step_path=step_path, components=components, assembly_component_count=3, force_refresh=True
+    )
+    next(stream)
+    stream.close()
+    assert runners[1].shut_down
+
+
+def test_recompute_only_when_stamped_inputs_change_and_report_why(tmp_path: Path, monkeypatch):
+    def make_service(*, version="1.0.0", extractor_version="1"):
+        service = PartFactsService(
+            root=tmp_path,
+            bundle=SimpleNamespace(
+                manifest={"version": version},
+                rule_library={"rules": []},
+                process_classifier={"input_facts": []},
+            ),
+            geometry_analyzer=_FailingGeometryAnalyzer(),
+        )
+        service.GEOMETRY_EXTRACTOR_VERSION = extractor_version
+        return service
+
+    loader = _GeometryLoader()
+    monkeypatch.setattr(PartFactsService, "_load_geometry", loader)
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    request = dict(
+        model_id="model_x",
+        step_path=step_path,
+        component_node_name="component_1",
+        component_display_name="Part 1",
+        component_profile={"material": "Aluminum"},
+        triangle_count=42,
+        assembly_component_count=1,
+    )
+
+    service = make_service()
+    first = service.get_or_create(**request)
+    assert first["recompute_reasons"] == ["not_cached"]
+    assert first["inputs"]["bundle_version"] == "1.0.0"
+    assert service.get_or_create(**request) == first
+    assert loader.calls == 1
+
+    assert make_service(version="1.1.0").get_or_create(**request)["recompute_reasons"] == ["bundle_changed"]
+    assert loader.calls == 1
+
+    upgraded = make_service(version="1.1.0", extractor_version="2").get_or_create(**request)
+    assert upgraded["recompute_reasons"] == ["extractor_changed"]
+    assert loader.calls == 2
+
+    step_path.write_text("replaced", encoding="utf-8")
+    service = make_service(version="1.1.0", extractor_version="2")
+    assert service.get_or_create(**request)["recompute_reasons"] == ["step_changed"]
+    assert loader.calls == 3
+    assert service.get_or_create(**request, force_refresh=True)["recompute_reasons"] == ["forced"]
+    assert loader.calls == 4
+
+
+def test_extractors_run_on_demand_and_fill_in_lazily(tmp_path: Path):
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    service = PartFactsService(root=tmp_path, bundle=bundle, geometry_analyzer=_FailingGeometryAnalyzer())
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    geometry = SimpleNamespace(
+        step_path=step_path,
+        component_node_name="component_1",
+        shape=None,
+        analysis_shape=None,
+        bounds=(0.0, 0.0, 0.0, 50.0, 40.0, 10.0),
+        topology=TopologyIndex(
+            solids=["solid_1"],
+            faces=[FaceRecord(face="hole", surface_type="cylinder", cylinder_radius=2.5, v_range=(0.0, 8.0))],
+            edges=[],
+        ),
+    )
+    calls = {"load": 0, "holes": 0}
+
+    def load_geometry(**_kwargs):
+        calls["load"] += 1
+        return geometry
+
+    extract_holes = service._extract_holes
+
+    def counting_holes(**kwargs):
+        calls["holes"] += 1
+        extract_holes(**kwargs)
+
+    service._load_geometry = load_geometry
+    service._extract_holes = counting_holes
+    request = dict(
+        model_id="model_x",
+        step_path=step_path,
+        component_node_name="component_1",
+        component_display_name="Part 1",
+        component_profile={},
+        triangle_count=None,
+        assembly_component_count=1,
+    )
+
+    assert extractors_for({"hole_features", "material_spec"}) == ["holes"]
+    partial = service.get_or_create(**request, fact_keys={"hole_features"})
+    assert partial["extractors"] == ["holes"]
+    assert "bbox" in partial["pending_extractors"]
+    assert partial["sections"]["manufacturing_signals"]["hole_count"]["value"] == 1
+    assert partial["sections"]["geometry"]["bbox_x_mm"]["state"] == "unknown"
+    assert service.get_or_create(**request, fact_keys={"hole_count"}) == partial
+
+    full = service.get_or_create(**request)
+    assert full["recompute_reasons"] == ["facts_requested"]
+    assert full["extractors"] == extractors_for(None) and full["pending_extractors"] == []
+    assert full["sections"]["geometry"]["bbox_x_mm"]["value"] == 50.0
+    assert full["sections"]["manufacturing_signals"]["hole_count"]["value"] == 1
+    assert calls == {"load": 2, "holes": 1}
+
+
+class _CornerAnalyzer:
+    def analyze(self, **_kwargs):
+        corner = {"radius_mm": 1.0, "pocket_depth_mm": 12.0, "depth_to_radius_ratio": 12.0, "aggravating_factor": True}
+        return {
+            "corners": [corner, {**corner, "radius_mm": 4.0}],
+            "summary": {"critical_count": 1, "warning_count": 1, "caution_count": 0, "ok_count": 0},
+        }
+
+
+def _fake_part_service(tmp_path: Path) -> tuple[PartFactsService, Path]:
+    """A service whose extractors all succeed on a 20x20x10 mm block with one bore."""
+    import trimesh
+
+    scene = trimesh.Scene()
+    scene.add_geometry(trimesh.creation.box(extents=(20.0, 20.0, 10.0)), geom_name="component_1", node_name="component_1")
+    (tmp_path / "model_x").mkdir()
+    scene.export(tmp_path / "model_x" / "preview.glb", file_type="glb")
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    service = PartFactsService(root=tmp_path, bundle=bundle, geometry_analyzer=_CornerAnalyzer())
+    geometry = SimpleNamespace(
+        step_path=step_path,
+        component_node_name="component_1",
+        shape=None,
+        analysis_shape=None,
+        bounds=(0.0, 0.0, 0.0, 20.0, 20.0, 10.0),
+        topology=TopologyIndex(
+            solids=["solid_1"],
+            faces=[
+                FaceRecord(face="top", surface_type="plane", plane=((0.0, 0.0, 1.0), -10.0)),
+                FaceRecord(face="bottom", surface_type="plane", plane=((0.0, 0.0, -1.0), 0.0)),
+                FaceRecord(
+                    face="bore",
+                    surface_type="cylinder",
+                    cylinder_radius=2.5,
+                    cylinder_axis=((10.0, 10.0, 0.0), (0.0, 0.0, 1.0)),
+                    v_range=(0.0, 10.0),
+                ),
+            ],
+            edges=[],
+        ),
+    )
+    service._load_geometry = lambda **_kwargs: geometry
+    service._mass_properties = lambda shape: (1000.0, 600.0)
+    return service, step_path
+
+
+def test_every_extractor_declares_the_metrics_and_bridge_facts_it_yields(tmp_path: Path):
+    service, step_path = _fake_part_service(tmp_path)
+
+    def extract(extractors):
+        layer = service._build_geometry_layer(
+            model_id="model_x",
+            step_path=step_path,
+            component_node_name="component_1",
+            geometry_key={},
+            extractors=extractors,
+        )
+        assert layer["errors"] == []
+        metrics = {(name, key): metric for name, section in layer["sections"].items() for key, metric in section.items()}
+        facts = build_extracted_facts_from_part_facts({"sections": layer["sections"]}, {}, {})
+        facts.pop(NOT_APPLICABLE_INPUTS_KEY)
+        return metrics, facts
+
+    base_metrics, base_facts = extract([])
+    for extractor in part_facts.FACT_EXTRACTORS:
+        metrics, facts = extract([extractor.name])
+        written = {key for (section, key), metric in metrics.items() if base_metrics.get((section, key)) != metric}
+        derived = {key for key, value in facts.items() if base_facts.get(key) != value}
+        assert written, extractor.name
+        assert written | derived <= extractor.produces, (extractor.name, (written | derived) - extractor.produces)
+
+
+def test_extractor_results_do_not_depend_on_run_order(tmp_path: Path):
+    service, step_path = _fake_part_service(tmp_path)
+
+    def run(*batches):
+        layer = None
+        for batch in batches:
+            layer = service._build_geometry_layer(
+                model_id="model_x",
+                step_path=step_path,
+                component_node_name="component_1",
+                geometry_key={},
+                extractors=batch,
+                base_layer=layer,
+            )
+        return layer["sections"]
+
+    walls_first = run(["walls", "thickness_map"])
+    thickness_first = run(["thickness_map"], ["walls"])
+    assert thickness_first == walls_first
+    assert walls_first["rule_inputs"]["wall_thickness_map"]["state"] == "measured"
+
+
+def test_failed_extractor_is_rerun_by_the_next_request_for_its_facts(tmp_path: Path):
+    service, step_path = _fake_part_service(tmp_path)
+    extract_holes = service._extract_holes
+    calls = {"holes": 0}
+
+    def flaky_holes(**kwargs):
+        calls["holes"] += 1
+        if calls["holes"] == 1:
+            raise RuntimeError("transient")
+        extract_holes(**kwargs)
+
+    service._extract_holes = flaky_holes
+    request = dict(
+        model_id="model_x",
+        step_path=step_path,
+        component_node_name="component_1",
+        component_display_name="Part 1",
+        component_profile={},
+        triangle_count=None,
+        assembly_component_count=1,
+        fact_keys={"hole_features", "part_bounding_box"},
+    )
+
+    failed = service.get_or_create(**request)
+    assert failed["extractors"] == ["bbox"]
+    assert failed["errors"] == ["Unexpected holes extraction error: RuntimeError: transient"]
+
+    recovered = service.get_or_create(**request)
+    assert recovered["recompute_reasons"] == ["previous_errors"]
+    assert recovered["extractors"] == ["bbox", "holes"] and recovered["errors"] == []
+    assert recovered["sections"]["manufacturing_signals"]["hole_count"]["value"] == 1
+    assert calls["holes"] == 2
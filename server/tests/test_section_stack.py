@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server import image_variants  # noqa: E402
+from server.section_stack import (  # noqa: E402
+    SectionStackError,
+    assign_to_slices,
+    is_slice_name,
+    is_stack_id,
+    slice_positions,
+    stack_id_for,
+    write_section_stack,
+)
+from server.view_metadata import binary_path_for, read_view_metadata, to_json_payload  # noqa: E402
+
+
+def test_slice_positions_are_cell_centred_and_edges_snap_to_nearest_plane():
+    positions = slice_positions(0.0, 10.0, 4)
+    assert np.allclose(positions, [1.25, 3.75, 6.25, 8.75])
+    assert assign_to_slices(np.array([1.25, 3.7500001, 8.75, 6.2]), positions).tolist() == [0, 1, 3, 2]
+
+    with pytest.raises(SectionStackError):
+        slice_positions(0.0, 1.0, 0)
+    with pytest.raises(SectionStackError):
+        slice_positions(0.0, 1.0, 65)
+
+
+def test_write_section_stack_shares_normalization_and_skips_empty_slices(tmp_path: Path):
+    square = np.array(
+        [
+            [[0.0, 0.0], [4.0, 0.0]],
+            [[4.0, 0.0], [4.0, 4.0]],
+            [[4.0, 4.0], [0.0, 4.0]],
+            [[0.0, 4.0], [0.0, 0.0]],
+        ]
+    )
+    small = square * 0.5 + 1.0
+    result = write_section_stack(
+        tmp_path,
+        axis="z",
+        positions=np.array([1.0, 2.0, 3.0]),
+        slice_segments=[square, np.zeros((0, 2, 2)), small],
+    )
+
+    assert sorted(result["views"]) == ["slice_000", "slice_002"]
+    assert result["slice_segment_counts"] == [4, 0, 4]
+    assert (tmp_path / "slice_000.png").exists()
+    assert (tmp_path / "slice_002.svg").exists()
+    assert not (tmp_path / "slice_001.png").exists()
+
+    payload = to_json_payload(read_view_metadata(binary_path_for(result["metadata"])))
+    assert payload["type"] == "section_stack"
+    assert payload["segment_slices"] == [0, 0, 0, 0, 2, 2, 2, 2]
+    segments = np.array(payload["segments"])
+    # The smaller slice keeps its place inside the larger one instead of being rescaled.
+    assert np.allclose(segments[4:].min(axis=(0, 1)), [0.25, 0.25])
+    assert np.allclose(segments[4:].max(axis=(0, 1)), [0.75, 0.75])
+
+
+def test_rewriting_a_stack_removes_slices_the_new_run_did_not_render(tmp_path: Path):
+    square = np.array([[[0.0, 0.0], [1.0, 0.0]], [[1.0, 0.0], [1.0, 1.0]]])
+    write_section_stack(tmp_path, axis="x", positions=np.array([1.0, 2.0, 3.0]), slice_segments=[square, square, square])
+    # The variant executor is a single FIFO thread; an empty job drains it.
+    image_variants.schedule_variants(tmp_path / "slice_000.png").result(timeout=30)
+    assert (tmp_path / "slice_002.thumb.webp").exists()
+
+    result = write_section_stack(
+        tmp_path,
+        axis="x",
+        positions=np.array([1.0, 2.0, 3.0]),
+        slice_segments=[square, np.zeros((0, 2, 2)), np.zeros((0, 2, 2))],
+    )
+
+    assert sorted(result["views"]) == ["slice_000"]
+    for stale in ("slice_001.png", "slice_001.svg", "slice_002.png", "slice_002.svg", "slice_002.thumb.webp"):
+        assert not (tmp_path / stale).exists()
+    assert (tmp_path / "slice_000.png").exists()
+
+
+def test_stack_ids_only_accept_generated_names():
+    assert stack_id_for("x", 8) == "x8"
+    assert stack_id_for("y", 12, "component_3") == "y12_component_3"
+    assert stack_id_for("z", 4, "../etc") == "z4"
+    assert is_stack_id("y12_component_3")
+    assert not is_stack_id("../x8")
+    assert is_slice_name("slice_007")
+    assert not is_slice_name("slice_7.png")
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+import trimesh
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.shaded_render import ShadedRenderError, load_mesh, rasterize_mesh, render_shaded_views  # noqa: E402
+
+
+def _write_scene(path: Path) -> Path:
+    scene = trimesh.Scene()
+    near = trimesh.creation.box(extents=(1.0, 1.0, 1.0))
+    near.apply_translation((0.0, 0.0, 1.0))
+    far = trimesh.creation.box(extents=(2.0, 2.0, 0.5))
+    scene.add_geometry(near, geom_name="component_1", node_name="component_1")
+    scene.add_geometry(far, geom_name="component_2", node_name="component_2")
+    scene.export(path, file_type="glb")
+    return path
+
+
+def test_zbuffer_keeps_nearest_surface_and_shades_by_normal():
+    near = trimesh.creation.box(extents=(1.0, 1.0, 1.0))
+    near.apply_transform(trimesh.transformations.rotation_matrix(np.radians(30), (1, 0, 0)))
+    near.apply_translation((0.0, 0.0, 1.0))
+    far = trimesh.creation.box(extents=(2.0, 2.0, 0.5))
+    mesh = trimesh.util.concatenate([near, far])
+
+    top = rasterize_mesh(
+        mesh.vertices, mesh.faces, view_dir=(0, 0, 1), basis_x=(1, 0, 0), basis_y=(0, 1, 0), size_px=200, margin_px=0
+    )
+    assert top.shape == (200, 200, 4)
+    assert (top[..., 3] == 255).all()  # the far plate fills the frame
+    # The tilted box is nearer than the plate, so its own (darker) shade wins.
+    assert top[100, 100, 0] < top[10, 10, 0]
+
+    side = rasterize_mesh(
+        mesh.vertices, mesh.faces, view_dir=(1, 0, 0), basis_x=(0, 1, 0), basis_y=(0, 0, 1), size_px=200, margin_px=0
+    )
+    # From the side the tilted box floats above the plate with empty space around it.
+    assert side[20, 5, 3] == 0
+    assert side[20, 100, 3] == 255
+    assert side[140, 100, 3] == 0
+    assert side[180, 5, 3] == 255
+
+
+def test_render_shaded_views_writes_required_views_and_selects_components(tmp_path: Path):
+    glb = _write_scene(tmp_path / "preview.glb")
+
+    vertices, faces = load_mesh(glb, "component_1")
+    assert faces.shape == (12, 3)
+    assert np.allclose(vertices[:, 2].min(), 0.5)
+    with pytest.raises(ShadedRenderError):
+        load_mesh(glb, "component_9")
+
+    views, timings = render_shaded_views(glb, tmp_path / "views", size_px=256)
+    assert sorted(views) == ["x", "y", "z"]
+    assert timings["triangle_count"] == 24
+    with Image.open(views["x"]) as image:
+        assert image.size == (256, 256)
+        assert image.mode == "RGBA"
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import trimesh
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.cnc_geometry_occ import CncGeometryError  # noqa: E402
+from server.part_facts import PartFactsService  # noqa: E402
+from server.thickness_map import TriangleBVH, compute_thickness_map, write_thickness_glb  # noqa: E402
+
+
+def _hollow_box(offset_x: float = 0.0) -> trimesh.Trimesh:
+    """20 mm cube with a 16 mm cavity; shifting the cavity thins one x wall."""
+    outer = trimesh.creation.box(extents=(20.0, 20.0, 20.0))
+    inner = trimesh.creation.box(extents=(16.0, 16.0, 16.0))
+    inner.apply_translation((offset_x, 0.0, 0.0))
+    inner.invert()
+    return trimesh.util.concatenate([outer, inner])
+
+
+def _brute_force(mesh: trimesh.Trimesh, origins: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    tri = mesh.vertices[mesh.faces]
+    e1, e2 = tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0]
+    result = []
+    for origin, direction in zip(origins, directions):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = np.cross(direction, e2)
+            inv = 1.0 / np.einsum("ij,ij->i", e1, p)
+            s = origin - tri[:, 0]
+            u = np.einsum("ij,ij->i", s, p) * inv
+            q = np.cross(s, e1)
+            v = (q @ direction) * inv
+            t = np.einsum("ij,ij->i", e2, q) * inv
+            ok = (u >= 0) & (v >= 0) & (u + v <= 1) & (t > 1e-9)
+            t = np.where(ok, t, np.inf)
+        result.append((t.min(), int(t.argmin()) if ok.any() else -1))
+    distances, faces = zip(*result)
+    return np.array(distances), np.array(faces)
+
+
+def test_bvh_matches_brute_force_including_axis_aligned_rays():
+    mesh = trimesh.creation.icosphere(subdivisions=3, radius=10.0)
+    rng = np.random.default_rng(7)
+    origins = rng.uniform(-12.0, 12.0, size=(200, 3))
+    directions = rng.normal(size=(200, 3))
+    directions[:20] = [0.0, 0.0, -1.0]
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+
+    hits, faces = TriangleBVH(mesh.vertices, mesh.faces).intersect(
+        origins, directions, min_distance=1e-9, max_distance=100.0
+    )
+    expected, expected_faces = _brute_force(mesh, origins, directions)
+    assert np.array_equal(np.isfinite(hits), np.isfinite(expected))
+    assert np.allclose(hits[np.isfinite(hits)], expected[np.isfinite(expected)])
+    assert np.array_equal(faces, expected_faces)
+
+
+def test_thickness_map_measures_walls_and_thin_fraction():
+    mesh = _hollow_box(offset_x=1.0)  # x walls become 1 mm and 3 mm, the rest stay 2 mm
+    result = compute_thickness_map(mesh.vertices, mesh.faces, thin_wall_mm=1.5)
+    summary = result["summary"]
+
+    assert summary["coverage"] == 1.0 and not summary["truncated"]
+    assert summary["min_mm"] == pytest.approx(1.0)
+    assert summary["percentiles_mm"]["p50"] == pytest.approx(2.0)
+    assert 0.0 < summary["thin_wall_area_fraction"] < 0.2
+    assert np.isfinite(result["vertex_thickness"]).all()
+
+    starved = compute_thickness_map(mesh.vertices, mesh.faces, time_budget_sec=0.0)["summary"]
+    assert starved["truncated"] and starved["min_mm"] is None and starved["coverage"] == 0.0
+
+
+def test_thickness_glb_carries_colors_and_thickness_attribute(tmp_path: Path):
+    mesh = _hollow_box()
+    thickness = compute_thickness_map(mesh.vertices, mesh.faces)["vertex_thickness"]
+    thickness[0] = np.nan
+    glb = write_thickness_glb(mesh.vertices, mesh.faces, thickness, tmp_path / "part.thickness.glb")
+
+    loaded = trimesh.load(glb, force="mesh", process=False)
+    assert np.allclose(loaded.vertex_attributes["_THICKNESS"][1:], 2.0, atol=1e-4)
+    assert loaded.vertex_attributes["_THICKNESS"][0] == -1.0
+    assert loaded.visual.vertex_colors.shape == (len(mesh.vertices), 4)
+
+
+class _FailingGeometryAnalyzer:
+    def _import_occ(self):
+        raise CncGeometryError("pythonOCC unavailable in test")
+
+
+def test_part_facts_fill_thickness_metrics_from_preview_mesh(tmp_path: Path):
+    scene = trimesh.Scene()
+    scene.add_geometry(_hollow_box(), geom_name="component_1", node_name="component_1")
+    (tmp_path / "model_x").mkdir()
+    scene.export(tmp_path / "model_x" / "preview.glb", file_type="glb")
+    step_path = tmp_path / "model_x" / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    service = PartFactsService(root=tmp_path, bundle=bundle, geometry_analyzer=_FailingGeometryAnalyzer())
+    payload = service.get_or_create(
+        model_id="model_x",
+        step_path=step_path,
+        component_node_name="component_1",
+        component_display_name="Part 1",
+        component_profile={},
+        triangle_count=24,
+        assembly_component_count=1,
+        force_refresh=True,
+    )
+
+    signals = payload["sections"]["manufacturing_signals"]
+    assert signals["raycast_min_wall_thickness_mm"]["value"] == pytest.approx(2.0)
+    assert signals["thin_wall_area_fraction"]["value"] == 0.0
+    # OCC is unavailable, so the ray-cast minimum stands in for the planar estimate.
+    assert signals["min_wall_thickness_mm"]["source"] == "mesh.raycast_bvh.p1"
+    assert signals["min_wall_thickness_mm"]["value"] == pytest.approx(2.0)
+    assert payload["sections"]["rule_inputs"]["wall_thickness_map"]["state"] == "measured"
+    assert service.thickness_map_path(model_id="model_x", component_node_name="component_1").exists()
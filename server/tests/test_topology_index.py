@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.part_facts import PartFactsService  # noqa: E402
+from server.topology_index import FaceRecord, TopologyIndex, build_topology_index  # noqa: E402
+
+
+class FakeShape:
+    def __init__(self, kind: str, children: list["FakeShape"] | None = None, **data):
+        self.kind = kind
+        self.children = children or []
+        self.data = data
+
+
+class FakeExplorer:
+    def __init__(self, shape: FakeShape, target: str, avoid: str | None = None):
+        self._items: list[FakeShape] = []
+        self._collect(shape, target, avoid)
+        self._index = 0
+
+    def _collect(self, shape: FakeShape, target: str, avoid: str | None) -> None:
+        for child in shape.children:
+            if child.kind == target:
+                self._items.append(child)
+            elif child.kind != avoid:
+                self._collect(child, target, avoid)
+
+    def More(self):
+        return self._index < len(self._items)
+
+    def Current(self):
+        return self._items[self._index]
+
+    def Next(self):
+        self._index += 1
+
+
+class FakeShapeMap:
+    def __init__(self):
+        self._items: list[FakeShape] = []
+
+    def FindIndex(self, shape: FakeShape) -> int:
+        for position, item in enumerate(self._items, start=1):
+            if item is shape:
+                return position
+        return 0
+
+    def Add(self, shape: FakeShape) -> int:
+        self._items.append(shape)
+        return len(self._items)
+
+
+def _vec(x: float, y: float, z: float):
+    return SimpleNamespace(X=lambda: x, Y=lambda: y, Z=lambda: z)
+
+
+class FakeSurface:
+    constructed = 0
+
+    def __init__(self, face: FakeShape, _restrict: bool):
+        FakeSurface.constructed += 1
+        self.data = face.data
+
+    def GetType(self):
+        return self.data["surface"]
+
+    def Plane(self):
+        normal, point = self.data["normal"], self.data["point"]
+        return SimpleNamespace(Axis=lambda: SimpleNamespace(Direction=lambda: _vec(*normal)), Location=lambda: _vec(*point))
+
+    def Cylinder(self):
+        location, direction = self.data["axis"]
+        axis = SimpleNamespace(Location=lambda: _vec(*location), Direction=lambda: _vec(*direction))
+        return SimpleNamespace(Radius=lambda: self.data["radius"], Axis=lambda: axis)
+
+    def FirstVParameter(self):
+        return 0.0
+
+    def LastVParameter(self):
+        return self.data["depth"]
+
+
+class FakeCurve:
+    def __init__(self, edge: FakeShape):
+        self.data = edge.data
+
+    def GetType(self):
+        return self.data["curve"]
+
+    def Circle(self):
+        return SimpleNamespace(Radius=lambda: self.data["radius"])
+
+
+OCC = {
+    "TopExp_Explorer": FakeExplorer,
+    "TopTools_IndexedMapOfShape": FakeShapeMap,
+    "TopAbs_SOLID": "solid",
+    "TopAbs_FACE": "face",
+    "TopAbs_EDGE": "edge",
+    "topods": SimpleNamespace(Solid=lambda s: s, Face=lambda s: s, Edge=lambda s: s),
+    "BRepAdaptor_Surface": FakeSurface,
+    "BRepAdaptor_Curve": FakeCurve,
+    "GeomAbs_Plane": "plane",
+    "GeomAbs_Cylinder": "cylinder",
+    "GeomAbs_Line": "line",
+    "GeomAbs_Circle": "circle",
+}
+
+
+def test_index_walks_each_face_once_and_shares_edges_between_faces():
+    shared = FakeShape("edge", curve="line")
+    arc = FakeShape("edge", curve="circle", radius=2.5)
+    top = FakeShape("face", [shared], surface="plane", normal=(0.0, 0.0, 2.0), point=(0.0, 0.0, 10.0))
+    bore = FakeShape("face", [shared, arc], surface="cylinder", radius=3.0, depth=12.0, axis=((1.0, 2.0, 0.0), (0.0, 0.0, 1.0)))
+    loose = FakeShape("face", [FakeShape("edge", curve="bspline")], surface="bspline")
+    solid = FakeShape("solid", [FakeShape("shell", [top, bore])])
+    compound = FakeShape("compound", [solid, loose])
+
+    FakeSurface.constructed = 0
+    index = build_topology_index(OCC, compound)
+
+    assert index.solids == [solid]
+    assert [record.face for record in index.faces] == [top, bore, loose]
+    assert FakeSurface.constructed == 3
+    assert index.faces[0].plane == ((0.0, 0.0, 1.0), pytest.approx(-10.0))
+    assert index.faces[1].cylinder_radius == 3.0
+    assert index.faces[1].v_range == (0.0, 12.0)
+    assert index.faces[1].cylinder_axis == ((1.0, 2.0, 0.0), (0.0, 0.0, 1.0))
+    assert index.faces[2].surface_type == "other"
+
+    assert [record.edge for record in index.edges] == [shared, arc, loose.children[0]]
+    assert index.edges[0].faces == [top, bore]
+    assert index.edges[1].circle_radius == 2.5
+    assert index.edges[2].curve_type == "other"
+
+
+def test_part_facts_extractors_read_the_shared_index(tmp_path: Path):
+    bundle = SimpleNamespace(rule_library={"rules": []}, process_classifier={"input_facts": []})
+    service = PartFactsService(root=tmp_path, bundle=bundle)
+    index = TopologyIndex(
+        solids=["solid_1"],
+        faces=[
+            FaceRecord(face="top", surface_type="plane", plane=((0.0, 0.0, 1.0), -10.0)),
+            FaceRecord(face="bottom", surface_type="plane", plane=((0.0, 0.0, -1.0), 0.0)),
+            FaceRecord(face="hole", surface_type="cylinder", cylinder_radius=2.5, v_range=(0.0, 8.0)),
+            FaceRecord(face="fillet", surface_type="cylinder", cylinder_radius=2.0, v_range=(0.0, 0.1)),
+        ],
+        edges=[],
+    )
+
+    assert service._count_solids(index) == 1
+    assert service._estimate_min_wall_thickness_mm(index) == pytest.approx(10.0)
+    holes = service._extract_cylindrical_feature_metrics(topology=index, bounds=(0.0, 0.0, 0.0, 50.0, 40.0, 10.0))
+    assert holes["hole_count"] == 1
+    assert holes["threaded_holes_count"] == 1
+    assert holes["min_hole_diameter_mm"] == pytest.approx(5.0)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.view_metadata import (  # noqa: E402
+    MAGIC,
+    ViewMetadataError,
+    ViewMetadataNotFoundError,
+    binary_path_for,
+    ensure_binary,
+    iter_json_chunks,
+    iter_mapped_chunks,
+    json_source,
+    read_view_metadata,
+    to_json_payload,
+    write_view_metadata,
+)
+
+
+def _orthographic_payload() -> dict:
+    return {
+        "type": "orthographic",
+        "axis_pair": [0, 1],
+        "invert_x": False,
+        "invert_y": True,
+        "bounds": {"min": [-1.5, 0.0], "max": [2.5, 4.0]},
+        "projected_vertices": np.array([[0.0, 0.0], [1.0, 0.25], [0.5, 1.0]]),
+        "edges": np.array([[0, 1], [0, 2], [1, 2]], dtype=np.int64),
+    }
+
+
+def test_binary_round_trip_keeps_fields_and_buffers(tmp_path: Path):
+    json_path = tmp_path / "top.json"
+    bin_path = write_view_metadata(json_path, _orthographic_payload())
+
+    assert bin_path == binary_path_for(json_path)
+    assert bin_path.read_bytes()[:4] == MAGIC
+    assert not json_path.exists()
+
+    decoded = read_view_metadata(bin_path)
+    assert decoded["type"] == "orthographic"
+    assert decoded["bounds"] == {"min": [-1.5, 0.0], "max": [2.5, 4.0]}
+    assert decoded["projected_vertices"].dtype == np.float32
+    assert decoded["projected_vertices"].shape == (3, 2)
+    assert decoded["edges"].dtype == np.uint32
+    assert decoded["edges"].tolist() == [[0, 1], [0, 2], [1, 2]]
+
+    header_len = int.from_bytes(bin_path.read_bytes()[8:12], "little")
+    header = json.loads(bin_path.read_bytes()[12:12 + header_len])
+    assert all(entry["offset"] % 8 == 0 for entry in header["buffers"])
+
+
+def test_json_is_produced_on_demand_with_legacy_shape(tmp_path: Path):
+    json_path = tmp_path / "iso.json"
+    write_view_metadata(
+        json_path,
+        {
+            "type": "shape2d",
+            "direction": [0.0, 0.0, 1.0],
+            "bounds": {"min": [0.0, 0.0], "max": [1.0, 1.0]},
+            "segments": [[[0.0, 0.0], [0.3, 1.0]]],
+        },
+    )
+
+    payload = json.loads(b"".join(iter_json_chunks(json_path)))
+    assert payload["segments"] == [[[0.0, 0.0], [0.3, 1.0]]]
+    assert payload["direction"] == [0.0, 0.0, 1.0]
+    # The rounded float32 rendition is never stored next to the binary.
+    assert json_source(json_path) == binary_path_for(json_path)
+    assert not json_path.exists()
+
+
+def test_json_is_streamed_from_the_binary_without_touching_disk(tmp_path: Path):
+    json_path = tmp_path / "top.json"
+    payload = _orthographic_payload()
+    payload["projected_vertices"] = np.random.default_rng(0).random((500, 2))
+    payload["edges"] = np.arange(600).reshape(300, 2)
+    payload["segment_slices"] = np.zeros(0)
+    bin_path = write_view_metadata(json_path, payload)
+
+    chunks = list(iter_json_chunks(json_path, chunk_size=256))
+
+    assert len(chunks) > 10
+    assert json.loads(b"".join(chunks)) == to_json_payload(read_view_metadata(bin_path))
+    assert sorted(path.name for path in tmp_path.iterdir()) == [bin_path.name]
+
+
+def test_legacy_json_is_converted_to_binary(tmp_path: Path):
+    json_path = tmp_path / "side.json"
+    legacy = _orthographic_payload()
+    legacy["projected_vertices"] = legacy["projected_vertices"].tolist()
+    legacy["edges"] = legacy["edges"].tolist()
+    json_path.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+
+    decoded = read_view_metadata(ensure_binary(json_path))
+    assert decoded["edges"].tolist() == legacy["edges"]
+    assert np.allclose(decoded["projected_vertices"], legacy["projected_vertices"])
+    assert json_path.exists()
+    # The original full-precision JSON keeps being served as-is.
+    assert b"".join(iter_json_chunks(json_path)) == json_path.read_bytes()
+
+
+def test_streaming_and_error_paths(tmp_path: Path):
+    json_path = tmp_path / "top.json"
+    bin_path = write_view_metadata(json_path, _orthographic_payload())
+    assert b"".join(iter_mapped_chunks(bin_path, chunk_size=16)) == bin_path.read_bytes()
+
+    with pytest.raises(ViewMetadataNotFoundError):
+        json_source(tmp_path / "missing.json")
+    with pytest.raises(ViewMetadataNotFoundError):
+        next(iter_json_chunks(tmp_path / "missing.json"))
+
+    bogus = tmp_path / "bogus.bin"
+    bogus.write_bytes(b"NOPE" + b"\0" * 16)
+    with pytest.raises(ViewMetadataError):
+        read_view_metadata(bogus)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.view_metadata import write_view_metadata  # noqa: E402
+from server.view_tiles import (  # noqa: E402
+    TILE_SIZE_PX,
+    ViewTileNotFoundError,
+    ViewTilePyramid,
+    tile_segments,
+    view_segments,
+)
+
+
+def _alpha(path: Path) -> np.ndarray:
+    with Image.open(path) as image:
+        return np.asarray(image.convert("RGBA").getchannel("A"))
+
+
+def test_tile_segments_maps_only_touching_segments_into_tile_space():
+    segments = np.array(
+        [
+            [[0.1, 0.9], [0.4, 0.9]],  # top-left quadrant
+            [[0.6, 0.1], [0.9, 0.1]],  # bottom-right quadrant
+        ]
+    )
+    top_left = tile_segments(segments, 1, 0, 0)
+    assert np.allclose(top_left, [[[0.2, 0.8], [0.8, 0.8]]])
+    assert np.allclose(tile_segments(segments, 1, 1, 1), [[[0.2, 0.2], [0.8, 0.2]]])
+    assert tile_segments(segments, 1, 1, 0).shape == (0, 2, 2)
+
+
+def test_pyramid_renders_from_metadata_and_invalidates_on_regeneration(tmp_path: Path):
+    meta_path = tmp_path / "views" / "top.json"
+    vertices = np.array([[0.1, 0.9], [0.4, 0.9], [0.1, 0.6]])
+    edges = np.array([[0, 1], [1, 2]])
+    write_view_metadata(meta_path, {"type": "orthographic", "projected_vertices": vertices, "edges": edges})
+    assert view_segments({"projected_vertices": vertices, "edges": edges}).shape == (2, 2, 2)
+
+    pyramid = ViewTilePyramid(meta_path, tmp_path / "tiles" / "views" / "top")
+    assert pyramid.prewarm(max_zoom=1) == 5
+    first = pyramid.get(1, 0, 0)
+    assert first.exists()
+    with Image.open(first) as tile:
+        assert tile.size == (TILE_SIZE_PX, TILE_SIZE_PX)
+    # Both edges sit in the top-left quadrant; the other level-1 tiles stay empty.
+    assert _alpha(first).max() > 0
+    assert all(_alpha(pyramid.get(1, x, y)).max() == 0 for x, y in [(1, 0), (0, 1), (1, 1)])
+
+    with pytest.raises(ViewTileNotFoundError):
+        pyramid.get(1, 2, 0)
+
+    write_view_metadata(meta_path, {"type": "orthographic", "projected_vertices": vertices, "edges": edges[:1]})
+    regenerated = ViewTilePyramid(meta_path, tmp_path / "tiles" / "views" / "top")
+    assert regenerated.token != pyramid.token
+    regenerated.get(0, 0, 0)
+    assert not first.exists()
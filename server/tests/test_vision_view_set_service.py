@@ -1,19 +1,24 @@
 ﻿from __future__ import annotations
 
+import json
 import sys
 from pathlib import Path
 
+import pytest
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from server.vision_views import VisionViewSetService  # noqa: E402
+from server.vision_views import VisionViewSetError, VisionViewSetService  # noqa: E402
 
 
 class _FakeOccService:
-    def __init__(self) -> None:
+    def __init__(self, *, exact_cached: bool = False) -> None:
+        self.exact_cached = exact_cached
         self.last_component_node_name: str | None = None
         self.last_component_solid_index: int | None = None
+        self.last_quality: str | None = None
 
     def generate_occ_views(
         self,
@@ -22,15 +27,25 @@ class _FakeOccService:
         *,
         component_node_name: str | None = None,
         component_solid_index: int | None = None,
+        quality: str = "exact",
+        upgrade_exact: bool = False,
     ):
         self.last_component_node_name = component_node_name
         self.last_component_solid_index = component_solid_index
+        self.last_quality = quality
         output_dir.mkdir(parents=True, exist_ok=True)
         paths = {}
         for name in ("x", "y", "z"):
             path = output_dir / f"{name}.png"
             path.write_bytes(b"png")
             paths[name] = path
+        # Like CADServiceOCC: cached exact segments are served even to fast requests.
+        published = "exact" if self.exact_cached else quality
+        upgrade = published == "fast" and upgrade_exact
+        (output_dir / "views_status.json").write_text(
+            json.dumps({"quality": published, "exact_status": "pending" if upgrade else None}),
+            encoding="utf-8",
+        )
         return paths
 
 
@@ -53,3 +68,84 @@ def test_view_set_service_passes_component_selection_to_occ(tmp_path: Path):
     assert payload["views"]["x"].endswith("/views/x")
     assert payload["views"]["y"].endswith("/views/y")
     assert payload["views"]["z"].endswith("/views/z")
+
+
+def test_fast_view_set_reports_background_exact_upgrade(tmp_path: Path):
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+
+    occ = _FakeOccService()
+    service = VisionViewSetService(root=tmp_path, occ_service=occ)
+    payload = service.create_view_set(model_id="model_x", step_path=step_path, quality="fast")
+
+    assert occ.last_quality == "fast"
+    assert payload["quality"] == "fast"
+    assert payload["exact_upgrade_pending"] is True
+
+    status = service.get_view_set_status(model_id="model_x", view_set_id=payload["view_set_id"])
+    assert status["quality"] == "fast"
+
+    # The OCC service rewrites the status file once the exact pass replaced the images.
+    views_dir = tmp_path / "model_x" / "vision_view_sets" / payload["view_set_id"] / "views"
+    (views_dir / "views_status.json").write_text(
+        json.dumps({"quality": "exact", "exact_status": "done", "updated_at": "2026-01-01T00:00:00Z"}),
+        encoding="utf-8",
+    )
+    status = service.get_view_set_status(model_id="model_x", view_set_id=payload["view_set_id"])
+    assert status["quality"] == "exact"
+    assert status["exact_status"] == "done"
+
+
+def test_fast_view_set_served_exact_from_cache_reports_no_pending_upgrade(tmp_path: Path):
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+
+    service = VisionViewSetService(root=tmp_path, occ_service=_FakeOccService(exact_cached=True))
+    payload = service.create_view_set(model_id="model_x", step_path=step_path, quality="fast")
+
+    assert payload["quality"] == "exact"
+    assert payload["exact_upgrade_pending"] is False
+    metadata = service.get_view_set_metadata(model_id="model_x", view_set_id=payload["view_set_id"])
+    assert metadata["quality"] == "exact"
+    status = service.get_view_set_status(model_id="model_x", view_set_id=payload["view_set_id"])
+    assert status["quality"] == "exact"
+    assert status["exact_status"] is None
+
+
+def test_view_set_service_rejects_unknown_quality(tmp_path: Path):
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    service = VisionViewSetService(root=tmp_path, occ_service=_FakeOccService())
+
+    with pytest.raises(VisionViewSetError):
+        service.create_view_set(model_id="model_x", step_path=step_path, quality="draft")
+
+
+def test_shaded_view_set_rasterizes_preview_mesh_without_occ(tmp_path: Path):
+    import trimesh
+
+    step_path = tmp_path / "source.step"
+    step_path.write_text("dummy", encoding="utf-8")
+    mesh_path = tmp_path / "preview.glb"
+    scene = trimesh.Scene()
+    scene.add_geometry(trimesh.creation.box(extents=(1.0, 2.0, 3.0)), geom_name="component_1", node_name="component_1")
+    scene.export(mesh_path, file_type="glb")
+
+    occ = _FakeOccService()
+    service = VisionViewSetService(root=tmp_path, occ_service=occ)
+    payload = service.create_view_set(
+        model_id="model_x",
+        step_path=step_path,
+        renderer="shaded",
+        mesh_path=mesh_path,
+        quality="fast",
+    )
+
+    assert occ.last_quality is None
+    assert payload["renderer"] == "shaded"
+    assert payload["exact_upgrade_pending"] is False
+    paths = service.get_view_set_paths(model_id="model_x", view_set_id=payload["view_set_id"])
+    assert sorted(paths) == ["x", "y", "z"]
+    assert all(path.stat().st_size > 0 for path in paths.values())
+    status = service.get_view_set_status(model_id="model_x", view_set_id=payload["view_set_id"])
+    assert status["renderer"] == "shaded"
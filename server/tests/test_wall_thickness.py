@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.wall_thickness import min_opposed_plane_gap  # noqa: E402
+
+
+def _pairwise(planes):
+    best = None
+    for idx, (n1, d1) in enumerate(planes):
+        for n2, d2 in planes[idx + 1 :]:
+            dot = n1[0] * n2[0] + n1[1] * n2[1] + n1[2] * n2[2]
+            if dot > -0.97:
+                continue
+            candidate = abs(d1 - d2)
+            if not math.isfinite(candidate) or candidate <= 1e-4:
+                continue
+            if best is None or candidate < best:
+                best = candidate
+    return best
+
+
+def _random_planes(rng: np.random.Generator, count: int, axis_aligned: float):
+    axes = np.array([[1, 0, 0], [-1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1], [0, 0, -1]], dtype=np.float64)
+    planes = []
+    for _ in range(count):
+        if rng.random() < axis_aligned:
+            normal = axes[rng.integers(len(axes))]
+        else:
+            normal = rng.normal(size=3)
+            normal /= np.linalg.norm(normal)
+        # Coarse offsets produce ties and exact duplicates, as on real parts.
+        offset = float(np.round(rng.uniform(-50.0, 50.0), rng.integers(1, 5)))
+        planes.append((tuple(float(v) for v in normal), offset))
+    return planes
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_matches_pairwise_scan(seed: int):
+    rng = np.random.default_rng(seed)
+    planes = _random_planes(rng, 300, axis_aligned=0.6 if seed % 2 else 0.1)
+    assert min_opposed_plane_gap(planes) == _pairwise(planes)
+
+
+def test_opposed_threshold_and_coincident_planes_match_pairwise_scan():
+    tilt = math.acos(0.97)
+    inside = (0.0, math.sin(tilt * 0.999), -math.cos(tilt * 0.999))
+    outside = (0.0, math.sin(tilt * 1.001), -math.cos(tilt * 1.001))
+    planes = [
+        ((0.0, 0.0, 1.0), -10.0),
+        ((0.0, 0.0, -1.0), -10.00005),  # coincident within tolerance: ignored
+        (outside, -7.0),  # just past the opposed-normal threshold: ignored
+        (inside, -4.0),
+    ]
+    assert min_opposed_plane_gap(planes) == _pairwise(planes) == pytest.approx(6.0)
+    assert min_opposed_plane_gap(planes[:2]) is None
+    assert min_opposed_plane_gap([]) is None
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import io
+import os
+import sys
+import zipfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from server.zip_stream import iter_zip  # noqa: E402
+
+
+def test_streamed_archive_stores_png_and_deflates_text(tmp_path: Path):
+    png = tmp_path / "top.png"
+    png.write_bytes(os.urandom(300_000))
+    meta = tmp_path / "top.json"
+    meta.write_text('{"segments": []}' * 5000, encoding="utf-8")
+    missing = tmp_path / "gone.png"
+
+    chunks = list(iter_zip([("top.png", png), ("shape2d/top.json", meta), ("gone.png", missing)], chunk_size=16 * 1024))
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == ["top.png", "shape2d/top.json"]
+        assert archive.getinfo("top.png").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("shape2d/top.json").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read("top.png") == png.read_bytes()
+        assert archive.read("shape2d/top.json") == meta.read_bytes()
+
+
+def test_chunks_stay_bounded_by_read_size(tmp_path: Path):
+    big = tmp_path / "big.png"
+    big.write_bytes(os.urandom(2_000_000))
+
+    chunks = list(iter_zip([("big.png", big)], chunk_size=32 * 1024))
+
+    assert len(chunks) > 50
+    # Header/descriptor bytes ride along with a data chunk, never the whole file.
+    assert max(len(chunk) for chunk in chunks) < 33 * 1024
+
+
+def test_generated_entries_are_written_without_a_file(tmp_path: Path):
+    parts = [b'{"segments":[', b",".join(b"[[0.5,1.0],[2.0,3.0]]" for _ in range(2000)), b"]}"]
+
+    chunks = list(iter_zip([("shape2d/top.json", iter(parts))], chunk_size=16 * 1024))
+
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+        assert archive.testzip() is None
+        assert archive.getinfo("shape2d/top.json").compress_type == zipfile.ZIP_DEFLATED
+        assert archive.read("shape2d/top.json") == b"".join(parts)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,313 @@
+"""
+Ray-cast wall thickness over the component tessellation.
+
+The opposed-planar-faces estimate (``wall_thickness.py``) only sees flat
+walls. Here every triangle of the preview mesh is sampled at its centroid, a
+ray is cast inward along the outward face normal, and the distance to the
+first surface it meets is the local wall thickness. Curved walls, bosses and
+ribs are measured the same way as flat ones. Rays that leave through a
+triangle touching their own, or through a surface steeply tilted to the ray,
+are edge effects rather than walls and leave the sample unmeasured.
+
+Rays are traced in NumPy batches against a BVH whose layout is implicit:
+triangles are sorted by the Morton code of their centroid, cut into fixed
+size leaves, and the leaves become the bottom level of a complete binary tree
+stored heap-style, so building it is a handful of vectorized reductions.
+Traversal is breadth-first over (ray, node) pairs. Most walls are thin
+relative to the part, so rays are first limited to a short reach and only
+the ones that miss are retried with a longer one, which keeps the frontier
+small.
+
+Sampling runs in random order under a time budget; when the budget runs out
+the unsampled faces are reported as not measured and ``coverage`` drops below
+1. Statistics are area weighted.
+"""
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Tuple
+from uuid import uuid4
+
+import numpy as np
+import trimesh
+
+THIN_WALL_MM = 1.5
+DEFAULT_TIME_BUDGET_SEC = 2.0
+PERCENTILES = (1, 5, 25, 50, 75, 95)
+LEAF_SIZE = 8
+RAY_BATCH = 4096
+_INITIAL_REACH = 1.0 / 32.0
+# A ray leaving through a surface tilted more than 60 degrees from it, or
+# through a triangle touching its own, grazed the fillet or edge next to its
+# sample point; that is not a wall.
+_MIN_EXIT_COS = 0.5
+_MAX_PAIRS = 1 << 21
+
+
+class ThicknessMapError(RuntimeError):
+    pass
+
+
+def _morton_codes(points: np.ndarray) -> np.ndarray:
+    """30-bit Morton codes of points normalized to their bounding box."""
+    lo, hi = points.min(axis=0), points.max(axis=0)
+    cells = ((points - lo) / np.maximum(hi - lo, 1e-12) * 1023.0).astype(np.uint64)
+    codes = np.zeros(points.shape[0], dtype=np.uint64)
+    for bit in range(10):
+        for axis in range(3):
+            codes |= ((cells[:, axis] >> np.uint64(bit)) & np.uint64(1)) << np.uint64(3 * bit + (2 - axis))
+    return codes
+
+
+class TriangleBVH:
+    """Implicit complete-binary-tree BVH; node ``i`` has children ``2i+1``/``2i+2``."""
+
+    def __init__(self, vertices: np.ndarray, faces: np.ndarray) -> None:
+        corners = np.asarray(vertices, dtype=np.float64)[np.asarray(faces, dtype=np.int64)]
+        order = np.argsort(_morton_codes(corners.mean(axis=1)), kind="stable")
+        corners = corners[order]
+        self.triangle_ids = order
+        self.v0 = corners[:, 0]
+        self.e1 = corners[:, 1] - corners[:, 0]
+        self.e2 = corners[:, 2] - corners[:, 0]
+
+        leaf_count = max(1, -(-len(corners) // LEAF_SIZE))
+        self.depth = int(np.ceil(np.log2(leaf_count))) if leaf_count > 1 else 0
+        padded = 1 << self.depth
+        self.first_leaf = padded - 1
+
+        tri_min, tri_max = corners.min(axis=1), corners.max(axis=1)
+        starts = np.arange(0, len(corners), LEAF_SIZE)
+        level_min = np.full((padded, 3), np.inf)
+        level_max = np.full((padded, 3), -np.inf)
+        level_min[: len(starts)] = np.minimum.reduceat(tri_min, starts, axis=0)
+        level_max[: len(starts)] = np.maximum.reduceat(tri_max, starts, axis=0)
+
+        self.node_min = np.empty((2 * padded - 1, 3))
+        self.node_max = np.empty((2 * padded - 1, 3))
+        first = self.first_leaf
+        self.node_min[first:], self.node_max[first:] = level_min, level_max
+        while first > 0:
+            parent_first = (first - 1) // 2
+            self.node_min[parent_first:first] = np.minimum(level_min[0::2], level_min[1::2])
+            self.node_max[parent_first:first] = np.maximum(level_max[0::2], level_max[1::2])
+            level_min, level_max = self.node_min[parent_first:first], self.node_max[parent_first:first]
+            first = parent_first
+        # Padding subtrees keep inverted (+inf/-inf) bounds.
+        self.node_empty = self.node_min[:, 0] > self.node_max[:, 0]
+
+    def intersect(
+        self, origins: np.ndarray, directions: np.ndarray, *, min_distance: float, max_distance: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Nearest hit in ``(min_distance, max_distance]`` per ray: distance (``inf`` on a
+        miss) and the hit triangle's index in the input faces (``-1`` on a miss)."""
+        best = np.full(len(origins), np.inf)
+        hit_tri = np.full(len(origins), -1, dtype=np.int64)
+        # Zero components become tiny ones so the slab products never hit 0 * inf.
+        safe = np.where(directions == 0.0, 1e-300, directions)
+        with np.errstate(over="ignore"):
+            inverse = 1.0 / safe
+        ray = np.arange(len(origins))
+        node = np.zeros(len(origins), dtype=np.int64)
+        while ray.size:
+            with np.errstate(over="ignore"):
+                t0 = (self.node_min[node] - origins[ray]) * inverse[ray]
+                t1 = (self.node_max[node] - origins[ray]) * inverse[ray]
+            near = np.maximum(np.minimum(t0, t1).max(axis=1), min_distance)
+            far = np.minimum(np.maximum(t0, t1).min(axis=1), max_distance)
+            hit = (near <= far) & ~self.node_empty[node]
+            ray, node = ray[hit], node[hit]
+            if ray.size and node[0] < self.first_leaf:
+                # Every leaf sits at the same depth, so a frontier is all-internal or all-leaf.
+                ray = np.repeat(ray, 2)
+                node = np.repeat(2 * node + 1, 2) + np.tile([0, 1], node.size)
+                continue
+            step = _MAX_PAIRS // LEAF_SIZE
+            for start in range(0, ray.size, step):
+                self._leaf_hits(
+                    origins,
+                    directions,
+                    ray[start : start + step],
+                    node[start : start + step] - self.first_leaf,
+                    best,
+                    hit_tri,
+                    min_distance,
+                    max_distance,
+                )
+            break
+        return best, np.where(hit_tri >= 0, self.triangle_ids[np.maximum(hit_tri, 0)], -1)
+
+    def _leaf_hits(self, origins, directions, ray, leaf, best, hit_tri, min_distance, max_distance) -> None:
+        # Moller-Trumbore over every (ray, triangle-in-leaf) pair.
+        tri = (leaf * LEAF_SIZE)[:, None] + np.arange(LEAF_SIZE)[None, :]
+        ray = np.broadcast_to(ray[:, None], tri.shape).reshape(-1)
+        tri = tri.reshape(-1)
+        valid = tri < len(self.v0)
+        ray, tri = ray[valid], tri[valid]
+        d, e1, e2 = directions[ray], self.e1[tri], self.e2[tri]
+        p = np.cross(d, e2)
+        det = np.einsum("ij,ij->i", e1, p)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_det = 1.0 / det
+            s = origins[ray] - self.v0[tri]
+            u = np.einsum("ij,ij->i", s, p) * inv_det
+            q = np.cross(s, e1)
+            v = np.einsum("ij,ij->i", d, q) * inv_det
+            t = np.einsum("ij,ij->i", e2, q) * inv_det
+            ok = (
+                (np.abs(det) > 1e-18)
+                & (u >= 0.0)
+                & (v >= 0.0)
+                & (u + v <= 1.0)
+                & (t > min_distance)
+                & (t <= max_distance)
+            )
+        ray, tri, t = ray[ok], tri[ok], t[ok]
+        np.minimum.at(best, ray, t)
+        nearest = t == best[ray]
+        hit_tri[ray[nearest]] = tri[nearest]
+
+
+def _outward_normals(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    corners = vertices[faces]
+    cross = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    doubled_area = np.linalg.norm(cross, axis=1)
+    normals = cross / np.where(doubled_area > 0, doubled_area, 1.0)[:, None]
+    # Inward-wound tessellations have negative signed volume; flip them.
+    if np.einsum("ij,ij->i", corners[:, 0], cross).sum() < 0:
+        normals = -normals
+    return normals, doubled_area / 2.0
+
+
+def _weighted_percentiles(values: np.ndarray, weights: np.ndarray, percents) -> list[float]:
+    order = np.argsort(values)
+    values, cumulative = values[order], np.cumsum(weights[order])
+    targets = np.asarray(percents, dtype=np.float64) / 100.0 * cumulative[-1]
+    return [float(values[min(i, values.size - 1)]) for i in np.searchsorted(cumulative, targets, side="left")]
+
+
+def compute_thickness_map(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    *,
+    thin_wall_mm: float = THIN_WALL_MM,
+    time_budget_sec: float = DEFAULT_TIME_BUDGET_SEC,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Per-face and per-vertex wall thickness plus area-weighted statistics."""
+    started = time.perf_counter()
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+    if faces.size == 0:
+        raise ThicknessMapError("Mesh has no triangles.")
+
+    normals, areas = _outward_normals(vertices, faces)
+    diagonal = float(np.linalg.norm(np.ptp(vertices, axis=0)))
+    epsilon = max(diagonal * 1e-6, 1e-9)
+    bvh = TriangleBVH(vertices, faces)
+
+    face_thickness = np.full(len(faces), np.nan)
+    centroids = vertices[faces].mean(axis=1)
+    order = np.random.default_rng(seed).permutation(np.flatnonzero(areas > 0))
+    sampled = 0
+    for start in range(0, order.size, RAY_BATCH):
+        if time.perf_counter() - started > time_budget_sec:
+            break
+        batch = order[start : start + RAY_BATCH]
+        origins = centroids[batch] - normals[batch] * epsilon
+        directions = -normals[batch]
+        distance = np.full(batch.size, np.inf)
+        exit_face = np.full(batch.size, -1, dtype=np.int64)
+        pending = np.arange(batch.size)
+        reach = diagonal * _INITIAL_REACH
+        while pending.size:
+            reach = min(reach, diagonal * 1.01)
+            hits, faces_hit = bvh.intersect(
+                origins[pending], directions[pending], min_distance=epsilon, max_distance=reach
+            )
+            distance[pending], exit_face[pending] = hits, faces_hit
+            pending = pending[~np.isfinite(hits)]
+            if reach >= diagonal * 1.01:
+                break
+            reach *= 4.0
+        found = np.isfinite(distance)
+        source, exits = faces[batch[found]], faces[exit_face[found]]
+        adjacent = (source[:, :, None] == exits[:, None, :]).any(axis=(1, 2))
+        facing = np.einsum("ij,ij->i", normals[exit_face[found]], directions[found]) >= _MIN_EXIT_COS
+        found[found] = facing & ~adjacent
+        face_thickness[batch[found]] = distance[found] + epsilon
+        sampled += batch.size
+
+    measured = np.isfinite(face_thickness)
+    vertex_sum = np.zeros(len(vertices))
+    vertex_weight = np.zeros(len(vertices))
+    weights = np.where(measured, areas, 0.0)
+    for corner in range(3):
+        np.add.at(vertex_sum, faces[:, corner], np.nan_to_num(face_thickness) * weights)
+        np.add.at(vertex_weight, faces[:, corner], weights)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        vertex_thickness = np.where(vertex_weight > 0, vertex_sum / vertex_weight, np.nan)
+
+    total_area = float(areas.sum())
+    summary: Dict[str, Any] = {
+        "triangle_count": int(len(faces)),
+        "sampled_faces": int(sampled),
+        "measured_faces": int(measured.sum()),
+        "coverage": round(float(areas[measured].sum()) / total_area, 4) if total_area > 0 else 0.0,
+        "truncated": sampled < order.size,
+        "thin_wall_mm": thin_wall_mm,
+        "min_mm": None,
+        "percentiles_mm": {},
+        "thin_wall_area_fraction": None,
+    }
+    if measured.any():
+        values, value_weights = face_thickness[measured], areas[measured]
+        summary["min_mm"] = round(float(values.min()), 4)
+        summary["percentiles_mm"] = {
+            f"p{percent}": round(value, 4)
+            for percent, value in zip(PERCENTILES, _weighted_percentiles(values, value_weights, PERCENTILES))
+        }
+        summary["thin_wall_area_fraction"] = round(
+            float(value_weights[values < thin_wall_mm].sum() / value_weights.sum()), 4
+        )
+    summary["elapsed_sec"] = round(time.perf_counter() - started, 4)
+    return {"summary": summary, "face_thickness": face_thickness, "vertex_thickness": vertex_thickness}
+
+
+def _heat_colors(thickness: np.ndarray, thin_wall_mm: float) -> np.ndarray:
+    """Red at or below ``thin_wall_mm``, through yellow to green at four times it; grey when unmeasured."""
+    ratio = np.clip((np.nan_to_num(thickness, nan=0.0) - thin_wall_mm) / (3.0 * thin_wall_mm), 0.0, 1.0)
+    colors = np.empty((thickness.size, 4), dtype=np.uint8)
+    colors[:, 0] = np.where(ratio < 0.5, 255, np.round(255 * (1.0 - ratio) * 2.0)).astype(np.uint8)
+    colors[:, 1] = np.where(ratio < 0.5, np.round(255 * ratio * 2.0), 255).astype(np.uint8)
+    colors[:, 2] = 0
+    colors[:, 3] = 255
+    colors[~np.isfinite(thickness)] = (160, 160, 160, 255)
+    return colors
+
+
+def write_thickness_glb(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    vertex_thickness: np.ndarray,
+    out_path: Path,
+    *,
+    thin_wall_mm: float = THIN_WALL_MM,
+) -> Path:
+    """Heat-map GLB: ``COLOR_0`` for display, ``_THICKNESS`` (mm, -1 = not measured) for tooltips."""
+    mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    mesh.visual = trimesh.visual.ColorVisuals(mesh, vertex_colors=_heat_colors(vertex_thickness, thin_wall_mm))
+    mesh.vertex_attributes["_THICKNESS"] = np.where(np.isfinite(vertex_thickness), vertex_thickness, -1.0).astype(
+        np.float32
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(trimesh.Scene(mesh).export(file_type="glb"))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return out_path
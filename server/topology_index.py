@@ -0,0 +1,153 @@
+"""
+Single-pass B-rep topology index shared by the part facts extractors.
+
+Part facts used to walk the same shape once per extractor: faces for hole
+candidates, faces again for wall thickness, solids for the body count, and
+faces/edges inside the CNC corner analysis, adapting every face's surface more
+than once. ``build_topology_index`` walks solids -> faces -> edges a single
+time, adapts each face and edge once, and records what the extractors read.
+
+``occ`` is the symbol table returned by ``CncGeometryAnalyzer._import_occ``,
+so this module imports without pythonocc installed.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+Vector = tuple[float, float, float]
+
+
+@dataclass
+class FaceRecord:
+    face: Any
+    surface_type: str
+    # Plane as (unit normal, d) with n . p + d = 0.
+    plane: tuple[Vector, float] | None = None
+    cylinder_radius: float | None = None
+    # Cylinder axis as (location, direction); v runs along it from location.
+    cylinder_axis: tuple[Vector, Vector] | None = None
+    v_range: tuple[float, float] | None = None
+
+
+@dataclass
+class EdgeRecord:
+    edge: Any
+    curve_type: str
+    circle_radius: float | None = None
+    # One entry per face occurrence, so a seam edge lists its face twice.
+    faces: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class TopologyIndex:
+    solids: list[Any]
+    faces: list[FaceRecord]
+    edges: list[EdgeRecord]
+
+    def faces_of_type(self, surface_type: str) -> list[FaceRecord]:
+        return [record for record in self.faces if record.surface_type == surface_type]
+
+
+def _face_record(occ: dict[str, Any], face, surface_types: dict[Any, str]) -> FaceRecord:
+    try:
+        surface = occ["BRepAdaptor_Surface"](face, True)
+        surface_type = surface_types.get(surface.GetType(), "other")
+    except Exception:
+        return FaceRecord(face=face, surface_type="unknown")
+
+    record = FaceRecord(face=face, surface_type=surface_type)
+    if surface_type == "plane":
+        try:
+            plane = surface.Plane()
+            direction = plane.Axis().Direction()
+            point = plane.Location()
+            normal = (float(direction.X()), float(direction.Y()), float(direction.Z()))
+            length = math.sqrt(normal[0] * normal[0] + normal[1] * normal[1] + normal[2] * normal[2])
+            if length > 1e-9:
+                unit = (normal[0] / length, normal[1] / length, normal[2] / length)
+                d = -(unit[0] * float(point.X()) + unit[1] * float(point.Y()) + unit[2] * float(point.Z()))
+                record.plane = (unit, d)
+        except Exception:
+            pass
+    elif surface_type == "cylinder":
+        try:
+            cylinder = surface.Cylinder()
+            radius = abs(float(cylinder.Radius()))
+            if math.isfinite(radius) and radius > 0:
+                record.cylinder_radius = radius
+        except Exception:
+            cylinder = None
+        try:
+            axis = cylinder.Axis()
+            location, direction = axis.Location(), axis.Direction()
+            record.cylinder_axis = (
+                (float(location.X()), float(location.Y()), float(location.Z())),
+                (float(direction.X()), float(direction.Y()), float(direction.Z())),
+            )
+        except Exception:
+            pass
+        try:
+            record.v_range = (float(surface.FirstVParameter()), float(surface.LastVParameter()))
+        except Exception:
+            pass
+    return record
+
+
+def _edge_record(occ: dict[str, Any], edge, curve_types: dict[Any, str]) -> EdgeRecord:
+    try:
+        curve = occ["BRepAdaptor_Curve"](edge)
+        curve_type = curve_types.get(curve.GetType(), "other")
+    except Exception:
+        return EdgeRecord(edge=edge, curve_type="unknown")
+
+    record = EdgeRecord(edge=edge, curve_type=curve_type)
+    if curve_type == "circle":
+        try:
+            record.circle_radius = abs(float(curve.Circle().Radius()))
+        except Exception:
+            pass
+    return record
+
+
+def build_topology_index(occ: dict[str, Any], shape) -> TopologyIndex:
+    """Index solids, faces (with surface data) and edges (with their faces) in one walk."""
+    surface_types = {occ["GeomAbs_Plane"]: "plane", occ["GeomAbs_Cylinder"]: "cylinder"}
+    curve_types = {occ["GeomAbs_Line"]: "line", occ["GeomAbs_Circle"]: "circle"}
+    explorer_cls = occ["TopExp_Explorer"]
+    topods = occ["topods"]
+
+    solids: list[Any] = []
+    faces: list[FaceRecord] = []
+    edges: list[EdgeRecord] = []
+    edge_map = occ["TopTools_IndexedMapOfShape"]()
+
+    def visit_faces(face_explorer) -> None:
+        while face_explorer.More():
+            face = topods.Face(face_explorer.Current())
+            face_explorer.Next()
+            faces.append(_face_record(occ, face, surface_types))
+            edge_explorer = explorer_cls(face, occ["TopAbs_EDGE"])
+            while edge_explorer.More():
+                edge = topods.Edge(edge_explorer.Current())
+                edge_explorer.Next()
+                position = edge_map.FindIndex(edge)
+                if position == 0:
+                    edge_map.Add(edge)
+                    edges.append(_edge_record(occ, edge, curve_types))
+                    record = edges[-1]
+                else:
+                    record = edges[position - 1]
+                record.faces.append(face)
+
+    solid_explorer = explorer_cls(shape, occ["TopAbs_SOLID"])
+    while solid_explorer.More():
+        solid = topods.Solid(solid_explorer.Current())
+        solid_explorer.Next()
+        solids.append(solid)
+        visit_faces(explorer_cls(solid, occ["TopAbs_FACE"]))
+    # Faces that belong to no solid (open shells, loose faces in a compound).
+    visit_faces(explorer_cls(shape, occ["TopAbs_FACE"], occ["TopAbs_SOLID"]))
+
+    return TopologyIndex(solids=solids, faces=faces, edges=edges)
@@ -0,0 +1,280 @@
+"""
+Compact binary storage for 2D view metadata.
+
+Orthographic, Shape2D and isometric views describe their linework with large
+coordinate arrays (``projected_vertices``, ``edges``, ``segments``). Writing
+those as indented JSON costs tens of MB per view on dense meshes, so view
+generation stores them in a small binary container instead::
+
+    magic     4 bytes   b"RDVM"
+    version   uint16    little-endian
+    flags     uint16    reserved, 0
+    header    uint32    byte length of the JSON header that follows
+    header    JSON      {"fields": {...}, "buffers": [{name, dtype, shape, offset, byteLength}]}
+    buffers   raw       little-endian arrays, each 8-byte aligned
+
+Buffer offsets are absolute file offsets, so clients can wrap them directly in
+typed arrays (``Float32Array`` for vertices/segments, ``Uint32Array`` for
+edges).
+
+The JSON document is still produced on demand for older clients, streamed
+from the binary file and never stored. Coordinates in it carry float32
+precision: each value is rounded to 7 decimals, so it can differ from the
+float64 value originally computed in about the eighth significant digit.
+Legacy JSON files written before the binary format are served unchanged.
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator
+from uuid import uuid4
+
+import numpy as np
+
+MEDIA_TYPE = "application/vnd.rapiddraft.view-metadata"
+BINARY_SUFFIX = ".bin"
+MAGIC = b"RDVM"
+VERSION = 1
+
+_PREAMBLE = struct.Struct("<4sHHI")
+_ALIGN = 8
+_STREAM_CHUNK_BYTES = 1 << 20
+_JSON_DECIMALS = 7
+
+# Array-valued metadata fields and the dtype each one is stored as.
+ARRAY_FIELDS: Dict[str, tuple[np.dtype, int]] = {
+    "projected_vertices": (np.dtype("<f4"), 2),
+    "edges": (np.dtype("<u4"), 2),
+    "segments": (np.dtype("<f4"), 3),
+    "segment_slices": (np.dtype("<u4"), 1),
+}
+
+
+class ViewMetadataError(RuntimeError):
+    pass
+
+
+class ViewMetadataNotFoundError(ViewMetadataError):
+    pass
+
+
+def binary_path_for(json_path: Path) -> Path:
+    """Location of the binary companion for a metadata ``.json`` path."""
+    return json_path.with_suffix(BINARY_SUFFIX)
+
+
+def _padded(length: int) -> int:
+    return (length + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _coerce_array(name: str, value: Any) -> np.ndarray:
+    dtype, ndim = ARRAY_FIELDS[name]
+    array = np.asarray(value)
+    if array.size == 0:
+        return np.zeros((0,) + (2,) * (ndim - 1), dtype=dtype)
+    if name == "edges" and (array.min() < 0 or array.max() > np.iinfo(np.uint32).max):
+        raise ViewMetadataError("Edge indices do not fit the uint32 edge buffer.")
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+def encode_view_metadata(payload: Dict[str, Any]) -> bytes:
+    """Serialize a metadata payload into the binary container."""
+    fields: Dict[str, Any] = {}
+    arrays: Dict[str, np.ndarray] = {}
+    for key, value in payload.items():
+        if key in ARRAY_FIELDS:
+            arrays[key] = _coerce_array(key, value)
+        else:
+            fields[key] = value
+
+    # Offsets depend on the header length and vice versa; lay buffers out
+    # relative to the data block first, then shift once the header is sized.
+    relative = []
+    cursor = 0
+    for name, array in arrays.items():
+        relative.append((name, array, cursor))
+        cursor = _padded(cursor + array.nbytes)
+
+    def _header(data_start: int) -> bytes:
+        buffers = [
+            {
+                "name": name,
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": data_start + offset,
+                "byteLength": int(array.nbytes),
+            }
+            for name, array, offset in relative
+        ]
+        return json.dumps({"fields": fields, "buffers": buffers}, separators=(",", ":")).encode("utf-8")
+
+    data_start = 0
+    header = _header(data_start)
+    while True:
+        needed = _padded(_PREAMBLE.size + len(header))
+        if needed == data_start:
+            break
+        data_start = needed
+        header = _header(data_start)
+    header = header.ljust(data_start - _PREAMBLE.size, b" ")
+
+    parts = [_PREAMBLE.pack(MAGIC, VERSION, 0, len(header)), header]
+    position = data_start
+    for _, array, offset in relative:
+        target = data_start + offset
+        if target > position:
+            parts.append(b"\0" * (target - position))
+        parts.append(array.tobytes())
+        position = target + array.nbytes
+    return b"".join(parts)
+
+
+def write_view_metadata(json_path: Path, payload: Dict[str, Any]) -> Path:
+    """Write the binary metadata that backs ``json_path`` and return its path."""
+    out_path = binary_path_for(json_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = out_path.with_name(f".{out_path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(encode_view_metadata(payload))
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # A stale JSON rendition from a previous generation must not be served.
+    json_path.unlink(missing_ok=True)
+    return out_path
+
+
+def decode_view_metadata(buffer) -> Dict[str, Any]:
+    """Decode a binary container; arrays are zero-copy views into ``buffer``."""
+    view = memoryview(buffer)
+    if len(view) < _PREAMBLE.size:
+        raise ViewMetadataError("View metadata file is truncated.")
+    magic, version, _flags, header_len = _PREAMBLE.unpack_from(view, 0)
+    if magic != MAGIC:
+        raise ViewMetadataError("Not a view metadata file.")
+    if version != VERSION:
+        raise ViewMetadataError(f"Unsupported view metadata version {version}.")
+    header_end = _PREAMBLE.size + header_len
+    header = json.loads(bytes(view[_PREAMBLE.size:header_end]).decode("utf-8"))
+
+    payload: Dict[str, Any] = dict(header.get("fields", {}))
+    for entry in header.get("buffers", []):
+        offset = int(entry["offset"])
+        length = int(entry["byteLength"])
+        if offset + length > len(view):
+            raise ViewMetadataError(f"Buffer '{entry['name']}' extends past the end of the file.")
+        dtype = np.dtype(entry["dtype"])
+        array = np.frombuffer(view, dtype=dtype, count=length // dtype.itemsize, offset=offset)
+        payload[entry["name"]] = array.reshape(entry["shape"])
+    return payload
+
+
+def read_view_metadata(path: Path) -> Dict[str, Any]:
+    """Memory-map a binary metadata file and decode it without copying the buffers."""
+    if not path.exists():
+        raise ViewMetadataNotFoundError(f"View metadata '{path.name}' not found.")
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            raise ViewMetadataError("View metadata file is empty.")
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    return decode_view_metadata(mapped)
+
+
+def to_json_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert decoded metadata back into the legacy JSON document shape."""
+    result: Dict[str, Any] = {}
+    for key, value in payload.items():
+        if isinstance(value, np.ndarray):
+            if np.issubdtype(value.dtype, np.floating):
+                # float32 -> float64 widening would otherwise print noise digits.
+                value = np.round(value.astype(np.float64), _JSON_DECIMALS)
+            result[key] = value.tolist()
+        else:
+            result[key] = value
+    return result
+
+
+def ensure_binary(json_path: Path) -> Path:
+    """Return the binary file for ``json_path``, converting legacy JSON if needed."""
+    bin_path = binary_path_for(json_path)
+    if bin_path.exists():
+        return bin_path
+    if not json_path.exists():
+        raise ViewMetadataNotFoundError(f"View metadata '{json_path.name}' not found.")
+    payload = json.loads(json_path.read_text(encoding="utf-8"))
+    tmp_path = bin_path.with_name(f".{bin_path.name}.{uuid4().hex}.tmp")
+    try:
+        tmp_path.write_bytes(encode_view_metadata(payload))
+        os.replace(tmp_path, bin_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return bin_path
+
+
+def json_source(json_path: Path) -> Path:
+    """Return the file the JSON document for ``json_path`` is served from."""
+    if json_path.exists():
+        return json_path
+    bin_path = binary_path_for(json_path)
+    if not bin_path.exists():
+        raise ViewMetadataNotFoundError(f"View metadata '{json_path.name}' not found.")
+    return bin_path
+
+
+def _iter_json_array(array: np.ndarray, chunk_size: int) -> Iterator[bytes]:
+    if array.size == 0 or array.ndim == 0:
+        yield json.dumps(to_json_payload({"value": array})["value"]).encode("utf-8")
+        return
+    # Roughly a dozen characters per number once printed.
+    row_items = max(1, array.size // array.shape[0])
+    rows = max(1, chunk_size // (12 * row_items))
+    yield b"["
+    for start in range(0, array.shape[0], rows):
+        block = to_json_payload({"value": array[start:start + rows]})["value"]
+        text = json.dumps(block, separators=(",", ":"))[1:-1]
+        yield (text if start == 0 else "," + text).encode("utf-8")
+    yield b"]"
+
+
+def iter_json_chunks(json_path: Path, chunk_size: int = _STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Stream the JSON document for ``json_path`` without writing it to disk.
+
+    A legacy JSON file is streamed as-is; otherwise the document is encoded
+    from the binary file a block of rows at a time.
+    """
+    source = json_source(json_path)
+    if source == json_path:
+        yield from iter_mapped_chunks(json_path, chunk_size)
+        return
+    payload = read_view_metadata(source)
+    yield b"{"
+    for index, (key, value) in enumerate(payload.items()):
+        prefix = "," if index else ""
+        yield f"{prefix}{json.dumps(key)}:".encode("utf-8")
+        if isinstance(value, np.ndarray):
+            yield from _iter_json_array(value, chunk_size)
+        else:
+            yield json.dumps(value, separators=(",", ":")).encode("utf-8")
+    yield b"}"
+
+
+def exists(json_path: Path) -> bool:
+    return json_path.exists() or binary_path_for(json_path).exists()
+
+
+def iter_mapped_chunks(path: Path, chunk_size: int = _STREAM_CHUNK_BYTES) -> Iterator[bytes]:
+    """Stream a file out of a read-only memory map in ``chunk_size`` pieces."""
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, size, chunk_size):
+                yield mapped[start:start + chunk_size]
@@ -0,0 +1,163 @@
+"""
+Deep-zoom tile pyramids for 2D views.
+
+A view's normalized segments (from its binary metadata) cover the unit
+square. Zoom level ``z`` lays that square over ``2**z x 2**z`` tiles of
+``TILE_SIZE_PX`` pixels, ``x`` counting from the left and ``y`` from the top,
+so the drawing page only fetches the tiles it shows, and strokes keep their
+on-screen width at every level instead of blurring like a scaled PNG.
+
+Tiles are rendered on demand and cached under a directory keyed by the
+metadata file's mtime/size, so regenerating a view invalidates its pyramid::
+
+    <cache_root>/<token>/<z>/<x>/<y>.png
+"""
+from __future__ import annotations
+
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from .line_raster import DEFAULT_DPI, render_segments_png
+from .view_metadata import ViewMetadataError, ensure_binary, read_view_metadata
+
+TILE_SIZE_PX = 256
+MAX_ZOOM = 6
+PREWARM_ZOOM = 2
+DEFAULT_COLOR = "#0f223a"
+DEFAULT_LINEWIDTH_PT = 0.7
+
+_SEGMENT_MEMO_LIMIT = 4
+_segment_memo: "OrderedDict[Tuple[str, int, int], Tuple[np.ndarray, Dict[str, Any]]]" = OrderedDict()
+_segment_memo_lock = threading.Lock()
+
+
+class ViewTileError(RuntimeError):
+    pass
+
+
+class ViewTileNotFoundError(ViewTileError):
+    pass
+
+
+def _source_key(bin_path: Path) -> Tuple[str, int, int]:
+    stat = bin_path.stat()
+    return (str(bin_path), stat.st_mtime_ns, stat.st_size)
+
+
+def view_segments(payload: Dict[str, Any]) -> np.ndarray:
+    """Unit-square ``(N, 2, 2)`` segments of a decoded view metadata payload."""
+    if "segments" in payload:
+        return np.asarray(payload["segments"], dtype=np.float64).reshape(-1, 2, 2)
+    if "projected_vertices" in payload and "edges" in payload:
+        vertices = np.asarray(payload["projected_vertices"], dtype=np.float64)
+        edges = np.asarray(payload["edges"], dtype=np.int64)
+        if edges.size == 0:
+            return np.zeros((0, 2, 2), dtype=np.float64)
+        return vertices[edges]
+    raise ViewTileError("View metadata has no drawable segments.")
+
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """``(xmin, ymin, xmax, ymax)`` of a tile in unit-square coordinates (y up)."""
+    scale = 1.0 / (1 << z)
+    return x * scale, 1.0 - (y + 1) * scale, (x + 1) * scale, 1.0 - y * scale
+
+
+def tile_segments(segments: np.ndarray, z: int, x: int, y: int, *, margin_px: float = 2.0) -> np.ndarray:
+    """Segments touching a tile, mapped into that tile's own unit square."""
+    xmin, ymin, xmax, ymax = tile_bounds(z, x, y)
+    span = xmax - xmin
+    margin = margin_px / TILE_SIZE_PX * span
+    seg_min = segments.min(axis=1)
+    seg_max = segments.max(axis=1)
+    keep = (
+        (seg_max[:, 0] >= xmin - margin)
+        & (seg_min[:, 0] <= xmax + margin)
+        & (seg_max[:, 1] >= ymin - margin)
+        & (seg_min[:, 1] <= ymax + margin)
+    )
+    return (segments[keep] - np.array([xmin, ymin])) / span
+
+
+class ViewTilePyramid:
+    def __init__(self, meta_path: Path, cache_root: Path) -> None:
+        self.meta_path = meta_path
+        self.cache_root = cache_root
+        try:
+            self._bin_path = ensure_binary(meta_path)
+        except ViewMetadataError as exc:
+            raise ViewTileNotFoundError(str(exc)) from exc
+        self._key = _source_key(self._bin_path)
+
+    @property
+    def token(self) -> str:
+        return f"{self._key[1]:x}-{self._key[2]:x}"
+
+    def describe(self) -> Dict[str, Any]:
+        return {"tileSize": TILE_SIZE_PX, "minZoom": 0, "maxZoom": MAX_ZOOM, "version": self.token}
+
+    def tile_path(self, z: int, x: int, y: int) -> Path:
+        if not 0 <= z <= MAX_ZOOM or not (0 <= x < (1 << z) and 0 <= y < (1 << z)):
+            raise ViewTileNotFoundError(f"Tile {z}/{x}/{y} is outside the pyramid.")
+        return self.cache_root / self.token / str(z) / str(x) / f"{y}.png"
+
+    def get(self, z: int, x: int, y: int) -> Path:
+        """Cached tile path, rendering the tile first if needed."""
+        path = self.tile_path(z, x, y)
+        if path.exists():
+            return path
+        self._prune_stale()
+        segments, style = self._load()
+        render_segments_png(
+            tile_segments(segments, z, x, y),
+            path,
+            color=style["color"],
+            linewidth_pt=style["linewidth_pt"],
+            size_px=TILE_SIZE_PX,
+            dpi=DEFAULT_DPI,
+            variants=False,
+        )
+        return path
+
+    def prewarm(self, max_zoom: int = PREWARM_ZOOM) -> int:
+        """Render every tile up to ``max_zoom``; returns the number of tiles."""
+        count = 0
+        for z in range(min(max_zoom, MAX_ZOOM) + 1):
+            for x in range(1 << z):
+                for y in range(1 << z):
+                    self.get(z, x, y)
+                    count += 1
+        return count
+
+    def _load(self) -> Tuple[np.ndarray, Dict[str, Any]]:
+        with _segment_memo_lock:
+            cached = _segment_memo.get(self._key)
+            if cached is not None:
+                _segment_memo.move_to_end(self._key)
+                return cached
+        payload = read_view_metadata(self._bin_path)
+        style = payload.get("style") if isinstance(payload.get("style"), dict) else {}
+        loaded = (
+            view_segments(payload),
+            {
+                "color": style.get("color", DEFAULT_COLOR),
+                "linewidth_pt": float(style.get("linewidth_pt", DEFAULT_LINEWIDTH_PT)),
+            },
+        )
+        with _segment_memo_lock:
+            _segment_memo[self._key] = loaded
+            while len(_segment_memo) > _SEGMENT_MEMO_LIMIT:
+                _segment_memo.popitem(last=False)
+        return loaded
+
+    def _prune_stale(self) -> None:
+        if not self.cache_root.exists():
+            return
+        for entry in self.cache_root.iterdir():
+            if entry.is_dir() and entry.name != self.token:
+                shutil.rmtree(entry, ignore_errors=True)
@@ -389,6 +389,10 @@ class VisionAnalysisService:
         step_path: Path,
         component_node_name: str | None = None,
         component_solid_index: int | None = None,
+        quality: str = "exact",
+        upgrade_exact: bool = True,
+        renderer: str = "hlr",
+        mesh_path: Path | None = None,
     ) -> dict[str, Any]:
         try:
             return self.view_set_service.create_view_set(
@@ -396,10 +400,22 @@ class VisionAnalysisService:
                 step_path=step_path,
                 component_node_name=component_node_name,
                 component_solid_index=component_solid_index,
+                quality=quality,
+                upgrade_exact=upgrade_exact,
+                renderer=renderer,
+                mesh_path=mesh_path,
             )
         except VisionViewSetError as exc:
             raise VisionAnalysisError(str(exc)) from exc
 
+    def get_view_set_status(self, *, model_id: str, view_set_id: str) -> dict[str, Any]:
+        try:
+            return self.view_set_service.get_view_set_status(model_id=model_id, view_set_id=view_set_id)
+        except VisionViewSetNotFoundError as exc:
+            raise VisionViewSetMissingError(str(exc)) from exc
+        except VisionViewSetError as exc:
+            raise VisionAnalysisError(str(exc)) from exc
+
     def create_report(
         self,
         *,
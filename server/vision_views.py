@@ -6,6 +6,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from .json_store import read_json
+from .shaded_render import ShadedRenderError, render_shaded_views
+
 if TYPE_CHECKING:
     from .cad_service_occ import CADServiceOCC
 
@@ -20,6 +23,8 @@ class VisionViewSetNotFoundError(VisionViewSetError):
 
 class VisionViewSetService:
     REQUIRED_VIEWS = ("x", "y", "z")
+    QUALITIES = ("exact", "fast")
+    RENDERERS = ("hlr", "shaded")
 
     def __init__(self, *, root: Path, occ_service: "CADServiceOCC") -> None:
         self.root = root
@@ -32,26 +37,53 @@ class VisionViewSetService:
         step_path: Path,
         component_node_name: str | None = None,
         component_solid_index: int | None = None,
+        quality: str = "exact",
+        upgrade_exact: bool = True,
+        renderer: str = "hlr",
+        mesh_path: Path | None = None,
     ) -> dict[str, Any]:
+        """
+        Render the x/y/z views for a vision report. ``renderer="hlr"`` draws
+        OCC hidden-line views from the STEP; ``"shaded"`` rasterizes the preview
+        tessellation at ``mesh_path`` (no OCC, much faster on large parts).
+        """
         if not step_path.exists():
             raise VisionViewSetError("STEP file not found for model.")
+        if quality not in self.QUALITIES:
+            raise VisionViewSetError(f"quality must be one of: {', '.join(self.QUALITIES)}.")
+        if renderer not in self.RENDERERS:
+            raise VisionViewSetError(f"renderer must be one of: {', '.join(self.RENDERERS)}.")
+        if renderer == "shaded" and mesh_path is None:
+            raise VisionViewSetError("Shaded view sets need the model's preview mesh.")
 
         view_set_id = self._next_view_set_id(model_id)
         view_set_dir = self._view_set_dir(model_id, view_set_id)
         views_dir = view_set_dir / "views"
         views_dir.mkdir(parents=True, exist_ok=True)
 
-        try:
-            generated_views = self.occ_service.generate_occ_views(
-                step_path,
-                views_dir,
-                component_node_name=component_node_name,
-                component_solid_index=component_solid_index,
-            )
-        except Exception as exc:
-            raise VisionViewSetError(
-                f"Failed to generate OCC views for vision: {exc.__class__.__name__}: {exc}"
-            ) from exc
+        if renderer == "shaded":
+            try:
+                generated_views, _timings = render_shaded_views(
+                    mesh_path,
+                    views_dir,
+                    component_node_name=component_node_name,
+                )
+            except ShadedRenderError as exc:
+                raise VisionViewSetError(f"Failed to render shaded vision views: {exc}") from exc
+        else:
+            try:
+                generated_views = self.occ_service.generate_occ_views(
+                    step_path,
+                    views_dir,
+                    component_node_name=component_node_name,
+                    component_solid_index=component_solid_index,
+                    quality=quality,
+                    upgrade_exact=upgrade_exact,
+                )
+            except Exception as exc:
+                raise VisionViewSetError(
+                    f"Failed to generate OCC views for vision: {exc.__class__.__name__}: {exc}"
+                ) from exc
 
         missing = [name for name in self.REQUIRED_VIEWS if name not in generated_views]
         if missing:
@@ -67,6 +99,16 @@ class VisionViewSetService:
             if not path.exists():
                 raise VisionViewSetError(f"Generated vision view '{name}' missing on disk.")
 
+        # The OCC service may publish better than requested (a fast request whose
+        # exact segments are cached is served exact, with no upgrade queued), so
+        # report what its status file says rather than what was asked for.
+        published_quality = quality
+        exact_upgrade_pending = False
+        if renderer == "hlr":
+            status = self._views_status(views_dir)
+            published_quality = status.get("quality") or quality
+            exact_upgrade_pending = status.get("exact_status") in ("pending", "running")
+
         generated_at = self._now_iso()
         response_payload = {
             "view_set_id": view_set_id,
@@ -77,6 +119,10 @@ class VisionViewSetService:
                 for name in self.REQUIRED_VIEWS
             },
             "generated_at": generated_at,
+            "renderer": renderer,
+            "quality": published_quality,
+            "exact_upgrade_pending": exact_upgrade_pending,
+            "status_url": f"/api/models/{model_id}/vision/view-sets/{view_set_id}",
         }
 
         metadata_payload = {
@@ -85,6 +131,8 @@ class VisionViewSetService:
             "component_node_name": component_node_name,
             "component_solid_index": component_solid_index,
             "generated_at": generated_at,
+            "renderer": renderer,
+            "quality": published_quality,
             "file_paths": {name: str(path) for name, path in file_paths.items()},
         }
 
@@ -102,6 +150,22 @@ class VisionViewSetService:
 
         return response_payload
 
+    def get_view_set_status(self, *, model_id: str, view_set_id: str) -> dict[str, Any]:
+        """
+        Quality currently on disk for a view set. Fast view sets report the state
+        of their background exact upgrade from the OCC ``views_status.json``.
+        """
+        metadata = self.get_view_set_metadata(model_id=model_id, view_set_id=view_set_id)
+        status = self._views_status(self._view_set_dir(model_id, view_set_id) / "views")
+        return {
+            "view_set_id": view_set_id,
+            "model_id": model_id,
+            "renderer": metadata.get("renderer") or "hlr",
+            "quality": status.get("quality") or metadata.get("quality") or "exact",
+            "exact_status": status.get("exact_status"),
+            "updated_at": status.get("updated_at") or metadata.get("generated_at"),
+        }
+
     def get_view_set_metadata(self, *, model_id: str, view_set_id: str) -> dict[str, Any]:
         metadata_path = self._view_set_dir(model_id, view_set_id) / "view_set.json"
         if not metadata_path.exists():
@@ -139,6 +203,10 @@ class VisionViewSetService:
         paths = self.get_view_set_paths(model_id=model_id, view_set_id=view_set_id)
         return paths[view_name]
 
+    def _views_status(self, views_dir: Path) -> dict[str, Any]:
+        status = read_json(views_dir / "views_status.json")
+        return status if isinstance(status, dict) else {}
+
     def _view_sets_root(self, model_id: str) -> Path:
         return self.root / model_id / "vision_view_sets"
 
@@ -0,0 +1,98 @@
+"""
+Streaming ZIP writer for view exports.
+
+``zipfile`` writes to any object with ``write``/``flush``; when the target
+cannot ``tell``/``seek`` it falls back to data descriptors, so entries never
+need to be rewritten after the fact. ``iter_zip`` feeds it a small drainable
+buffer and yields the bytes as each file is read in fixed-size chunks, so the
+memory held per export is one chunk plus the deflate window regardless of how
+many (or how large) the entries are.
+
+Entries can also be generated on the fly: a source given as an iterable of
+byte chunks (for example JSON encoded from a binary file) is written as it is
+produced, without a temporary file.
+
+Already-compressed payloads (PNG, WebP, GLB, ...) are stored as-is; text
+formats such as JSON and SVG are deflated.
+"""
+from __future__ import annotations
+
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterable, Iterator, Tuple, Union
+
+CHUNK_BYTES = 64 * 1024
+STORED_SUFFIXES = frozenset({".png", ".webp", ".jpg", ".jpeg", ".gif", ".glb", ".zip", ".gz"})
+
+EntrySource = Union[Path, Iterable[bytes]]
+
+
+class _DrainBuffer:
+    """Write-only sink whose contents are handed off and cleared by ``drain``."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def compression_for(path: Path) -> int:
+    return zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def _open_source(arcname: str, source: EntrySource, chunk_size: int):
+    if isinstance(source, Path):
+        info = zipfile.ZipInfo.from_file(source, arcname)
+        handle = source.open("rb")
+
+        def chunks() -> Iterator[bytes]:
+            with handle:
+                yield from iter(lambda: handle.read(chunk_size), b"")
+
+        info.compress_type = compression_for(source)
+        return info, chunks()
+    info = zipfile.ZipInfo(arcname, date_time=time.localtime()[:6])
+    info.external_attr = 0o644 << 16
+    info.compress_type = compression_for(Path(arcname))
+    return info, iter(source)
+
+
+def iter_zip(entries: Iterable[Tuple[str, EntrySource]], *, chunk_size: int = CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of ``(arcname, source)`` entries as it is produced.
+
+    ``source`` is a file path or an iterable of byte chunks. Missing files are
+    skipped so a view deleted mid-export does not abort it.
+    """
+    sink = _DrainBuffer()
+    with zipfile.ZipFile(sink, mode="w") as archive:
+        for arcname, source in entries:
+            try:
+                info, chunks = _open_source(arcname, source, chunk_size)
+            except FileNotFoundError:
+                continue
+            with archive.open(info, mode="w") as target:
+                for chunk in chunks:
+                    target.write(chunk)
+                    data = sink.drain()
+                    if data:
+                        yield data
+            data = sink.drain()
+            if data:
+                yield data
+    # Central directory, written on close.
+    data = sink.drain()
+    if data:
+        yield data